@@ -5,9 +5,9 @@ A container holding a tab bar and editor widget.
 Manages multiple documents via tabs.
 """
 
-from typing import Optional
+from typing import Iterator, Optional
 from PySide6.QtWidgets import QWidget, QVBoxLayout, QHBoxLayout, QPlainTextEdit, QMessageBox, QScrollBar
-from PySide6.QtCore import Signal, Qt, QTimer, QCoreApplication, QElapsedTimer
+from PySide6.QtCore import Signal, Qt, QTimer, QCoreApplication, QElapsedTimer, QSignalBlocker
 from PySide6.QtGui import QTextCursor, QTextDocument
 from PySide6.QtWidgets import QPlainTextDocumentLayout
 
@@ -25,11 +25,13 @@ class EditorPane(QWidget):
     Manages multiple documents, each represented by a tab.
     """
     
-    document_changed = Signal(object)
-    document_modified = Signal(object, bool)
+    document_changed = Signal(Document)
+    document_modified = Signal(Document, bool)
     pane_empty = Signal(object)
     tab_drag_started = Signal(int, object)
     close_tab_requested = Signal(object, int)
+    document_added = Signal(Document, object)  # document, pane
+    document_removed = Signal(Document, object)  # document, pane
     
     def __init__(self, parent=None):
         super().__init__(parent)
@@ -96,6 +98,10 @@ class EditorPane(QWidget):
         """Get all documents in this pane."""
         return self._documents.copy()
     
+    def iter_documents(self) -> Iterator[Document]:
+        """Iterate over this pane's documents in tab order without copying them."""
+        return iter(self._documents)
+    
     @property
     def current_document(self) -> Optional[Document]:
         """Get the currently active document."""
@@ -113,6 +119,7 @@ class EditorPane(QWidget):
         self._save_current_state()
         
         self._documents.append(document)
+        self.document_added.emit(document, self)
         index = self._tab_bar.addTab(document.display_name)
         
         if activate:
@@ -122,6 +129,31 @@ class EditorPane(QWidget):
         
         return index
     
+    def add_documents(self, documents) -> None:
+        """Append several documents as background tabs in one batch.
+        
+        The current state is saved once and the tab bar is filled with its
+        signals blocked and painting suspended, instead of per document.
+        """
+        documents = list(documents)
+        if not documents:
+            return
+        self._save_current_state()
+        
+        self.setUpdatesEnabled(False)
+        try:
+            with QSignalBlocker(self._tab_bar):
+                for document in documents:
+                    self._documents.append(document)
+                    self.document_added.emit(document, self)
+                    self._tab_bar.addTab(document.display_name)
+        finally:
+            self.setUpdatesEnabled(True)
+        
+        # An empty pane had no current tab; show the one the tab bar picked
+        if self._current_index < 0:
+            self._on_tab_changed(self._tab_bar.currentIndex())
+    
     def add_new_document(self) -> Document:
         """Create and add a new empty document."""
         doc = Document()
@@ -134,6 +166,7 @@ class EditorPane(QWidget):
         
         index = max(0, min(index, len(self._documents)))
         self._documents.insert(index, document)
+        self.document_added.emit(document, self)
         self._tab_bar.insertTab(index, document.display_name)
         
         if activate:
@@ -150,6 +183,7 @@ class EditorPane(QWidget):
         
         index = self._documents.index(document)
         self._documents.remove(document)
+        self.document_removed.emit(document, self)
         self._tab_bar.removeTab(index)
         
         if len(self._documents) == 0:
@@ -163,12 +197,41 @@ class EditorPane(QWidget):
         
         return True
     
+    def close_document(self, document: Document) -> bool:
+        """Remove a document that is being closed and release its cached QTextDocument.
+        
+        Unlike remove_document (also used when a tab moves to another pane),
+        the cached document is disconnected and scheduled for deletion.
+        """
+        if not self.remove_document(document):
+            return False
+        self._release_qt_document(document)
+        return True
+    
+    def _release_qt_document(self, document: Document):
+        """Disconnect and delete a closed document's cached QTextDocument."""
+        qt_doc = document.qt_document
+        document.qt_document = None
+        if qt_doc is None:
+            return
+        try:
+            if qt_doc is self._editor.document():
+                return
+            qt_doc.modificationChanged.disconnect(self._on_modification_changed)
+        except (RuntimeError, TypeError):
+            pass
+        try:
+            qt_doc.deleteLater()
+        except RuntimeError:
+            pass
+    
     def remove_document_at(self, index: int) -> Optional[Document]:
         """Remove and return the document at the given index."""
         if not (0 <= index < len(self._documents)):
             return None
         
         document = self._documents.pop(index)
+        self.document_removed.emit(document, self)
         self._tab_bar.removeTab(index)
         
         if len(self._documents) == 0:
@@ -248,14 +311,18 @@ class EditorPane(QWidget):
         
         # Only copy content from editor when text has actually changed,
         # avoiding a full toPlainText() copy (253MB+ for large files) on every tab switch
-        if self._content_dirty:
+        content_dirty = self._content_dirty
+        if content_dirty:
             doc.content = self._editor.toPlainText()
             self._content_dirty = False
         # Only generate HTML for documents with rich text formatting.
         # For plain text, toHtml() can produce output 3-5x larger than the text,
         # causing severe memory bloat for large files.
         if doc.has_rich_formatting or doc.html_content is not None:
-            doc.html_content = self._editor.document().toHtml()
+            # Text and format edits both mark the content dirty; otherwise the
+            # HTML from the last save still matches the editor
+            if content_dirty or doc.html_content is None:
+                doc.html_content = self._editor.document().toHtml()
         else:
             doc.html_content = None
         
@@ -51,22 +51,17 @@ class FileHandler:
             FileResult with success status, content, and any error info.
         """
         try:
-            path = Path(file_path)
-            if not path.exists():
-                return FileResult(
-                    success=False,
-                    error=FileError.NOT_FOUND,
-                    error_message=f"File not found: {file_path}"
-                )
-            
-            file_size = path.stat().st_size
-            if file_size == 0:
-                return FileResult(success=True, content="")
-            
-            content = path.read_text(encoding="utf-8")
+            # A missing file surfaces as FileNotFoundError from the read itself
+            content = Path(file_path).read_text(encoding="utf-8")
             
             return FileResult(success=True, content=content)
             
+        except FileNotFoundError:
+            return FileResult(
+                success=False,
+                error=FileError.NOT_FOUND,
+                error_message=f"File not found: {file_path}"
+            )
         except PermissionError as e:
             return FileResult(
                 success=False,
@@ -17,6 +17,13 @@ from PySide6.QtGui import QAction, QMouseEvent
 from PySide6.QtCore import Signal, Qt, QModelIndex, QDir
 
 
+# Qt's own folder picker lists directories lazily, unlike some native
+# pickers that enumerate the start folder on the GUI thread.
+FOLDER_DIALOG_OPTIONS = (
+    QFileDialog.Option.ShowDirsOnly | QFileDialog.Option.DontUseNativeDialog
+)
+
+
 class SidebarExpandButton(QToolButton):
     """A small button to expand a collapsed sidebar."""
     
@@ -269,7 +276,7 @@ class FileTree(QWidget):
             self,
             "Open Folder",
             os.path.expanduser("~"),
-            QFileDialog.Option.ShowDirsOnly
+            FOLDER_DIALOG_OPTIONS
         )
         
         if folder_path:
@@ -749,7 +749,7 @@ class MultiFileFindDialog(QDialog):
     Dialog for finding and replacing across all open documents.
     """
     
-    goto_match_requested = Signal(object, int)  # document, position
+    goto_match_requested = Signal(Document, int)  # document, position
     
     _POLL_MS = 30
 
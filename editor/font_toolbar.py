@@ -8,10 +8,59 @@ Similar to Microsoft Word's selection popup.
 from PySide6.QtWidgets import (
     QWidget, QHBoxLayout, QFontComboBox, QSpinBox, QFrame
 )
-from PySide6.QtCore import Qt, Signal, QTimer, QPoint, QEvent
+from PySide6.QtCore import Qt, Signal, QTimer, QPoint, QEvent, QSignalBlocker
 from PySide6.QtGui import QFont, QTextCharFormat, QTextCursor
 
 
+# Stylesheet template, filled in by FontMiniToolbar.set_theme_colors
+_TOOLBAR_STYLESHEET = """
+    FontMiniToolbar {{
+        background-color: {bg};
+        border: 1px solid {border};
+        border-radius: 4px;
+    }}
+    QFontComboBox {{
+        background-color: {bg};
+        color: {text};
+        border: 1px solid {border};
+        border-radius: 2px;
+        padding: 2px 20px 2px 4px;
+    }}
+    QFontComboBox::drop-down {{
+        subcontrol-origin: padding;
+        subcontrol-position: center right;
+        width: 16px;
+        border: none;
+        background: transparent;
+    }}
+    QFontComboBox::down-arrow {{
+        width: 0;
+        height: 0;
+        border-left: 4px solid transparent;
+        border-right: 4px solid transparent;
+        border-top: 5px solid {text};
+    }}
+    QFontComboBox:on {{
+        border-bottom-left-radius: 0;
+        border-bottom-right-radius: 0;
+    }}
+    QFontComboBox QAbstractItemView {{
+        background-color: {bg};
+        color: {text};
+        border: 1px solid {border};
+        selection-background-color: {border};
+        selection-color: {text};
+    }}
+    QSpinBox {{
+        background-color: {bg};
+        color: {text};
+        border: 1px solid {border};
+        border-radius: 2px;
+        padding: 2px 4px;
+    }}
+"""
+
+
 class FontMiniToolbar(QFrame):
     """A floating toolbar for quick font editing of selected text."""
     
@@ -23,8 +72,15 @@ class FontMiniToolbar(QFrame):
         self._hide_timer = QTimer(self)
         self._hide_timer.setSingleShot(True)
         self._hide_timer.timeout.connect(self._check_hide)
+        # Family and size edits landing in the same event-loop pass are
+        # collapsed into one mergeCharFormat on the selection.
+        self._apply_timer = QTimer(self)
+        self._apply_timer.setSingleShot(True)
+        self._apply_timer.setInterval(0)
+        self._apply_timer.timeout.connect(self._apply_font_to_selection)
         self._is_applying = False
         self._main_window = None
+        self._last_theme_key: tuple[str, str, str] | None = None
         
         self._setup_ui()
         self.hide()
@@ -45,10 +101,9 @@ class FontMiniToolbar(QFrame):
         layout.setContentsMargins(6, 4, 6, 4)
         layout.setSpacing(4)
         
-        self._font_combo = QFontComboBox()
-        self._font_combo.setMaximumWidth(140)
-        self._font_combo.currentFontChanged.connect(self._on_font_changed)
-        layout.addWidget(self._font_combo)
+        # QFontComboBox enumerates the whole font database on construction,
+        # so it is built lazily the first time the toolbar is needed.
+        self._font_combo: QFontComboBox | None = None
         
         self._size_spin = QSpinBox()
         self._size_spin.setRange(6, 72)
@@ -61,58 +116,33 @@ class FontMiniToolbar(QFrame):
         self._size_spin.installEventFilter(self)
         layout.addWidget(self._size_spin)
         
-        self._font_combo.installEventFilter(self)
-        
         self.setFixedHeight(32)
     
+    def _ensure_font_combo(self) -> QFontComboBox:
+        """Create the font combo box on first use and return it."""
+        if self._font_combo is None:
+            combo = QFontComboBox()
+            combo.setMaximumWidth(140)
+            combo.currentFontChanged.connect(self._on_font_changed)
+            combo.installEventFilter(self)
+            self.layout().insertWidget(0, combo)
+            self._font_combo = combo
+        return self._font_combo
+    
     def set_theme_colors(self, bg_color: str, text_color: str, border_color: str):
-        """Apply theme colors to the toolbar."""
-        self.setStyleSheet(f"""
-            FontMiniToolbar {{
-                background-color: {bg_color};
-                border: 1px solid {border_color};
-                border-radius: 4px;
-            }}
-            QFontComboBox {{
-                background-color: {bg_color};
-                color: {text_color};
-                border: 1px solid {border_color};
-                border-radius: 2px;
-                padding: 2px 20px 2px 4px;
-            }}
-            QFontComboBox::drop-down {{
-                subcontrol-origin: padding;
-                subcontrol-position: center right;
-                width: 16px;
-                border: none;
-                background: transparent;
-            }}
-            QFontComboBox::down-arrow {{
-                width: 0;
-                height: 0;
-                border-left: 4px solid transparent;
-                border-right: 4px solid transparent;
-                border-top: 5px solid {text_color};
-            }}
-            QFontComboBox:on {{
-                border-bottom-left-radius: 0;
-                border-bottom-right-radius: 0;
-            }}
-            QFontComboBox QAbstractItemView {{
-                background-color: {bg_color};
-                color: {text_color};
-                border: 1px solid {border_color};
-                selection-background-color: {border_color};
-                selection-color: {text_color};
-            }}
-            QSpinBox {{
-                background-color: {bg_color};
-                color: {text_color};
-                border: 1px solid {border_color};
-                border-radius: 2px;
-                padding: 2px 4px;
-            }}
-        """)
+        """Apply theme colors to the toolbar (no-op if unchanged)."""
+        key = (bg_color, text_color, border_color)
+        if key == self._last_theme_key:
+            return
+        self._last_theme_key = key
+        self.setStyleSheet(_TOOLBAR_STYLESHEET.format(
+            bg=bg_color, text=text_color, border=border_color
+        ))
+    
+    @property
+    def editor(self):
+        """The editor the toolbar is attached to, or None."""
+        return self._editor
     
     def attach_to_editor(self, editor):
         """Attach the toolbar to an editor widget."""
@@ -159,7 +189,7 @@ class FontMiniToolbar(QFrame):
             font = char_format.font()
             
             if font.family():
-                self._font_combo.setCurrentFont(font)
+                self._ensure_font_combo().setCurrentFont(font)
             
             size = font.pointSize()
             if size > 0:
@@ -174,10 +204,10 @@ class FontMiniToolbar(QFrame):
         
         cursor_rect = self._editor.cursorRect(cursor)
         
+        # The main window is an ancestor of the editor, so map straight
+        # across the widget tree instead of round-tripping through global.
         viewport = self._editor.viewport()
-        global_pos = viewport.mapToGlobal(cursor_rect.bottomLeft())
-        
-        local_pos = self._main_window.mapFromGlobal(global_pos)
+        local_pos = viewport.mapTo(self._main_window, cursor_rect.bottomLeft())
         
         toolbar_x = local_pos.x()
         toolbar_y = local_pos.y() + 5
@@ -185,8 +215,7 @@ class FontMiniToolbar(QFrame):
         main_rect = self._main_window.rect()
         
         if toolbar_y + self.height() > main_rect.bottom():
-            top_global = viewport.mapToGlobal(cursor_rect.topLeft())
-            top_local = self._main_window.mapFromGlobal(top_global)
+            top_local = viewport.mapTo(self._main_window, cursor_rect.topLeft())
             toolbar_y = top_local.y() - self.height() - 5
         
         if toolbar_x + self.width() > main_rect.right():
@@ -202,13 +231,13 @@ class FontMiniToolbar(QFrame):
         """Handle font family change."""
         if self._is_applying:
             return
-        self._apply_font_to_selection()
+        self._apply_timer.start()
     
     def _on_size_changed(self):
         """Handle font size change."""
         if self._is_applying:
             return
-        self._apply_font_to_selection()
+        self._apply_timer.start()
     
     def _apply_font_to_selection(self):
         """Apply the current font settings to the selection."""
@@ -219,19 +248,23 @@ class FontMiniToolbar(QFrame):
         if not cursor.hasSelection():
             return
         
-        self._is_applying = True
-        try:
-            font = self._font_combo.currentFont()
-            font.setPointSize(self._size_spin.value())
-            
-            fmt = QTextCharFormat()
-            fmt.setFont(font)
-            cursor.mergeCharFormat(fmt)
+        font = self._ensure_font_combo().currentFont()
+        font.setPointSize(self._size_spin.value())
+        
+        fmt = QTextCharFormat()
+        fmt.setFont(font)
+        cursor.mergeCharFormat(fmt)
+        # Re-setting our own selection must not bounce back through
+        # selectionChanged; textChanged above still reaches the pane.
+        with QSignalBlocker(self._editor):
             self._editor.setTextCursor(cursor)
-            
-            self.font_changed.emit(font)
-        finally:
-            self._is_applying = False
+        
+        self.font_changed.emit(font)
+    
+    def showEvent(self, event):
+        """Build the deferred font combo box before the first show."""
+        self._ensure_font_combo()
+        super().showEvent(event)
     
     def hideEvent(self, event):
         """Handle hide event."""
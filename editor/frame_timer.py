@@ -9,10 +9,8 @@ that shows up as a 50ms frame.
 Activated via Ctrl+P.  Resets and stops timing when hidden.
 """
 
-import time
-
 from PySide6.QtWidgets import QWidget, QLabel, QHBoxLayout
-from PySide6.QtCore import QTimer, Qt, QEvent
+from PySide6.QtCore import QTimer, Qt, QEvent, QElapsedTimer
 
 
 class FrameTimer(QWidget):
@@ -25,7 +23,7 @@ class FrameTimer(QWidget):
     """
 
     _IDLE_TIMEOUT_MS = 2000   # no input for this long → stop recording
-    _MIN_FRAME_MS = 1.0       # ignore sub-1ms idle ticks
+    _MIN_FRAME_NS = 1_000_000  # ignore sub-1ms idle ticks
 
     def __init__(self, parent=None):
         super().__init__(parent)
@@ -35,7 +33,9 @@ class FrameTimer(QWidget):
         self._last_frame_ms: float = 0.0
         self._max_frame_ms: float = 0.0
 
-        self._last_tick: float = 0.0
+        # Monotonic clock; tick stamps are integer nanoseconds since start
+        self._clock = QElapsedTimer()
+        self._last_tick_ns: int | None = None
         self._has_recent_input: bool = False
 
         self._setup_ui()
@@ -92,7 +92,8 @@ class FrameTimer(QWidget):
         if self._timing:
             return
         self._timing = True
-        self._last_tick = time.perf_counter()
+        self._clock.start()
+        self._last_tick_ns = 0
         self._has_recent_input = False
         from PySide6.QtWidgets import QApplication
         app = QApplication.instance()
@@ -117,7 +118,7 @@ class FrameTimer(QWidget):
         self._frame_times.clear()
         self._last_frame_ms = 0.0
         self._max_frame_ms = 0.0
-        self._last_tick = 0.0
+        self._last_tick_ns = None
         self._has_recent_input = False
         self._label.setText("Frame: --  Avg: --  Max: --  N: 0")
 
@@ -128,16 +129,18 @@ class FrameTimer(QWidget):
 
     # ── Event filter (only for input detection) ──────────────────────
 
-    _INPUT_EVENTS = frozenset({
+    _INPUT_EVENTS = (
         QEvent.Type.KeyPress,
         QEvent.Type.MouseButtonPress,
         QEvent.Type.MouseButtonRelease,
         QEvent.Type.Wheel,
         QEvent.Type.InputMethod,
-    })
+    )
+    # Bit N set ⇔ event type N counts as input; tested with a shift + AND
+    _INPUT_MASK = sum(1 << int(etype) for etype in _INPUT_EVENTS)
 
     def eventFilter(self, obj, event):  # noqa: N802
-        if event.type() in self._INPUT_EVENTS:
+        if (self._INPUT_MASK >> int(event.type())) & 1:
             self._has_recent_input = True
             self._idle_timer.start()
         return False
@@ -145,12 +148,12 @@ class FrameTimer(QWidget):
     # ── Tick — fires once per event-loop iteration ───────────────────
 
     def _on_tick(self):
-        now = time.perf_counter()
-        if self._last_tick > 0 and self._has_recent_input:
-            elapsed_ms = (now - self._last_tick) * 1000.0
-            if elapsed_ms >= self._MIN_FRAME_MS:
-                self._record_frame(elapsed_ms)
-        self._last_tick = now
+        now_ns = self._clock.nsecsElapsed()
+        if self._last_tick_ns is not None and self._has_recent_input:
+            elapsed_ns = now_ns - self._last_tick_ns
+            if elapsed_ns >= self._MIN_FRAME_NS:
+                self._record_frame(elapsed_ns * 1e-6)
+        self._last_tick_ns = now_ns
 
     # ── Recording & display ──────────────────────────────────────────
 
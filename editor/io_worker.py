@@ -0,0 +1,61 @@
+"""
+I/O Worker Module
+
+Runs blocking file operations on a QThreadPool worker thread so the GUI
+thread keeps painting while slow media is read.
+"""
+
+import os
+
+from PySide6.QtCore import QObject, QRunnable, Signal
+
+
+def prewarm_directory(path: str) -> int:
+    """Stat every entry in a directory so a later file dialog hits a warm cache."""
+    count = 0
+    try:
+        with os.scandir(path) as entries:
+            for entry in entries:
+                try:
+                    entry.stat(follow_symlinks=False)
+                except OSError:
+                    continue
+                count += 1
+    except OSError:
+        return 0
+    return count
+
+
+class IOSignals(QObject):
+    """Signals emitted by an IOWorker (delivered on the receiver's thread)."""
+
+    finished = Signal(object)
+
+
+class IOWorker(QRunnable):
+    """
+    Runnable that calls a function off the GUI thread.
+
+    The function's return value is emitted through ``signals.finished``;
+    connected slots on GUI objects run back on the GUI thread via a
+    queued connection. If the function raises, ``on_error(exc)`` (or None
+    without one) is emitted instead, so every worker reports back.
+    """
+
+    def __init__(self, fn, *args, on_error=None):
+        super().__init__()
+        self._fn = fn
+        self._args = args
+        self._on_error = on_error
+        self.signals = IOSignals()
+        # The owner keeps a reference until finished is handled, so the
+        # signals object outlives run() returning on the worker thread.
+        self.setAutoDelete(False)
+
+    def run(self):
+        """Execute the wrapped function and emit its result."""
+        try:
+            result = self._fn(*self._args)
+        except Exception as e:
+            result = self._on_error(e) if self._on_error is not None else None
+        self.signals.finished.emit(result)
@@ -5,8 +5,8 @@ A QPlainTextEdit with a line number gutter, similar to VS Code.
 """
 
 from PySide6.QtWidgets import QPlainTextEdit, QWidget, QTextEdit, QScrollBar, QStyleOptionSlider, QStyle
-from PySide6.QtCore import Qt, QRect, QSize
-from PySide6.QtGui import QPainter, QColor, QTextFormat, QTextCursor, QMouseEvent
+from PySide6.QtCore import Qt, QRect, QSize, QEvent
+from PySide6.QtGui import QPainter, QColor, QTextFormat, QTextCursor, QMouseEvent, QFontMetrics
 
 
 class LineNumberArea(QWidget):
@@ -26,22 +26,50 @@ class LineNumberArea(QWidget):
 class JumpScrollBar(QScrollBar):
     """Scrollbar that jumps to the clicked position instead of paging."""
 
-    def mousePressEvent(self, event: QMouseEvent):
-        if event.button() == Qt.MouseButton.LeftButton:
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        # Groove geometry cached between clicks; cleared on resize/style change
+        self._groove_rect: QRect | None = None
+        self._groove_start: int = 0
+        self._groove_total: int = 0
+        self._is_vertical: bool = True
+
+    def _invalidate_groove(self):
+        self._groove_rect = None
+
+    def _groove(self) -> QRect:
+        """Return the cached groove rect, querying the style on first use."""
+        if self._groove_rect is None:
             opt = QStyleOptionSlider()
             self.initStyleOption(opt)
             groove = self.style().subControlRect(
                 QStyle.ComplexControl.CC_ScrollBar, opt,
                 QStyle.SubControl.SC_ScrollBarGroove, self,
             )
-            if groove.isValid():
-                if self.orientation() == Qt.Orientation.Vertical:
-                    pos = event.position().y()
-                    total = groove.height()
-                else:
-                    pos = event.position().x()
-                    total = groove.width()
-                ratio = (pos - groove.top()) / total if self.orientation() == Qt.Orientation.Vertical else (pos - groove.left()) / total
+            self._is_vertical = self.orientation() == Qt.Orientation.Vertical
+            if self._is_vertical:
+                self._groove_start = groove.top()
+                self._groove_total = groove.height()
+            else:
+                self._groove_start = groove.left()
+                self._groove_total = groove.width()
+            self._groove_rect = groove
+        return self._groove_rect
+
+    def resizeEvent(self, event):
+        self._invalidate_groove()
+        super().resizeEvent(event)
+
+    def changeEvent(self, event):
+        if event.type() == QEvent.Type.StyleChange:
+            self._invalidate_groove()
+        super().changeEvent(event)
+
+    def mousePressEvent(self, event: QMouseEvent):
+        if event.button() == Qt.MouseButton.LeftButton:
+            if self._groove().isValid():
+                pos = event.position().y() if self._is_vertical else event.position().x()
+                ratio = (pos - self._groove_start) / self._groove_total
                 value = int(self.minimum() + ratio * (self.maximum() - self.minimum()))
                 self.setValue(value)
                 event.accept()
@@ -75,6 +103,7 @@ class LineNumberedEditor(QPlainTextEdit):
         self._search_selections: list = []
         self._last_current_block: int = -1
         self._cached_gutter_width: int = 40
+        self._cached_fm: QFontMetrics | None = None
         
         self.blockCountChanged.connect(self._update_line_number_area_width)
         self.updateRequest.connect(self._update_line_number_area)
@@ -105,6 +134,19 @@ class LineNumberedEditor(QPlainTextEdit):
         self._update_line_number_area_width(0)
         self._line_number_area.update()
     
+    def _fm(self) -> QFontMetrics:
+        """Return cached font metrics (invalidated on font change)."""
+        if self._cached_fm is None:
+            self._cached_fm = self.fontMetrics()
+        return self._cached_fm
+
+    def changeEvent(self, event):
+        """Drop cached font metrics and gutter width when the font changes."""
+        super().changeEvent(event)
+        if event.type() == QEvent.Type.FontChange:
+            self._cached_fm = None
+            self._update_line_number_area_width(0)
+
     def line_number_area_width(self) -> int:
         """Return cached gutter width (recomputed on block-count or context change)."""
         return self._cached_gutter_width
@@ -116,7 +158,7 @@ class LineNumberedEditor(QPlainTextEdit):
         while max_num >= 10:
             max_num //= 10
             digits += 1
-        self._cached_gutter_width = 3 + self.fontMetrics().horizontalAdvance('9') * max(digits, 3) + 12
+        self._cached_gutter_width = 3 + self._fm().horizontalAdvance('9') * max(digits, 3) + 12
 
     def _update_line_number_area_width(self, _):
         """Update the viewport margins to accommodate line numbers."""
@@ -183,32 +225,45 @@ class LineNumberedEditor(QPlainTextEdit):
         
         block = self.firstVisibleBlock()
         block_number = block.blockNumber()
-        top = int(self.blockBoundingGeometry(block).translated(self.contentOffset()).top())
-        bottom = top + int(self.blockBoundingRect(block).height())
+        # One geometry query gives both the first block's top and height
+        first_rect = self.blockBoundingGeometry(block).translated(self.contentOffset())
+        top = int(first_rect.top())
+        bottom = top + int(first_rect.height())
         
         current_block = self.textCursor().blockNumber()
         base = self._line_number_base
+        line_height = self._fm().height()
+        text_width = self._line_number_area.width() - 8
+        paint_rect = event.rect()
+        paint_top = paint_rect.top()
+        paint_bottom = paint_rect.bottom()
         
-        while block.isValid() and top <= event.rect().bottom():
-            if block.isVisible() and bottom >= event.rect().top():
+        # One pen for every ordinary line; only the current line swaps it
+        painter.setPen(self._text_color)
+        
+        while block.isValid() and top <= paint_bottom:
+            if block.isVisible() and bottom >= paint_top:
                 number = str(base + block_number + 1)
+                is_current = block_number == current_block
                 
-                if block_number == current_block:
+                if is_current:
                     painter.setPen(self._current_line_color)
-                else:
-                    painter.setPen(self._text_color)
                 
                 painter.drawText(
                     0, top,
-                    self._line_number_area.width() - 8, 
-                    self.fontMetrics().height(),
+                    text_width,
+                    line_height,
                     Qt.AlignmentFlag.AlignRight, 
                     number
                 )
+                
+                if is_current:
+                    painter.setPen(self._text_color)
             
             block = block.next()
             top = bottom
-            bottom = top + int(self.blockBoundingRect(block).height())
+            if block.isValid():
+                bottom = top + int(self.blockBoundingRect(block).height())
             block_number += 1
     
     def wheelEvent(self, event):
@@ -4,28 +4,138 @@ Main Window Module
 Implements the main application window with menus, status bar, and split container.
 """
 
+import os
+from collections import OrderedDict
+from functools import lru_cache, partial
+from pathlib import Path
 from typing import Optional
 from PySide6.QtWidgets import (
-    QMainWindow, QMenuBar, QStatusBar, QMessageBox,
-    QFileDialog, QLabel, QSplitter
+    QApplication, QMainWindow, QMenu, QMenuBar, QStatusBar, QMessageBox,
+    QFileDialog, QLabel, QSplitter, QWidget
 )
 from PySide6.QtGui import QAction, QKeySequence, QFont, QTextCharFormat, QTextCursor
-from PySide6.QtCore import Qt
+from PySide6.QtCore import Qt, QThreadPool, QTimer, Slot
 
 from editor.document import Document
 from editor.split_container import SplitContainer
-from editor.file_handler import FileHandler
-from editor.theme_manager import ThemeManager, Theme
-from editor.file_tree import FileTree, CollapsibleSidebar
-from editor.settings_dialog import SettingsDialog, FontManagerDialog
+from editor.file_handler import FileHandler, FileResult, SaveResult, FileError
+from editor.theme_manager import ThemeManager
+from editor.file_tree import FileTree, CollapsibleSidebar, FOLDER_DIALOG_OPTIONS
+from editor.line_number_editor import LineNumberedEditor
 from editor.font_toolbar import FontMiniToolbar
-from editor.find_replace import FindReplaceDialog, MultiFileFindDialog
 from editor.frame_timer import FrameTimer
+from editor.io_worker import IOWorker, prewarm_directory
+
+
+# Menu tables: (label, shortcut, slot); None is a separator. A tuple slot
+# is (MainWindow method name, *args), e.g. forwarding to an editor method.
+# A shortcut of None leaves the action without one.
+_FILE_ACTIONS = (
+    ("&New", QKeySequence.StandardKey.New, "_on_new"),
+    ("&Open...", QKeySequence.StandardKey.Open, "_on_open"),
+    ("Open &Folder...", "Ctrl+Shift+O", "_on_open_folder"),
+    None,
+    ("&Save", QKeySequence.StandardKey.Save, "_on_save"),
+    ("Save &As...", QKeySequence.StandardKey.SaveAs, "_on_save_as"),
+    None,
+    ("&Close Tab", "Ctrl+W", "_on_close_tab"),
+    None,
+    ("E&xit", QKeySequence.StandardKey.Quit, "close"),
+)
+
+_EDIT_ACTIONS = (
+    ("&Undo", QKeySequence.StandardKey.Undo, ("_forward", "undo")),
+    ("&Redo", "Ctrl+Y", ("_forward", "redo")),
+    None,
+    ("Cu&t", QKeySequence.StandardKey.Cut, ("_forward", "cut")),
+    ("&Copy", QKeySequence.StandardKey.Copy, ("_forward", "copy")),
+    ("&Paste", QKeySequence.StandardKey.Paste, ("_forward", "paste")),
+    None,
+    ("Select &All", QKeySequence.StandardKey.SelectAll, ("_forward", "selectAll")),
+    None,
+    ("&Find...", "Ctrl+F", "_on_find"),
+    ("&Replace...", "Ctrl+H", "_on_replace"),
+    None,
+    ("Find in &Open Files...", "Ctrl+Shift+G", "_on_find_in_files"),
+    ("Replace in Open Fi&les...", "Ctrl+Shift+H", "_on_replace_in_files"),
+)
+
+# Checkable state and enablement are applied in _setup_view_menu
+_VIEW_ACTIONS = (
+    ("&Sidebar", "Ctrl+B", "_on_toggle_sidebar"),
+    ("&Word Wrap", None, "_on_toggle_word_wrap"),
+    ("&Status Bar", None, "_on_toggle_status_bar"),
+    None,
+    ("Swap Split &Panes", "Ctrl+Shift+S", "_on_swap_panes"),
+    None,
+    ("Frame &Timer", "Ctrl+P", "_on_toggle_frame_timer"),
+)
+
+# File dialog filters, shared by Open, Save As and the save prompts
+_TXT_FILTER = "Text Files (*.txt)"
+_FILE_FILTER = f"{_TXT_FILTER};;All Files (*)"
+_TXT_EXT = ".txt"
+
+# Recently read files, keyed by (path, mtime_ns, size) so edits on disk miss
+_READ_CACHE_SIZE = 8
+_READ_CACHE_MAX_CHARS = 1 << 20
+
+# Hot File shortcuts dispatched from MainWindow.keyPressEvent via a dict
+# lookup instead of registering QAction shortcuts; the menu shows the hint.
+_KEY_DISPATCH_SLOTS = frozenset({"_on_open", "_on_save"})
+
+_SETTINGS_ACTIONS = (
+    ("&Theme Manager...", "Ctrl+,", "_on_open_settings"),
+    ("&Font Manager...", "Ctrl+Shift+F", "_on_open_font_manager"),
+)
+
+
+@lru_cache(maxsize=256)
+def _format_pos(line: int, column: int) -> str:
+    """Format a cursor position for the status bar."""
+    return f"Ln {line}, Col {column}"
+
+
+def _read_failure(error: Exception) -> FileResult:
+    """Result reported for a background read that raised."""
+    return FileResult(success=False, error=FileError.READ_ERROR,
+                      error_message=f"Error reading file: {error}")
+
+
+def _write_failure(error: Exception) -> SaveResult:
+    """Result reported for a background write that raised."""
+    return SaveResult(success=False, error=FileError.WRITE_ERROR,
+                      error_message=f"Error writing file: {error}")
+
+
+_HTML_PREFIXES = ("<!doctype", "<html")
+
+
+def _looks_like_html(content: str) -> bool:
+    """Sniff HTML from the first non-blank characters without copying the text."""
+    return content[:1024].lstrip()[:9].lower().startswith(_HTML_PREFIXES)
+
+
+def _merge_char_format(editor, cursor: QTextCursor, fmt: QTextCharFormat):
+    """Merge a format as one edit block with editor repaints held until done."""
+    updates_enabled = editor.updatesEnabled()
+    editor.setUpdatesEnabled(False)
+    cursor.beginEditBlock()
+    try:
+        cursor.mergeCharFormat(fmt)
+    finally:
+        cursor.endEditBlock()
+        editor.setUpdatesEnabled(updates_enabled)
 
 
 class MainWindow(QMainWindow):
     """Main application window with tabbed editor and split support."""
     
+    _MODIFIED_TEXT = "Modified"
+    _UNTITLED_TEXT = "Untitled"
+    _SPLIT_TEXT = "Split View"
+    _EMPTY_TEXT = ""
+    
     def __init__(self, parent=None):
         super().__init__(parent)
         
@@ -35,6 +145,23 @@ class MainWindow(QMainWindow):
         
         self._find_replace_dialog = None
         self._multi_file_find_dialog = None
+        # In-flight read workers, held until their finished signal is handled
+        self._io_workers: set[IOWorker] = set()
+        self._read_cache: OrderedDict[tuple, FileResult] = OrderedDict()
+        self._save_prompt: Optional[QMessageBox] = None
+        self._connected_editor = None
+        # Last title passed to setWindowTitle, so unchanged titles are skipped
+        self._last_title = ""
+        # Focused editor, tracked from QApplication.focusChanged
+        self._focused_editor: Optional[LineNumberedEditor] = None
+        self._active_editor_pane = None
+        self._active_editor_cache = None
+        self._close_confirmed = False
+        self._close_pending = False
+        # Colors of the last applied theme and line-number palette, so
+        # re-applying an unchanged theme skips the restyling work
+        self._applied_theme_colors: Optional[dict] = None
+        self._line_number_colors: Optional[tuple] = None
         
         self._setup_ui()
         self._setup_font_toolbar()
@@ -44,8 +171,7 @@ class MainWindow(QMainWindow):
         self._setup_menus()
         self._setup_status_bar()
         self._connect_signals()
-        self._update_window_title()
-        self._update_status_bar()
+        self._refresh_chrome()
     
     def _setup_ui(self):
         """Initialize the main UI components."""
@@ -68,15 +194,28 @@ class MainWindow(QMainWindow):
         self._main_splitter.setSizes([200, 600])
         
         self.setCentralWidget(self._main_splitter)
+        self._prewarm_file_dialogs()
         
         self._frame_timer = FrameTimer(self)
         
         self._file_tree.file_open_requested.connect(self._on_file_tree_open)
         self._file_tree.file_open_new_tab_requested.connect(self._on_file_tree_open_new_tab)
     
+    def _prewarm_file_dialogs(self):
+        """Scan the directories file dialogs open in so the first dialog is fast."""
+        for path in {os.getcwd(), os.path.expanduser("~")}:
+            worker = IOWorker(prewarm_directory, path)
+            worker.signals.finished.connect(
+                lambda _count, w=worker: self._io_workers.discard(w)
+            )
+            self._io_workers.add(worker)
+            QThreadPool.globalInstance().start(worker)
+    
     def _setup_menus(self):
         """Create the menu bar and all menus."""
         menubar = self.menuBar()
+        # Combined key code -> slot name, filled by _add_menu_actions
+        self._key_dispatch: dict[int, str] = {}
         
         self._setup_file_menu(menubar)
         self._setup_edit_menu(menubar)
@@ -86,232 +225,191 @@ class MainWindow(QMainWindow):
     
     def _setup_file_menu(self, menubar: QMenuBar):
         """Create the File menu."""
-        file_menu = menubar.addMenu("&File")
-        
-        new_action = QAction("&New", self)
-        new_action.setShortcut(QKeySequence.StandardKey.New)
-        new_action.triggered.connect(self._on_new)
-        file_menu.addAction(new_action)
-        
-        open_action = QAction("&Open...", self)
-        open_action.setShortcut(QKeySequence.StandardKey.Open)
-        open_action.triggered.connect(self._on_open)
-        file_menu.addAction(open_action)
-        
-        open_folder_action = QAction("Open &Folder...", self)
-        open_folder_action.setShortcut(QKeySequence("Ctrl+Shift+O"))
-        open_folder_action.triggered.connect(self._on_open_folder)
-        file_menu.addAction(open_folder_action)
-        
-        file_menu.addSeparator()
-        
-        save_action = QAction("&Save", self)
-        save_action.setShortcut(QKeySequence.StandardKey.Save)
-        save_action.triggered.connect(self._on_save)
-        file_menu.addAction(save_action)
-        
-        save_as_action = QAction("Save &As...", self)
-        save_as_action.setShortcut(QKeySequence.StandardKey.SaveAs)
-        save_as_action.triggered.connect(self._on_save_as)
-        file_menu.addAction(save_as_action)
-        
-        file_menu.addSeparator()
-        
-        close_tab_action = QAction("&Close Tab", self)
-        close_tab_action.setShortcut(QKeySequence("Ctrl+W"))
-        close_tab_action.triggered.connect(self._on_close_tab)
-        file_menu.addAction(close_tab_action)
-        
-        file_menu.addSeparator()
-        
-        exit_action = QAction("E&xit", self)
-        exit_action.setShortcut(QKeySequence.StandardKey.Quit)
-        exit_action.triggered.connect(self.close)
-        file_menu.addAction(exit_action)
+        self._add_menu_actions(self._add_menu(menubar, "&File"), _FILE_ACTIONS)
     
     def _setup_edit_menu(self, menubar: QMenuBar):
         """Create the Edit menu."""
-        edit_menu = menubar.addMenu("&Edit")
-        
-        undo_action = QAction("&Undo", self)
-        undo_action.setShortcut(QKeySequence.StandardKey.Undo)
-        undo_action.triggered.connect(self._on_undo)
-        edit_menu.addAction(undo_action)
-        
-        redo_action = QAction("&Redo", self)
-        redo_action.setShortcut(QKeySequence("Ctrl+Y"))
-        redo_action.triggered.connect(self._on_redo)
-        edit_menu.addAction(redo_action)
-        
-        edit_menu.addSeparator()
-        
-        cut_action = QAction("Cu&t", self)
-        cut_action.setShortcut(QKeySequence.StandardKey.Cut)
-        cut_action.triggered.connect(self._on_cut)
-        edit_menu.addAction(cut_action)
-        
-        copy_action = QAction("&Copy", self)
-        copy_action.setShortcut(QKeySequence.StandardKey.Copy)
-        copy_action.triggered.connect(self._on_copy)
-        edit_menu.addAction(copy_action)
-        
-        paste_action = QAction("&Paste", self)
-        paste_action.setShortcut(QKeySequence.StandardKey.Paste)
-        paste_action.triggered.connect(self._on_paste)
-        edit_menu.addAction(paste_action)
-        
-        edit_menu.addSeparator()
-        
-        select_all_action = QAction("Select &All", self)
-        select_all_action.setShortcut(QKeySequence.StandardKey.SelectAll)
-        select_all_action.triggered.connect(self._on_select_all)
-        edit_menu.addAction(select_all_action)
-        
-        edit_menu.addSeparator()
-        
-        find_action = QAction("&Find...", self)
-        find_action.setShortcut(QKeySequence("Ctrl+F"))
-        find_action.triggered.connect(self._on_find)
-        edit_menu.addAction(find_action)
-        
-        replace_action = QAction("&Replace...", self)
-        replace_action.setShortcut(QKeySequence("Ctrl+H"))
-        replace_action.triggered.connect(self._on_replace)
-        edit_menu.addAction(replace_action)
-        
-        edit_menu.addSeparator()
-        
-        find_in_files_action = QAction("Find in &Open Files...", self)
-        find_in_files_action.setShortcut(QKeySequence("Ctrl+Shift+G"))
-        find_in_files_action.triggered.connect(self._on_find_in_files)
-        edit_menu.addAction(find_in_files_action)
+        self._add_menu_actions(self._add_menu(menubar, "&Edit"), _EDIT_ACTIONS)
+    
+    def _add_menu(self, parent, title: str) -> QMenu:
+        """Add a submenu to a menu bar or menu with action tooltips disabled."""
+        menu = parent.addMenu(title)
+        # No action sets a tooltip or status tip; keep hover from querying them
+        menu.setToolTipsVisible(False)
+        return menu
+    
+    def _add_menu_actions(self, menu, actions) -> list[QAction]:
+        """
+        Populate a menu from (label, shortcut, slot) rows; None adds a separator.
         
-        replace_in_files_action = QAction("Replace in Open Fi&les...", self)
-        replace_in_files_action.setShortcut(QKeySequence("Ctrl+Shift+H"))
-        replace_in_files_action.triggered.connect(self._on_replace_in_files)
-        edit_menu.addAction(replace_in_files_action)
+        slot is a MainWindow method name, or a (method name, *args) tuple
+        that is bound with functools.partial. Returns the created actions
+        in table order, without separators.
+        """
+        created = []
+        # Actions between separators are added to the menu in one call
+        pending = []
+        for row in actions:
+            if row is None:
+                menu.addActions(pending)
+                pending = []
+                menu.addSeparator()
+                continue
+            label, shortcut, slot = row
+            if shortcut is None:
+                action = QAction(label, self)
+            elif slot in _KEY_DISPATCH_SLOTS:
+                sequence = QKeySequence(shortcut)
+                self._key_dispatch[sequence[0].toCombined()] = slot
+                action = QAction(
+                    f"{label}\t{sequence.toString(QKeySequence.SequenceFormat.NativeText)}",
+                    self
+                )
+            else:
+                action = QAction(label, self)
+                action.setShortcut(QKeySequence(shortcut))
+            if isinstance(slot, tuple):
+                slot_name, *args = slot
+                action.triggered.connect(partial(getattr(self, slot_name), *args))
+            else:
+                action.triggered.connect(getattr(self, slot))
+            pending.append(action)
+            created.append(action)
+        menu.addActions(pending)
+        return created
     
     def _setup_view_menu(self, menubar: QMenuBar):
         """Create the View menu."""
-        view_menu = menubar.addMenu("&View")
+        (self._sidebar_action, self._word_wrap_action, self._status_bar_action,
+         self._swap_panes_action, self._frame_timer_action) = self._add_menu_actions(
+            self._add_menu(menubar, "&View"), _VIEW_ACTIONS
+        )
         
-        self._sidebar_action = QAction("&Sidebar", self)
         self._sidebar_action.setCheckable(True)
-        self._sidebar_action.setChecked(False)
-        self._sidebar_action.setShortcut(QKeySequence("Ctrl+B"))
-        self._sidebar_action.triggered.connect(self._on_toggle_sidebar)
-        view_menu.addAction(self._sidebar_action)
-        
-        self._word_wrap_action = QAction("&Word Wrap", self)
         self._word_wrap_action.setCheckable(True)
         self._word_wrap_action.setChecked(self._word_wrap_enabled)
-        self._word_wrap_action.triggered.connect(self._on_toggle_word_wrap)
-        view_menu.addAction(self._word_wrap_action)
-        
-        self._status_bar_action = QAction("&Status Bar", self)
         self._status_bar_action.setCheckable(True)
         self._status_bar_action.setChecked(True)
-        self._status_bar_action.triggered.connect(self._on_toggle_status_bar)
-        view_menu.addAction(self._status_bar_action)
-        
-        view_menu.addSeparator()
-        
-        self._swap_panes_action = QAction("Swap Split &Panes", self)
-        self._swap_panes_action.setShortcut(QKeySequence("Ctrl+Shift+S"))
-        self._swap_panes_action.triggered.connect(self._on_swap_panes)
         self._swap_panes_action.setEnabled(False)
-        view_menu.addAction(self._swap_panes_action)
-        
-        view_menu.addSeparator()
-        
-        self._frame_timer_action = QAction("Frame &Timer", self)
-        self._frame_timer_action.setShortcut(QKeySequence("Ctrl+P"))
-        self._frame_timer_action.triggered.connect(self._on_toggle_frame_timer)
-        view_menu.addAction(self._frame_timer_action)
     
     def _setup_settings_menu(self, menubar: QMenuBar):
         """Create the Settings menu."""
-        settings_menu = menubar.addMenu("&Settings")
+        settings_menu = self._add_menu(menubar, "&Settings")
         
-        self._themes_menu = settings_menu.addMenu("&Quick Themes")
+        self._themes_menu = self._add_menu(settings_menu, "&Quick Themes")
         self._theme_actions = {}
-        self._rebuild_themes_menu()
+        # Theme actions are built the first time the submenu opens and
+        # rebuilt only after the set of theme names has changed.
+        self._theme_menu_names = ()
+        self._themes_dirty = True
+        self._themes_menu.aboutToShow.connect(self._rebuild_themes_menu_if_dirty)
         
         settings_menu.addSeparator()
         
-        theme_manager_action = QAction("&Theme Manager...", self)
-        theme_manager_action.setShortcut(QKeySequence("Ctrl+,"))
-        theme_manager_action.triggered.connect(self._on_open_settings)
-        settings_menu.addAction(theme_manager_action)
-        
-        font_manager_action = QAction("&Font Manager...", self)
-        font_manager_action.setShortcut(QKeySequence("Ctrl+Shift+F"))
-        font_manager_action.triggered.connect(self._on_open_font_manager)
-        settings_menu.addAction(font_manager_action)
+        self._add_menu_actions(settings_menu, _SETTINGS_ACTIONS)
+    
+    def _rebuild_themes_menu_if_dirty(self):
+        """Rebuild the Quick Themes menu if the theme list is stale."""
+        if self._themes_dirty:
+            self._rebuild_themes_menu()
+    
+    def _theme_names(self) -> tuple:
+        """Get the built-in and custom theme names in menu order."""
+        return (tuple(self._theme_manager.get_builtin_theme_names()) +
+                tuple(self._theme_manager.get_custom_theme_names()))
     
     def _rebuild_themes_menu(self):
         """Rebuild the Quick Themes menu with all available themes."""
+        self._themes_dirty = False
+        self._theme_menu_names = self._theme_names()
+        # Actions are parented to the menu, so clear() deletes them too
         self._themes_menu.clear()
         self._theme_actions.clear()
         
         current_theme = self._theme_manager.current_theme_name
         
-        for name in self._theme_manager.get_builtin_theme_names():
-            action = QAction(f"📦 {name}", self)
-            action.setCheckable(True)
-            action.setChecked(name == current_theme)
-            action.triggered.connect(lambda checked, n=name: self._on_theme_changed(n))
-            self._themes_menu.addAction(action)
-            self._theme_actions[name] = action
-        
+        builtin_themes = self._theme_manager.get_builtin_theme_names()
         custom_themes = self._theme_manager.get_custom_theme_names()
+        self._add_theme_actions(builtin_themes, "📦", current_theme)
         if custom_themes:
             self._themes_menu.addSeparator()
-            for name in custom_themes:
-                action = QAction(f"✏️ {name}", self)
-                action.setCheckable(True)
-                action.setChecked(name == current_theme)
-                action.triggered.connect(lambda checked, n=name: self._on_theme_changed(n))
-                self._themes_menu.addAction(action)
-                self._theme_actions[name] = action
+            self._add_theme_actions(custom_themes, "✏️", current_theme)
+    
+    def _add_theme_actions(self, names, icon: str, current_theme: str):
+        """Add one checkable Quick Themes action per theme name."""
+        actions = []
+        for name in names:
+            action = QAction(f"{icon} {name}", self._themes_menu)
+            action.setCheckable(True)
+            action.setChecked(name == current_theme)
+            # triggered's checked flag is dropped; partial avoids a closure per theme
+            action.triggered.connect(partial(self._on_theme_changed, name))
+            actions.append(action)
+            self._theme_actions[name] = action
+        self._themes_menu.addActions(actions)
     
     def _setup_help_menu(self, menubar: QMenuBar):
-        """Create the Help menu."""
-        help_menu = menubar.addMenu("&Help")
+        """Create the Help menu; its actions are built the first time it opens."""
+        self._help_menu = self._add_menu(menubar, "&Help")
+        self._help_menu_built = False
+        self._help_menu.aboutToShow.connect(self._populate_help_menu_once)
+    
+    def _populate_help_menu_once(self):
+        """Add the Help menu actions on first show."""
+        if self._help_menu_built:
+            return
+        self._help_menu_built = True
         
         about_action = QAction("&About", self)
         about_action.triggered.connect(self._on_about)
-        help_menu.addAction(about_action)
+        self._help_menu.addAction(about_action)
     
     def _setup_status_bar(self):
         """Create and configure the status bar."""
         self._status_bar = QStatusBar(self)
         self.setStatusBar(self._status_bar)
         
-        self._file_label = QLabel("Untitled")
+        self._file_label = QLabel(self._UNTITLED_TEXT)
         self._position_label = QLabel("Ln 1, Col 1")
-        self._modified_label = QLabel("")
-        self._split_label = QLabel("")
+        self._last_pos = (1, 1)
+        self._modified_label = QLabel(self._EMPTY_TEXT)
+        self._split_label = QLabel(self._EMPTY_TEXT)
+        # Last text set on each label, so unchanged updates are skipped
+        self._status_texts: dict[QLabel, str] = {
+            self._file_label: self._UNTITLED_TEXT,
+            self._modified_label: self._EMPTY_TEXT,
+            self._split_label: self._EMPTY_TEXT,
+        }
         
         self._status_bar.addWidget(self._file_label, 1)
         self._status_bar.addPermanentWidget(self._split_label)
         self._status_bar.addPermanentWidget(self._modified_label)
         self._status_bar.addPermanentWidget(self._position_label)
+        
+        self._pos_update_timer = QTimer(self)
+        self._pos_update_timer.setSingleShot(True)
+        self._pos_update_timer.setInterval(16)
+        self._pos_update_timer.timeout.connect(self._flush_position_update)
+        
+        # Modification signals arrive in bursts (text change and Qt's
+        # modificationChanged both report the first edit); refresh once.
+        self._status_update_timer = QTimer(self)
+        self._status_update_timer.setSingleShot(True)
+        self._status_update_timer.setInterval(30)
+        self._status_update_timer.timeout.connect(self._update_status_bar)
     
     def _setup_font_toolbar(self):
-        """Initialize the floating font toolbar."""
-        self._font_toolbars = {}
-        self._create_font_toolbars_for_panes()
-    
-    def _create_font_toolbars_for_panes(self):
-        """Create font toolbars for all editor panes."""
-        for pane in self._split_container._panes:
-            if pane not in self._font_toolbars:
-                toolbar = FontMiniToolbar()
-                toolbar.set_main_window(self)
-                toolbar.attach_to_editor(pane.editor)
-                self._font_toolbars[pane] = toolbar
-                self._apply_font_toolbar_theme_to(toolbar)
+        """Initialize the floating font toolbar, shared by all panes."""
+        self._font_toolbar = FontMiniToolbar()
+        self._font_toolbar.set_main_window(self)
+        self._attach_font_toolbar(self._get_active_editor())
+    
+    def _attach_font_toolbar(self, editor):
+        """Move the font toolbar to the editor the user is working in."""
+        if editor is self._font_toolbar.editor:
+            return
+        self._font_toolbar.hide()
+        self._font_toolbar.attach_to_editor(editor)
     
     def _apply_font_toolbar_theme_to(self, toolbar):
         """Apply theme colors to a font toolbar."""
@@ -325,9 +423,8 @@ class MainWindow(QMainWindow):
         )
     
     def _apply_font_toolbar_theme(self):
-        """Apply theme colors to all font toolbars."""
-        for toolbar in self._font_toolbars.values():
-            self._apply_font_toolbar_theme_to(toolbar)
+        """Apply theme colors to the font toolbar."""
+        self._apply_font_toolbar_theme_to(self._font_toolbar)
     
     def _connect_signals(self):
         """Connect container signals."""
@@ -336,173 +433,380 @@ class MainWindow(QMainWindow):
         self._split_container.layout_changed.connect(self._on_layout_changed)
         self._split_container.close_app_requested.connect(self.close)
         self._split_container.save_document_requested.connect(self._on_save_and_close_tab)
-        self._split_container.layout_changed.connect(self._create_font_toolbars_for_panes)
+        QApplication.instance().focusChanged.connect(self._on_focus_changed)
     
     def _get_active_editor(self):
         """Get the currently active editor widget."""
-        from PySide6.QtWidgets import QApplication
-        from editor.line_number_editor import LineNumberedEditor
-        
-        focused = QApplication.focusWidget()
-        if isinstance(focused, LineNumberedEditor):
-            return focused
+        if self._focused_editor is not None:
+            return self._focused_editor
         
+        # Memoised per active pane, so switching panes refreshes it implicitly
         pane = self._split_container.active_pane
-        if pane:
-            return pane.editor
-        return None
+        if pane is not self._active_editor_pane:
+            self._active_editor_pane = pane
+            self._active_editor_cache = pane.editor if pane else None
+        return self._active_editor_cache
+    
+    @Slot(QWidget, QWidget)
+    def _on_focus_changed(self, old: Optional[QWidget], new: Optional[QWidget]):
+        """Remember the focused editor, if focus moved to one."""
+        self._focused_editor = new if isinstance(new, LineNumberedEditor) else None
+        if self._focused_editor is not None:
+            self._attach_font_toolbar(self._focused_editor)
+    
+    def _sync_focused_editor(self):
+        """Re-read the focus widget after panes or documents change."""
+        self._on_focus_changed(None, QApplication.focusWidget())
+    
+    def _refresh_chrome(self):
+        """Update the window title and status bar from one active-document fetch."""
+        active = self._split_container.active_document
+        self._update_window_title_for(active)
+        self._update_status_bar_for(active)
     
     def _update_window_title(self):
         """Update the window title based on current state."""
-        doc = self._split_container.active_document
+        self._update_window_title_for(self._split_container.active_document)
+    
+    def _update_window_title_for(self, doc: Optional[Document]):
+        """Update the window title for an already-fetched active document."""
         if doc:
             file_name = doc.file_name
             modified = "*" if doc.is_modified else ""
-            self.setWindowTitle(f"{file_name}{modified} - TextEdit")
+            title = f"{file_name}{modified} - TextEdit"
         else:
-            self.setWindowTitle("TextEdit")
+            title = "TextEdit"
+        if title != self._last_title:
+            self._last_title = title
+            self.setWindowTitle(title)
     
     def _update_status_bar(self):
-        """Update all status bar elements."""
-        doc = self._split_container.active_document
-        
-        if doc:
-            self._file_label.setText(doc.file_name)
-            self._modified_label.setText("Modified" if doc.is_modified else "")
-        else:
-            self._file_label.setText("Untitled")
-            self._modified_label.setText("")
-        
-        editor = self._get_active_editor()
-        if editor:
-            cursor = editor.textCursor()
-            base = getattr(editor, '_line_number_base', 0)
-            line = base + cursor.blockNumber() + 1
-            column = cursor.columnNumber() + 1
-            self._position_label.setText(f"Ln {line}, Col {column}")
-        
-        if self._split_container.is_split:
-            self._split_label.setText("Split View")
-        else:
-            self._split_label.setText("")
+        """Update all status bar elements with a single repaint."""
+        self._update_status_bar_for(self._split_container.active_document)
+    
+    def _update_status_bar_for(self, doc: Optional[Document]):
+        """Update the status bar for an already-fetched active document."""
+        self._status_bar.setUpdatesEnabled(False)
+        try:
+            if doc:
+                self._set_status_text(self._file_label, doc.file_name)
+                self._set_status_text(
+                    self._modified_label,
+                    self._MODIFIED_TEXT if doc.is_modified else self._EMPTY_TEXT
+                )
+            else:
+                self._set_status_text(self._file_label, self._UNTITLED_TEXT)
+                self._set_status_text(self._modified_label, self._EMPTY_TEXT)
+            
+            editor = self._get_active_editor()
+            if editor:
+                cursor = editor.textCursor()
+                base = getattr(editor, '_line_number_base', 0)
+                self._set_position(base + cursor.blockNumber() + 1,
+                                   cursor.columnNumber() + 1)
+            
+            self._set_status_text(
+                self._split_label,
+                self._SPLIT_TEXT if self._split_container.is_split else self._EMPTY_TEXT
+            )
+        finally:
+            self._status_bar.setUpdatesEnabled(True)
+            self._status_bar.update()
     
+    @Slot(Document)
     def _on_document_changed(self, document: Document):
         """Handle active document change."""
-        self._update_window_title()
-        self._update_status_bar()
+        self._sync_focused_editor()
+        self._refresh_chrome()
         
         editor = self._get_active_editor()
-        if editor:
+        self._attach_font_toolbar(editor)
+        if editor is self._connected_editor:
+            return
+        
+        # Only the active editor drives the position label
+        if self._connected_editor is not None:
             try:
-                editor.cursorPositionChanged.disconnect(self._on_cursor_position_changed)
+                self._connected_editor.cursorPositionChanged.disconnect(
+                    self._on_cursor_position_changed
+                )
             except RuntimeError:
                 pass
+        if editor:
             editor.cursorPositionChanged.connect(self._on_cursor_position_changed)
+        self._connected_editor = editor
     
+    @Slot(Document, bool)
     def _on_document_modified(self, document: Document, modified: bool):
         """Handle document modification state change."""
-        self._update_window_title()
-        self._update_status_bar()
+        self._update_window_title_for(self._split_container.active_document)
+        self._status_update_timer.start()
     
+    @Slot()
     def _on_layout_changed(self):
         """Handle split layout changes."""
-        self._update_status_bar()
+        self._sync_focused_editor()
+        self._attach_font_toolbar(self._get_active_editor())
+        self._refresh_chrome()
         self._swap_panes_action.setEnabled(self._split_container.is_split)
     
+    @Slot()
     def _on_cursor_position_changed(self):
-        """Handle cursor position changes."""
+        """Handle cursor position changes (coalesced to one update per frame)."""
+        self._pos_update_timer.start()
+    
+    def _flush_position_update(self):
+        """Refresh the position label from the active editor's cursor."""
         editor = self._get_active_editor()
         if editor:
             cursor = editor.textCursor()
             # Account for virtualised documents where block numbers are local
             base = getattr(editor, '_line_number_base', 0)
-            line = base + cursor.blockNumber() + 1
-            column = cursor.columnNumber() + 1
-            self._position_label.setText(f"Ln {line}, Col {column}")
+            self._set_position(base + cursor.blockNumber() + 1,
+                               cursor.columnNumber() + 1)
+    
+    def _set_status_text(self, label: QLabel, text: str):
+        """Set a status label's text, skipping the call if it already shows it."""
+        if self._status_texts.get(label) == text:
+            return
+        self._status_texts[label] = text
+        label.setText(text)
     
-    def _prompt_save_changes(self, document: Document) -> bool:
+    def _set_position(self, line: int, column: int):
+        """Show the cursor position, skipping the label update if unchanged."""
+        if (line, column) == self._last_pos:
+            return
+        self._last_pos = (line, column)
+        self._position_label.setText(_format_pos(line, column))
+    
+    def _prompt_save_changes(self, document: Document, on_done):
         """
-        Prompt user to save changes for a specific document.
+        Ask whether to save a modified document without blocking.
         
-        Returns:
-            True if safe to proceed, False if operation should be cancelled.
+        The prompt is window-modal and opened with open() rather than a
+        nested exec() loop. on_done(proceed) is called with True if it is
+        safe to proceed, False if the operation should be cancelled;
+        unmodified documents resolve immediately.
         """
         if not document.is_modified:
-            return True
+            on_done(True)
+            return
         
-        result = QMessageBox.warning(
-            self,
+        self._ask_save_choice(
+            document,
+            lambda choice: on_done(self._resolve_save_choice(document, choice))
+        )
+    
+    def _ask_save_choice(self, document: Document, on_choice):
+        """Open the Save/Discard/Cancel prompt; on_choice(button) gets the answer."""
+        box = QMessageBox(
+            QMessageBox.Icon.Warning,
             "Unsaved Changes",
             f"Do you want to save changes to {document.file_name}?",
             QMessageBox.StandardButton.Save |
             QMessageBox.StandardButton.Discard |
             QMessageBox.StandardButton.Cancel,
-            QMessageBox.StandardButton.Save
+            self
+        )
+        box.setDefaultButton(QMessageBox.StandardButton.Save)
+        box.finished.connect(
+            lambda _result, b=box: self._on_save_prompt_finished(b, on_choice)
         )
+        self._save_prompt = box
+        box.open()
+    
+    def _on_save_prompt_finished(self, box: QMessageBox, on_choice):
+        """Report the button chosen in a save prompt."""
+        self._save_prompt = None
+        box.deleteLater()
+        button = box.clickedButton()
+        on_choice(box.standardButton(button) if button is not None
+                  else QMessageBox.StandardButton.Cancel)
+    
+    def _resolve_save_choice(self, document: Document, choice) -> bool:
+        """
+        Save or discard a document according to the prompt answer.
         
-        if result == QMessageBox.StandardButton.Save:
+        Returns:
+            True if safe to proceed, False if operation should be cancelled.
+        """
+        if choice == QMessageBox.StandardButton.Save:
             if document.file_path:
                 return self._save_document(document)
             else:
                 return self._save_document_as(document)
-        elif result == QMessageBox.StandardButton.Discard:
+        elif choice == QMessageBox.StandardButton.Discard:
             return True
         else:
             return False
     
-    def _prompt_save_all(self) -> bool:
-        """Prompt to save all unsaved documents."""
-        for doc in self._split_container.all_documents:
-            if not self._prompt_save_changes(doc):
-                return False
-        return True
+    def _prompt_save_all(self, on_done):
+        """
+        Prompt for each unsaved document, then write the saved ones together.
+        
+        Answers are collected first; documents the user chose to save are
+        written concurrently on the thread pool and on_done(proceed) runs
+        once every write has finished (False on cancel or any failure).
+        """
+        pending = self._split_container.modified_documents
+        self._prompt_next_save(pending, [], on_done)
+    
+    def _prompt_next_save(self, pending: list, to_save: list, on_done):
+        """Prompt for the next pending document, stopping on cancel."""
+        if not pending:
+            self._save_documents_async(to_save, on_done)
+            return
+        
+        document = pending.pop(0)
+        self._ask_save_choice(
+            document,
+            lambda choice: self._on_save_all_choice(document, choice,
+                                                    pending, to_save, on_done)
+        )
+    
+    def _on_save_all_choice(self, document: Document, choice, pending: list,
+                            to_save: list, on_done):
+        """Record one Save All answer and move on to the next document."""
+        if choice == QMessageBox.StandardButton.Save:
+            path = document.file_path or self._ask_save_path(document)
+            if not path:
+                on_done(False)
+                return
+            to_save.append((document, path))
+        elif choice != QMessageBox.StandardButton.Discard:
+            on_done(False)
+            return
+        self._prompt_next_save(pending, to_save, on_done)
+    
+    def _save_documents_async(self, to_save: list, on_done):
+        """Write (document, path) pairs on the thread pool; on_done(all_ok) at the end."""
+        if not to_save:
+            on_done(True)
+            return
+        
+        state = {"remaining": len(to_save), "ok": True}
+        for document, path in to_save:
+            self._sync_document_from_editor(document)
+            content = self._content_to_save(document)
+            worker = IOWorker(self._file_handler.write_file, path, content,
+                              on_error=_write_failure)
+            worker.signals.finished.connect(
+                lambda result, d=document, p=path, c=content, w=worker:
+                    self._on_write_finished(d, p, c, result, w, state, on_done)
+            )
+            self._io_workers.add(worker)
+            QThreadPool.globalInstance().start(worker)
+    
+    def _on_write_finished(self, document: Document, path: str, written: str,
+                           result, worker, state: dict, on_done):
+        """Apply one background write; report once the whole batch is done."""
+        self._io_workers.discard(worker)
+        if result.success:
+            # The window stays editable while writes run; text typed since the
+            # snapshot was not written, so keep the document modified and
+            # report failure so the close is abandoned.
+            self._sync_document_from_editor(document)
+            if self._content_to_save(document) == written:
+                self._mark_document_saved(document, path)
+            else:
+                state["ok"] = False
+                self._show_error(
+                    "Save Error",
+                    f"{document.display_name} changed while it was being saved. "
+                    "Save it again before closing."
+                )
+        else:
+            state["ok"] = False
+            self._show_error("Save Error", result.error_message)
+        
+        state["remaining"] -= 1
+        if state["remaining"] == 0:
+            on_done(state["ok"])
     
+    @Slot()
     def _on_new(self):
         """Handle File > New action."""
         self._split_container.add_new_document()
-        self._update_window_title()
-        self._update_status_bar()
+        self._refresh_chrome()
     
+    @Slot()
     def _on_open(self):
         """Handle File > Open action."""
         file_path, _ = QFileDialog.getOpenFileName(
             self,
             "Open File",
             "",
-            "Text Files (*.txt);;All Files (*)"
+            _FILE_FILTER
         )
         
         if not file_path:
             return
         
-        result = self._file_handler.read_file(file_path)
+        self._read_file_async(file_path)
+    
+    def _read_file_async(self, file_path: str, force_new_tab: bool = False):
+        """Read a file on the thread pool; the result opens via _on_read_finished."""
+        key = self._read_cache_key(file_path)
+        cached = self._read_cache.get(key) if key is not None else None
+        if cached is not None:
+            self._read_cache.move_to_end(key)
+            self._on_read_finished(file_path, cached, force_new_tab)
+            return
+        
+        worker = IOWorker(self._file_handler.read_file, file_path,
+                          on_error=_read_failure)
+        worker.signals.finished.connect(
+            lambda result, p=file_path, w=worker, k=key:
+                self._on_read_finished(p, result, force_new_tab, w, k)
+        )
+        self._io_workers.add(worker)
+        self._status_bar.showMessage(f"Loading {Path(file_path).name}...")
+        QThreadPool.globalInstance().start(worker)
+    
+    def _read_cache_key(self, file_path: str) -> Optional[tuple]:
+        """Return the read-cache key for a file, or None if it cannot be stat'ed."""
+        try:
+            st = os.stat(file_path)
+        except OSError:
+            return None
+        return (file_path, st.st_mtime_ns, st.st_size)
+    
+    def _on_read_finished(self, file_path: str, result, force_new_tab: bool = False,
+                          worker: Optional[IOWorker] = None,
+                          cache_key: Optional[tuple] = None):
+        """Open a document from a completed read (runs on the GUI thread)."""
+        if worker is not None:
+            self._io_workers.discard(worker)
+            self._status_bar.clearMessage()
         
         if result.success:
             content = result.content
-            head = content[:1024].lstrip()
-            is_html = head.startswith('<!DOCTYPE') or head.startswith('<html')
-            
-            if is_html:
+            if cache_key is not None and len(content) <= _READ_CACHE_MAX_CHARS:
+                self._read_cache[cache_key] = result
+                if len(self._read_cache) > _READ_CACHE_SIZE:
+                    self._read_cache.popitem(last=False)
+            if _looks_like_html(content):
                 doc = Document(content="", file_path=file_path)
                 doc.html_content = content
             else:
                 doc = Document(content=content, file_path=file_path)
             
-            current_doc = self._split_container.active_document
-            pane = self._split_container.active_pane
-            
-            if (current_doc and pane and
-                current_doc.file_path is None and
-                not current_doc.is_modified and
-                current_doc.content == ""):
-                pane.remove_document(current_doc)
+            if not force_new_tab:
+                current_doc = self._split_container.active_document
+                pane = self._split_container.active_pane
+                
+                if (current_doc and pane and
+                    current_doc.file_path is None and
+                    not current_doc.is_modified and
+                    current_doc.content == ""):
+                    pane.close_document(current_doc)
             
             self._split_container.add_document(doc)
-            self._update_window_title()
-            self._update_status_bar()
+            self._refresh_chrome()
         else:
             self._show_error("Open Error", result.error_message)
     
+    @Slot()
     def _on_save(self) -> bool:
         """Handle File > Save action."""
         doc = self._split_container.active_document
@@ -518,6 +822,7 @@ class MainWindow(QMainWindow):
         else:
             return self._on_save_as()
     
+    @Slot()
     def _on_save_as(self) -> bool:
         """Handle File > Save As action."""
         doc = self._split_container.active_document
@@ -532,14 +837,14 @@ class MainWindow(QMainWindow):
             self,
             "Save File",
             "",
-            "Text Files (*.txt);;All Files (*)"
+            _FILE_FILTER
         )
         
         if not file_path:
             return False
         
-        if selected_filter == "Text Files (*.txt)" and not file_path.endswith(".txt"):
-            file_path += ".txt"
+        if selected_filter == _TXT_FILTER and not file_path.endswith(_TXT_EXT):
+            file_path += _TXT_EXT
         
         return self._save_document(doc, file_path)
     
@@ -549,47 +854,67 @@ class MainWindow(QMainWindow):
         if not path:
             return False
         
-        content_to_save = document.html_content if document.html_content else document.content
-        result = self._file_handler.write_file(path, content_to_save)
+        result = self._file_handler.write_file(path, self._content_to_save(document))
         
         if result.success:
-            document.mark_saved(path)
-            pane = self._split_container.get_pane_for_document(document)
-            if pane:
-                pane.update_tab_title(document)
-            self._update_window_title()
-            self._update_status_bar()
+            self._mark_document_saved(document, path)
             return True
         else:
             self._show_error("Save Error", result.error_message)
             return False
     
-    def _save_document_as(self, document: Document) -> bool:
-        """Save a document with a file dialog."""
+    def _sync_document_from_editor(self, document: Document):
+        """Copy text not yet synced from the document's editor into it."""
         pane = self._split_container.get_pane_for_document(document)
         if pane:
             pane.sync_from_editor()
+    
+    def _content_to_save(self, document: Document) -> str:
+        """Return the text written to disk for a document."""
+        return document.html_content if document.html_content else document.content
+    
+    def _mark_document_saved(self, document: Document, path: str):
+        """Record a successful write and refresh the tab, title and status bar."""
+        document.mark_saved(path)
+        pane = self._split_container.get_pane_for_document(document)
+        if pane:
+            pane.update_tab_title(document)
+        self._refresh_chrome()
+    
+    def _save_document_as(self, document: Document) -> bool:
+        """Save a document with a file dialog."""
+        file_path = self._ask_save_path(document)
+        if not file_path:
+            return False
+        
+        return self._save_document(document, file_path)
+    
+    def _ask_save_path(self, document: Document) -> Optional[str]:
+        """Sync the document from its editor and ask where to save it."""
+        self._sync_document_from_editor(document)
         
         file_path, selected_filter = QFileDialog.getSaveFileName(
             self,
             "Save File",
-            document.file_name if document.file_name != "Untitled" else "",
-            "Text Files (*.txt);;All Files (*)"
+            document.file_name if document.file_path is not None else "",
+            _FILE_FILTER
         )
         
         if not file_path:
-            return False
+            return None
         
-        if selected_filter == "Text Files (*.txt)" and not file_path.endswith(".txt"):
-            file_path += ".txt"
+        if selected_filter == _TXT_FILTER and not file_path.endswith(_TXT_EXT):
+            file_path += _TXT_EXT
         
-        return self._save_document(document, file_path)
+        return file_path
     
+    @Slot(Document, int, object)
     def _on_save_and_close_tab(self, document: Document, tab_index: int, pane):
         """Handle save request for untitled document before closing tab."""
         if self._save_document_as(document):
-            pane.remove_document_at(tab_index)
+            pane.close_document(document)
     
+    @Slot()
     def _on_close_tab(self):
         """Handle Close Tab action."""
         pane = self._split_container.active_pane
@@ -606,51 +931,26 @@ class MainWindow(QMainWindow):
         
         pane.sync_from_editor()
         
-        if doc.is_modified:
-            if not self._prompt_save_changes(doc):
-                return
+        self._prompt_save_changes(
+            doc, lambda proceed: self._finish_close_tab(pane, doc, proceed)
+        )
+    
+    def _finish_close_tab(self, pane, doc: Document, proceed: bool = True):
+        """Remove a tab once its save prompt (if any) has been answered."""
+        if not proceed:
+            return
         
-        pane.remove_document(doc)
+        pane.close_document(doc)
         
-        self._update_window_title()
-        self._update_status_bar()
-    
-    def _on_undo(self):
-        """Handle Edit > Undo."""
-        editor = self._get_active_editor()
-        if editor:
-            editor.undo()
-    
-    def _on_redo(self):
-        """Handle Edit > Redo."""
-        editor = self._get_active_editor()
-        if editor:
-            editor.redo()
-    
-    def _on_cut(self):
-        """Handle Edit > Cut."""
-        editor = self._get_active_editor()
-        if editor:
-            editor.cut()
-    
-    def _on_copy(self):
-        """Handle Edit > Copy."""
-        editor = self._get_active_editor()
-        if editor:
-            editor.copy()
-    
-    def _on_paste(self):
-        """Handle Edit > Paste."""
-        editor = self._get_active_editor()
-        if editor:
-            editor.paste()
+        self._refresh_chrome()
     
-    def _on_select_all(self):
-        """Handle Edit > Select All."""
+    def _forward(self, op_name: str):
+        """Forward an Edit menu action to the same-named method on the active editor."""
         editor = self._get_active_editor()
         if editor:
-            editor.selectAll()
+            getattr(editor, op_name)()
     
+    @Slot()
     def _on_find(self):
         """Handle Edit > Find."""
         editor = self._get_active_editor()
@@ -658,6 +958,7 @@ class MainWindow(QMainWindow):
             return
         
         if self._find_replace_dialog is None:
+            from editor.find_replace import FindReplaceDialog
             self._find_replace_dialog = FindReplaceDialog(
                 editor, self, content_provider=self._get_search_content
             )
@@ -666,6 +967,7 @@ class MainWindow(QMainWindow):
         
         self._find_replace_dialog.show_find()
     
+    @Slot()
     def _on_replace(self):
         """Handle Edit > Replace."""
         editor = self._get_active_editor()
@@ -673,6 +975,7 @@ class MainWindow(QMainWindow):
             return
         
         if self._find_replace_dialog is None:
+            from editor.find_replace import FindReplaceDialog
             self._find_replace_dialog = FindReplaceDialog(
                 editor, self, content_provider=self._get_search_content
             )
@@ -681,9 +984,11 @@ class MainWindow(QMainWindow):
         
         self._find_replace_dialog.show_replace()
     
+    @Slot()
     def _on_find_in_files(self):
         """Handle Edit > Find in Open Files."""
         if self._multi_file_find_dialog is None:
+            from editor.find_replace import MultiFileFindDialog
             self._multi_file_find_dialog = MultiFileFindDialog(
                 self._get_all_documents,
                 self._get_pane_for_document,
@@ -695,9 +1000,11 @@ class MainWindow(QMainWindow):
         
         self._multi_file_find_dialog.show_find()
     
+    @Slot()
     def _on_replace_in_files(self):
         """Handle Edit > Replace in Open Files."""
         if self._multi_file_find_dialog is None:
+            from editor.find_replace import MultiFileFindDialog
             self._multi_file_find_dialog = MultiFileFindDialog(
                 self._get_all_documents,
                 self._get_pane_for_document,
@@ -724,6 +1031,7 @@ class MainWindow(QMainWindow):
         """Get the pane containing a document."""
         return self._split_container.get_pane_for_document(document)
     
+    @Slot(Document, int)
     def _on_goto_match(self, document, position: int):
         """Handle navigation to a search match."""
         pane = self._split_container.get_pane_for_document(document)
@@ -740,33 +1048,37 @@ class MainWindow(QMainWindow):
         editor.centerCursor()
         editor.setFocus()
     
+    @Slot(bool)
     def _on_toggle_word_wrap(self, checked: bool):
         """Handle View > Word Wrap toggle."""
         self._word_wrap_enabled = checked
         self._split_container.set_word_wrap(checked)
     
+    @Slot(bool)
     def _on_toggle_status_bar(self, checked: bool):
         """Handle View > Status Bar toggle."""
         self._status_bar.setVisible(checked)
     
+    @Slot(bool)
     def _on_toggle_sidebar(self, checked: bool):
         """Handle View > Sidebar toggle."""
         self._sidebar.setVisible(checked)
     
+    @Slot()
     def _on_toggle_frame_timer(self):
         """Handle View > Frame Timer (Ctrl+P)."""
         self._frame_timer.toggle()
         if self._frame_timer.isVisible():
             self._position_frame_timer()
     
+    @Slot()
     def _on_open_folder(self):
         """Handle File > Open Folder action."""
-        import os
         folder_path = QFileDialog.getExistingDirectory(
             self,
             "Open Folder",
             os.path.expanduser("~"),
-            QFileDialog.Option.ShowDirsOnly
+            FOLDER_DIALOG_OPTIONS
         )
         
         if folder_path:
@@ -775,48 +1087,25 @@ class MainWindow(QMainWindow):
             self._sidebar.set_collapsed(False)
             self._sidebar_action.setChecked(True)
     
+    @Slot(str)
     def _on_file_tree_open(self, file_path: str):
         """Handle file open request from file tree."""
         self._open_file(file_path)
     
+    @Slot(str)
     def _on_file_tree_open_new_tab(self, file_path: str):
         """Handle file open in new tab request from file tree (middle click)."""
         self._open_file(file_path, force_new_tab=True)
     
     def _open_file(self, file_path: str, force_new_tab: bool = False):
-        """Open a file in the editor."""
-        result = self._file_handler.read_file(file_path)
-        
-        if result.success:
-            content = result.content
-            head = content[:1024].lstrip()
-            is_html = head.startswith('<!DOCTYPE') or head.startswith('<html')
-            
-            if is_html:
-                doc = Document(content="", file_path=file_path)
-                doc.html_content = content
-            else:
-                doc = Document(content=content, file_path=file_path)
-            
-            if not force_new_tab:
-                current_doc = self._split_container.active_document
-                pane = self._split_container.active_pane
-                
-                if (current_doc and pane and
-                    current_doc.file_path is None and
-                    not current_doc.is_modified and
-                    current_doc.content == ""):
-                    pane.remove_document(current_doc)
-            
-            self._split_container.add_document(doc)
-            self._update_window_title()
-            self._update_status_bar()
-        else:
-            self._show_error("Open Error", result.error_message)
+        """Open a file in the editor; the read runs off the GUI thread."""
+        self._read_file_async(file_path, force_new_tab)
     
+    @Slot(str)
     def _on_theme_changed(self, theme_name: str):
         """Handle theme selection."""
         self._theme_manager.apply_theme_by_name(theme_name)
+        self._applied_theme_colors = self._theme_manager.get_theme_colors(theme_name)
         self._apply_line_number_colors()
         self._apply_font_toolbar_theme()
         self._update_theme_checkmarks(theme_name)
@@ -826,26 +1115,34 @@ class MainWindow(QMainWindow):
         for name, action in self._theme_actions.items():
             action.setChecked(name == theme_name)
     
+    @Slot()
     def _on_open_settings(self):
         """Open the settings dialog."""
+        from editor.settings_dialog import SettingsDialog
         dialog = SettingsDialog(self._theme_manager, self)
         dialog.theme_changed.connect(self._on_settings_theme_changed)
         dialog.exec()
-        self._rebuild_themes_menu()
+        if self._theme_names() != self._theme_menu_names:
+            self._themes_dirty = True
     
+    @Slot()
     def _on_open_font_manager(self):
         """Open the font manager dialog."""
+        from editor.settings_dialog import FontManagerDialog
         dialog = FontManagerDialog(self._theme_manager, self)
         dialog.font_apply_requested.connect(self._on_font_apply)
         dialog.exec()
     
+    @Slot(str)
     def _on_settings_theme_changed(self, theme_name: str):
         """Handle theme change from settings dialog."""
-        self._theme_manager.apply_theme_by_name(theme_name)
-        self._apply_line_number_colors()
-        self._apply_font_toolbar_theme()
-        self._rebuild_themes_menu()
+        # Saved edits keep the theme's name, so compare colors as well
+        if (theme_name == self._theme_manager.current_theme_name and
+                self._theme_manager.get_theme_colors(theme_name) == self._applied_theme_colors):
+            return
+        self._on_theme_changed(theme_name)
     
+    @Slot(QFont, bool)
     def _on_font_apply(self, font: QFont, selection_only: bool):
         """Handle font application from settings dialog."""
         if selection_only:
@@ -863,34 +1160,35 @@ class MainWindow(QMainWindow):
             cursor.select(QTextCursor.SelectionType.Document)
             fmt = QTextCharFormat()
             fmt.setFont(font)
-            cursor.mergeCharFormat(fmt)
+            _merge_char_format(editor, cursor, fmt)
     
     def _apply_font_to_selections(self, font: QFont):
         """Apply font to selected text in all panes that have selections."""
         fmt = QTextCharFormat()
         fmt.setFont(font)
         
-        for pane in self._split_container._panes:
-            editor = pane.editor
+        # Merging through a copy of the cursor updates the editor in place;
+        # its own cursor never moves, so it is not set back.
+        for editor in self._split_container.editors:
             cursor = editor.textCursor()
             if cursor.hasSelection():
-                cursor.mergeCharFormat(fmt)
-                editor.setTextCursor(cursor)
+                _merge_char_format(editor, cursor, fmt)
     
     def _apply_line_number_colors(self):
         """Apply line number colors based on current theme."""
         colors = self._theme_manager.get_line_number_colors()
-        self._split_container.set_line_number_colors(
-            colors["bg"],
-            colors["text"],
-            colors["current_line"],
-            colors["current_line_bg"]
-        )
+        palette = (colors["bg"], colors["text"], colors["current_line"], colors["current_line_bg"])
+        if palette == self._line_number_colors:
+            return
+        self._line_number_colors = palette
+        self._split_container.set_line_number_colors(*palette)
     
+    @Slot()
     def _on_swap_panes(self):
         """Handle View > Swap Split Panes."""
         self._split_container.swap_panes()
     
+    @Slot()
     def _on_about(self):
         """Handle Help > About action."""
         QMessageBox.about(
@@ -919,9 +1217,30 @@ class MainWindow(QMainWindow):
         if self._frame_timer.isVisible():
             self._position_frame_timer()
 
+    def keyPressEvent(self, event):
+        """Dispatch the hot File shortcuts that have no QAction shortcut."""
+        slot = self._key_dispatch.get(event.keyCombination().toCombined())
+        if slot is not None:
+            event.accept()
+            getattr(self, slot)()
+            return
+        super().keyPressEvent(event)
+
     def closeEvent(self, event):
         """Handle window close event."""
-        if self._prompt_save_all():
+        if self._close_confirmed or not self._split_container.has_unsaved_changes():
             event.accept()
-        else:
-            event.ignore()
+            return
+        
+        # Prompts and writes run asynchronously; close() is re-issued after
+        event.ignore()
+        if not self._close_pending:
+            self._close_pending = True
+            self._prompt_save_all(self._on_close_prompts_finished)
+    
+    def _on_close_prompts_finished(self, proceed: bool):
+        """Close the window after every unsaved document was saved or discarded."""
+        self._close_pending = False
+        if proceed:
+            self._close_confirmed = True
+            self.close()
@@ -6,28 +6,66 @@ Provides a settings dialog with theme management capabilities.
 
 import json
 import os
+import sys
+from functools import lru_cache
 from typing import Optional
 from PySide6.QtWidgets import (
     QDialog, QVBoxLayout, QHBoxLayout, QTabWidget, QWidget,
     QListWidget, QListWidgetItem, QPushButton, QLabel, QLineEdit,
     QGroupBox, QFormLayout, QColorDialog, QMessageBox, QScrollArea,
     QFrame, QSplitter, QSizePolicy, QFontComboBox, QSpinBox,
-    QRadioButton, QButtonGroup, QTextEdit
+    QRadioButton, QButtonGroup, QTextEdit, QComboBox, QAbstractButton
 )
-from PySide6.QtGui import QColor, QPalette, QFont, QFontDatabase
-from PySide6.QtCore import Qt, Signal
+from PySide6.QtGui import QColor, QPalette, QFont, QFontDatabase, QPainter, QPen
+from PySide6.QtCore import Qt, Signal, QTimer, QSignalBlocker, QThreadPool, QRectF
 
+from editor.io_worker import IOWorker
 
-class ColorButton(QPushButton):
+
+# Stylesheet template; the formatted string is cached per color pair so
+# repeated theme switches reuse it instead of rebuilding it.
+_FONT_MANAGER_STYLESHEET = """
+    QTextEdit#fontPreview {{
+        background-color: {bg};
+        color: {text};
+        border: 1px solid {text}40;
+        border-radius: 4px;
+    }}
+    QGroupBox {{
+        color: {text};
+    }}
+    QGroupBox::title {{
+        color: {text};
+    }}
+    QRadioButton {{
+        color: {text};
+    }}
+    QLabel {{
+        color: {text};
+    }}
+"""
+
+
+@lru_cache(maxsize=32)
+def _font_manager_qss(bg: str, text: str) -> str:
+    """Return the FontManagerWidget stylesheet, preview included, for theme colors."""
+    return _FONT_MANAGER_STYLESHEET.format(bg=bg, text=text)
+
+
+class ColorButton(QAbstractButton):
     """A button that displays and allows selecting a color."""
     
     color_changed = Signal(str)
     
+    _BORDER = QColor("#555")
+    _HOVER_BORDER = QColor("#888")
+    
     def __init__(self, color: str = "#ffffff", parent=None):
         super().__init__(parent)
         self._color = color
+        self._swatch = QColor(color)
+        self._hovered = False
         self.setFixedSize(60, 30)
-        self._update_style()
         self.clicked.connect(self._pick_color)
     
     @property
@@ -36,26 +74,40 @@ class ColorButton(QPushButton):
     
     @color.setter
     def color(self, value: str):
-        self._color = value
-        self._update_style()
-    
-    def _update_style(self):
-        self.setStyleSheet(f"""
-            QPushButton {{
-                background-color: {self._color};
-                border: 2px solid #555;
-                border-radius: 4px;
-            }}
-            QPushButton:hover {{
-                border: 2px solid #888;
-            }}
-        """)
+        if value == self._color:
+            return
+        # Buttons across themes mostly hold the same few color strings
+        self._color = sys.intern(value)
+        self._swatch = QColor(value)
+        self.update()
+    
+    def enterEvent(self, event):
+        """Highlight the border while the pointer is over the swatch."""
+        self._hovered = True
+        self.update()
+        super().enterEvent(event)
+    
+    def leaveEvent(self, event):
+        """Restore the normal border when the pointer leaves."""
+        self._hovered = False
+        self.update()
+        super().leaveEvent(event)
+    
+    def paintEvent(self, event):
+        """Paint the color swatch directly rather than through a stylesheet."""
+        painter = QPainter(self)
+        painter.setRenderHint(QPainter.RenderHint.Antialiasing)
+        painter.fillRect(self.rect().adjusted(2, 2, -2, -2), self._swatch)
+        border = self._HOVER_BORDER if self._hovered else self._BORDER
+        painter.setPen(QPen(border, 2))
+        painter.setBrush(Qt.BrushStyle.NoBrush)
+        painter.drawRoundedRect(QRectF(self.rect()).adjusted(1, 1, -1, -1), 4, 4)
     
     def _pick_color(self):
-        color = QColorDialog.getColor(QColor(self._color), self, "Select Color")
-        if color.isValid():
-            self._color = color.name()
-            self._update_style()
+        current = QColor(self._color)
+        color = QColorDialog.getColor(current, self, "Select Color")
+        if color.isValid() and color.name() != current.name():
+            self.color = color.name()
             self.color_changed.emit(self._color)
 
 
@@ -64,39 +116,50 @@ class ThemeEditorWidget(QWidget):
     
     theme_modified = Signal()
     
-    COLOR_FIELDS = [
-        ("main_background", "Main Background"),
-        ("editor_background", "Editor Background"),
-        ("editor_text", "Editor Text"),
-        ("selection_background", "Selection Background"),
-        ("selection_text", "Selection Text"),
-        ("menubar_background", "Menu Bar Background"),
-        ("menubar_text", "Menu Bar Text"),
-        ("menu_background", "Menu Background"),
-        ("menu_text", "Menu Text"),
-        ("menu_hover", "Menu Hover"),
-        ("tab_background", "Tab Background"),
-        ("tab_text", "Tab Text"),
-        ("tab_active_background", "Active Tab Background"),
-        ("tab_active_text", "Active Tab Text"),
-        ("status_bar_background", "Status Bar Background"),
-        ("status_bar_text", "Status Bar Text"),
-        ("scrollbar_background", "Scrollbar Background"),
-        ("scrollbar_handle", "Scrollbar Handle"),
-        ("tree_background", "File Tree Background"),
-        ("tree_text", "File Tree Text"),
-        ("tree_selection", "File Tree Selection"),
-        ("border_color", "Border Color"),
-        ("accent_color", "Accent Color"),
-        ("line_number_bg", "Line Number Background"),
-        ("line_number_text", "Line Number Text"),
-        ("line_number_current", "Current Line Number"),
-        ("line_number_current_bg", "Current Line Background"),
-    ]
+    COLOR_GROUPS = {
+        "Editor Colors": [
+            ("editor_background", "Editor Background"),
+            ("editor_text", "Editor Text"),
+            ("selection_background", "Selection Background"),
+            ("selection_text", "Selection Text"),
+            ("line_number_bg", "Line Number Background"),
+            ("line_number_text", "Line Number Text"),
+            ("line_number_current", "Current Line Number"),
+            ("line_number_current_bg", "Current Line Background"),
+        ],
+        "UI Colors": [
+            ("main_background", "Main Background"),
+            ("menubar_background", "Menu Bar Background"),
+            ("menubar_text", "Menu Bar Text"),
+            ("menu_background", "Menu Background"),
+            ("menu_text", "Menu Text"),
+            ("menu_hover", "Menu Hover"),
+            ("tab_background", "Tab Background"),
+            ("tab_text", "Tab Text"),
+            ("tab_active_background", "Active Tab Background"),
+            ("tab_active_text", "Active Tab Text"),
+            ("status_bar_background", "Status Bar Background"),
+            ("status_bar_text", "Status Bar Text"),
+            ("scrollbar_background", "Scrollbar Background"),
+            ("scrollbar_handle", "Scrollbar Handle"),
+            ("tree_background", "File Tree Background"),
+            ("tree_text", "File Tree Text"),
+            ("tree_selection", "File Tree Selection"),
+            ("border_color", "Border Color"),
+            ("accent_color", "Accent Color"),
+        ],
+    }
+    
+    COLOR_FIELDS = [field for fields in COLOR_GROUPS.values() for field in fields]
     
     def __init__(self, parent=None):
         super().__init__(parent)
         self._color_buttons = {}
+        # A burst of color changes is reported as one theme_modified
+        self._modified_timer = QTimer(self)
+        self._modified_timer.setSingleShot(True)
+        self._modified_timer.setInterval(0)
+        self._modified_timer.timeout.connect(self.theme_modified)
         self._setup_ui()
     
     def _setup_ui(self):
@@ -112,44 +175,24 @@ class ThemeEditorWidget(QWidget):
         content.setStyleSheet("QWidget { background: transparent; }")
         content_layout = QVBoxLayout(content)
         
-        editor_group = QGroupBox("Editor Colors")
-        editor_form = QFormLayout(editor_group)
-        editor_fields = [
-            "editor_background", "editor_text", "selection_background",
-            "selection_text", "line_number_bg", "line_number_text",
-            "line_number_current", "line_number_current_bg"
-        ]
-        for field_id, field_name in self.COLOR_FIELDS:
-            if field_id in editor_fields:
-                btn = ColorButton()
-                btn.color_changed.connect(lambda: self.theme_modified.emit())
-                self._color_buttons[field_id] = btn
-                editor_form.addRow(field_name + ":", btn)
-        content_layout.addWidget(editor_group)
-        
-        ui_group = QGroupBox("UI Colors")
-        ui_form = QFormLayout(ui_group)
-        ui_fields = [
-            "main_background", "menubar_background", "menubar_text",
-            "menu_background", "menu_text", "menu_hover",
-            "tab_background", "tab_text", "tab_active_background", "tab_active_text",
-            "status_bar_background", "status_bar_text",
-            "scrollbar_background", "scrollbar_handle",
-            "tree_background", "tree_text", "tree_selection",
-            "border_color", "accent_color"
-        ]
-        for field_id, field_name in self.COLOR_FIELDS:
-            if field_id in ui_fields:
+        for group_title, fields in self.COLOR_GROUPS.items():
+            group = QGroupBox(group_title)
+            form = QFormLayout(group)
+            for field_id, field_name in fields:
                 btn = ColorButton()
-                btn.color_changed.connect(lambda: self.theme_modified.emit())
+                btn.color_changed.connect(self._queue_modified)
                 self._color_buttons[field_id] = btn
-                ui_form.addRow(field_name + ":", btn)
-        content_layout.addWidget(ui_group)
+                form.addRow(field_name + ":", btn)
+            content_layout.addWidget(group)
         
         content_layout.addStretch()
         scroll.setWidget(content)
         layout.addWidget(scroll)
     
+    def _queue_modified(self):
+        """Schedule one theme_modified for the current event-loop pass."""
+        self._modified_timer.start()
+    
     def get_colors(self) -> dict:
         """Get all color values."""
         return {field_id: btn.color for field_id, btn in self._color_buttons.items()}
@@ -157,7 +200,7 @@ class ThemeEditorWidget(QWidget):
     def set_colors(self, colors: dict):
         """Set all color values."""
         for field_id, btn in self._color_buttons.items():
-            if field_id in colors:
+            if field_id in colors and btn.color != colors[field_id]:
                 btn.color = colors[field_id]
 
 
@@ -171,6 +214,8 @@ class ThemeManagerWidget(QWidget):
         self._theme_manager = theme_manager
         self._current_theme_name = None
         self._is_modified = False
+        self._name_to_item = {}
+        self._color_cache = {}
         self._setup_ui()
         self._load_themes()
     
@@ -245,24 +290,52 @@ class ThemeManagerWidget(QWidget):
     def _load_themes(self):
         """Load all available themes into the list."""
         self._theme_list.clear()
+        self._name_to_item = {}
         
         for name in self._theme_manager.get_builtin_theme_names():
             item = QListWidgetItem(f"📦 {name}")
             item.setData(Qt.ItemDataRole.UserRole, ("builtin", name))
             self._theme_list.addItem(item)
+            self._name_to_item.setdefault(name, item)
         
         for name in self._theme_manager.get_custom_theme_names():
-            item = QListWidgetItem(f"✏️ {name}")
-            item.setData(Qt.ItemDataRole.UserRole, ("custom", name))
-            self._theme_list.addItem(item)
-        
-        current = self._theme_manager.current_theme_name
-        for i in range(self._theme_list.count()):
-            item = self._theme_list.item(i)
-            theme_type, name = item.data(Qt.ItemDataRole.UserRole)
-            if name == current:
-                self._theme_list.setCurrentItem(item)
-                break
+            self._add_custom_item(name)
+        
+        item = self._name_to_item.get(self._theme_manager.current_theme_name)
+        if item is not None:
+            self._theme_list.setCurrentItem(item)
+    
+    def _add_custom_item(self, name: str) -> QListWidgetItem:
+        """Append a custom theme entry to the list and index it by name."""
+        item = QListWidgetItem(f"✏️ {name}")
+        item.setData(Qt.ItemDataRole.UserRole, ("custom", name))
+        self._theme_list.addItem(item)
+        self._name_to_item.setdefault(name, item)
+        return item
+    
+    def _select_item(self, item: QListWidgetItem):
+        """Select an item programmatically and load it into the editor once."""
+        with QSignalBlocker(self._theme_list):
+            self._theme_list.setCurrentItem(item)
+        self._on_theme_selected(item, None)
+    
+    def _select_theme_silently(self, item: QListWidgetItem):
+        """Select a theme whose colors the editor already shows, without reloading them."""
+        with QSignalBlocker(self._theme_list):
+            self._theme_list.setCurrentItem(item)
+        theme_type, name = item.data(Qt.ItemDataRole.UserRole)
+        self._show_theme_state(theme_type, name)
+    
+    def _insert_custom_theme(self, name: str) -> Optional[QListWidgetItem]:
+        """Add a freshly saved custom theme to the list and return its entry."""
+        self._color_cache.pop(name, None)
+        if name not in self._theme_manager.get_custom_theme_names():
+            return None
+        item = self._name_to_item.get(name)
+        if item is None:
+            with QSignalBlocker(self._theme_list):
+                item = self._add_custom_item(name)
+        return item
     
     def _on_theme_selected(self, current, previous):
         """Handle theme selection change."""
@@ -279,17 +352,21 @@ class ThemeManagerWidget(QWidget):
             )
             if reply == QMessageBox.StandardButton.Save:
                 self._on_save_theme()
+                with QSignalBlocker(self._theme_list):
+                    self._theme_list.setCurrentItem(current)
             elif reply == QMessageBox.StandardButton.Cancel:
                 self._theme_list.setCurrentItem(previous)
                 return
         
         theme_type, name = current.data(Qt.ItemDataRole.UserRole)
+        self._theme_editor.set_colors(self._theme_colors(name))
+        self._show_theme_state(theme_type, name)
+    
+    def _show_theme_state(self, theme_type: str, name: str):
+        """Point the name field and buttons at a theme and mark it unmodified."""
         self._current_theme_name = name
         self._name_edit.setText(name)
         
-        colors = self._theme_manager.get_theme_colors(name)
-        self._theme_editor.set_colors(colors)
-        
         is_builtin = theme_type == "builtin"
         self._name_edit.setReadOnly(is_builtin)
         self._delete_btn.setEnabled(not is_builtin)
@@ -297,6 +374,13 @@ class ThemeManagerWidget(QWidget):
         
         self._is_modified = False
     
+    def _theme_colors(self, name: str) -> dict:
+        """Return a theme's colors, fetching them from the manager once."""
+        colors = self._color_cache.get(name)
+        if colors is None:
+            colors = self._color_cache[name] = self._theme_manager.get_theme_colors(name)
+        return colors
+    
     def _on_theme_modified(self):
         """Handle theme color modification."""
         self._is_modified = True
@@ -310,21 +394,16 @@ class ThemeManagerWidget(QWidget):
         base_name = "Custom Theme"
         name = base_name
         counter = 1
-        existing = self._theme_manager.get_custom_theme_names()
+        existing = set(self._theme_manager.get_custom_theme_names())
         while name in existing:
             counter += 1
             name = f"{base_name} {counter}"
         
         default_colors = self._theme_manager.get_theme_colors("Dark")
         self._theme_manager.save_custom_theme(name, default_colors)
-        self._load_themes()
-        
-        for i in range(self._theme_list.count()):
-            item = self._theme_list.item(i)
-            theme_type, theme_name = item.data(Qt.ItemDataRole.UserRole)
-            if theme_name == name:
-                self._theme_list.setCurrentItem(item)
-                break
+        item = self._insert_custom_theme(name)
+        if item is not None:
+            self._select_item(item)
     
     def _on_duplicate_theme(self):
         """Duplicate the current theme."""
@@ -334,24 +413,17 @@ class ThemeManagerWidget(QWidget):
         base_name = f"{self._current_theme_name} Copy"
         name = base_name
         counter = 1
-        existing = (
-            self._theme_manager.get_builtin_theme_names() +
-            self._theme_manager.get_custom_theme_names()
-        )
+        existing = set(self._theme_manager.get_builtin_theme_names())
+        existing.update(self._theme_manager.get_custom_theme_names())
         while name in existing:
             counter += 1
             name = f"{base_name} {counter}"
         
         colors = self._theme_editor.get_colors()
         self._theme_manager.save_custom_theme(name, colors)
-        self._load_themes()
-        
-        for i in range(self._theme_list.count()):
-            item = self._theme_list.item(i)
-            theme_type, theme_name = item.data(Qt.ItemDataRole.UserRole)
-            if theme_name == name:
-                self._theme_list.setCurrentItem(item)
-                break
+        item = self._insert_custom_theme(name)
+        if item is not None:
+            self._select_theme_silently(item)
     
     def _on_delete_theme(self):
         """Delete the current custom theme."""
@@ -375,8 +447,17 @@ class ThemeManagerWidget(QWidget):
         
         if reply == QMessageBox.StandardButton.Yes:
             self._theme_manager.delete_custom_theme(name)
+            self._color_cache.pop(name, None)
             self._is_modified = False
-            self._load_themes()
+            with QSignalBlocker(self._theme_list):
+                self._theme_list.takeItem(self._theme_list.row(current))
+            if self._name_to_item.get(name) is current:
+                del self._name_to_item[name]
+            item = self._name_to_item.get(self._theme_manager.current_theme_name)
+            if item is None:
+                item = self._theme_list.currentItem()
+            if item is not None:
+                self._select_item(item)
     
     def _on_save_theme(self):
         """Save the current theme."""
@@ -403,16 +484,28 @@ class ThemeManagerWidget(QWidget):
             self._theme_manager.delete_custom_theme(old_name)
         
         self._theme_manager.save_custom_theme(new_name, colors)
+        self._color_cache.pop(old_name, None)
+        self._color_cache.pop(new_name, None)
         self._current_theme_name = new_name
         self._is_modified = False
-        self._load_themes()
-        
-        for i in range(self._theme_list.count()):
-            item = self._theme_list.item(i)
-            theme_type, theme_name = item.data(Qt.ItemDataRole.UserRole)
-            if theme_name == new_name:
-                self._theme_list.setCurrentItem(item)
-                break
+        if old_name != new_name:
+            self._rename_item(current, old_name, new_name)
+        self._select_theme_silently(current)
+    
+    def _rename_item(self, item: QListWidgetItem, old_name: str, new_name: str):
+        """Relabel a custom theme entry in place, dropping any entry it replaces."""
+        with QSignalBlocker(self._theme_list):
+            other = self._name_to_item.get(new_name)
+            if other is not None and other is not item:
+                other_type, _ = other.data(Qt.ItemDataRole.UserRole)
+                if other_type == "custom":
+                    self._theme_list.takeItem(self._theme_list.row(other))
+                    del self._name_to_item[new_name]
+            if self._name_to_item.get(old_name) is item:
+                del self._name_to_item[old_name]
+            item.setText(f"✏️ {new_name}")
+            item.setData(Qt.ItemDataRole.UserRole, ("custom", new_name))
+            self._name_to_item.setdefault(new_name, item)
     
     def _on_apply_theme(self):
         """Apply the currently selected theme."""
@@ -446,6 +539,12 @@ class FontManagerWidget(QWidget):
         super().__init__(parent)
         self._editor_bg = "#1e1e1e"
         self._editor_text = "#d4d4d4"
+        self._current_font = QFont("Monospace")
+        # Rapid size/family changes are coalesced into one preview update
+        self._preview_timer = QTimer(self)
+        self._preview_timer.setSingleShot(True)
+        self._preview_timer.setInterval(0)
+        self._preview_timer.timeout.connect(self._update_preview)
         self._setup_ui()
     
     def set_theme_colors(self, editor_bg: str, editor_text: str):
@@ -456,29 +555,7 @@ class FontManagerWidget(QWidget):
     
     def _apply_theme_style(self):
         """Apply theme colors to widgets."""
-        self._preview_text.setStyleSheet(f"""
-            QTextEdit {{
-                background-color: {self._editor_bg};
-                color: {self._editor_text};
-                border: 1px solid {self._editor_text}40;
-                border-radius: 4px;
-            }}
-        """)
-        
-        self.setStyleSheet(f"""
-            QGroupBox {{
-                color: {self._editor_text};
-            }}
-            QGroupBox::title {{
-                color: {self._editor_text};
-            }}
-            QRadioButton {{
-                color: {self._editor_text};
-            }}
-            QLabel {{
-                color: {self._editor_text};
-            }}
-        """)
+        self.setStyleSheet(_font_manager_qss(self._editor_bg, self._editor_text))
     
     def _setup_ui(self):
         layout = QVBoxLayout(self)
@@ -486,16 +563,22 @@ class FontManagerWidget(QWidget):
         
         font_group = QGroupBox("Font Selection")
         font_layout = QFormLayout(font_group)
-        
-        self._font_combo = QFontComboBox()
-        self._font_combo.setCurrentFont(QFont("Monospace"))
-        self._font_combo.currentFontChanged.connect(self._update_preview)
-        font_layout.addRow("Font Family:", self._font_combo)
+        self._font_layout = font_layout
+        
+        # QFontComboBox enumerates the whole font database on construction,
+        # so a placeholder holds its row until the database has been warmed
+        # on a worker thread after the widget is first shown.
+        self._font_combo: Optional[QFontComboBox] = None
+        self._font_worker: Optional[IOWorker] = None
+        self._font_placeholder = QComboBox()
+        self._font_placeholder.addItem("Loading fonts…")
+        self._font_placeholder.setEnabled(False)
+        font_layout.addRow("Font Family:", self._font_placeholder)
         
         self._size_spin = QSpinBox()
         self._size_spin.setRange(6, 72)
         self._size_spin.setValue(12)
-        self._size_spin.valueChanged.connect(self._update_preview)
+        self._size_spin.valueChanged.connect(self._on_size_changed)
         font_layout.addRow("Font Size:", self._size_spin)
         
         layout.addWidget(font_group)
@@ -504,6 +587,7 @@ class FontManagerWidget(QWidget):
         preview_layout = QVBoxLayout(preview_group)
         
         self._preview_text = QTextEdit()
+        self._preview_text.setObjectName("fontPreview")
         self._preview_text.setPlainText(
             "The quick brown fox jumps over the lazy dog.\n"
             "ABCDEFGHIJKLMNOPQRSTUVWXYZ\n"
@@ -544,26 +628,66 @@ class FontManagerWidget(QWidget):
         layout.addLayout(btn_layout)
         layout.addStretch()
         
+        self._rebuild_current_font()
         self._update_preview()
     
+    def showEvent(self, event):
+        """Build the font combo box once the widget has been painted."""
+        super().showEvent(event)
+        if self._font_combo is None and self._font_worker is None:
+            self._font_worker = IOWorker(QFontDatabase.families, on_error=lambda e: [])
+            self._font_worker.signals.finished.connect(self._on_fonts_loaded)
+            QThreadPool.globalInstance().start(self._font_worker)
+    
+    def _on_fonts_loaded(self, families: list):
+        """Swap in the real font combo once the font database is warm."""
+        self._font_worker = None
+        self._ensure_font_combo()
+    
+    def _ensure_font_combo(self) -> QFontComboBox:
+        """Create the font combo box on first use and return it."""
+        if self._font_combo is None:
+            combo = QFontComboBox()
+            combo.setCurrentFont(QFont("Monospace"))
+            combo.currentFontChanged.connect(self._on_family_changed)
+            self._font_layout.replaceWidget(self._font_placeholder, combo)
+            self._font_placeholder.deleteLater()
+            self._font_placeholder = None
+            self._font_combo = combo
+            self._rebuild_current_font()
+        return self._font_combo
+    
+    def _rebuild_current_font(self):
+        """Rebuild the selected font from the family combo and size spinner."""
+        if self._font_combo is None:
+            font = QFont("Monospace")
+        else:
+            font = self._font_combo.currentFont()
+        font.setPointSize(self._size_spin.value())
+        self._current_font = font
+    
+    def _on_family_changed(self, font: QFont):
+        """Handle a new family being picked in the combo box."""
+        self._rebuild_current_font()
+        self._preview_timer.start()
+    
+    def _on_size_changed(self, size: int):
+        """Handle a new point size from the spinner."""
+        self._current_font.setPointSize(size)
+        self._preview_timer.start()
+    
     def _update_preview(self):
         """Update the preview text with the selected font."""
-        font = self._font_combo.currentFont()
-        font.setPointSize(self._size_spin.value())
-        self._preview_text.setFont(font)
+        self._preview_text.setFont(self._current_font)
     
     def _on_apply_font(self):
         """Emit signal to apply font."""
-        font = self._font_combo.currentFont()
-        font.setPointSize(self._size_spin.value())
         apply_to_selection = self._apply_selection_radio.isChecked()
-        self.font_apply_requested.emit(font, apply_to_selection)
+        self.font_apply_requested.emit(QFont(self._current_font), apply_to_selection)
     
     def get_current_font(self) -> QFont:
         """Get the currently selected font."""
-        font = self._font_combo.currentFont()
-        font.setPointSize(self._size_spin.value())
-        return font
+        return QFont(self._current_font)
     
     def is_selection_mode(self) -> bool:
         """Check if applying to selection only."""
@@ -578,6 +702,7 @@ class SettingsDialog(QDialog):
     def __init__(self, theme_manager, parent=None):
         super().__init__(parent)
         self._theme_manager = theme_manager
+        self._theme_widget: Optional[ThemeManagerWidget] = None
         self._setup_ui()
     
     def _setup_ui(self):
@@ -587,10 +712,6 @@ class SettingsDialog(QDialog):
         
         layout = QVBoxLayout(self)
         
-        theme_widget = ThemeManagerWidget(self._theme_manager)
-        theme_widget.theme_applied.connect(self._on_theme_applied)
-        layout.addWidget(theme_widget)
-        
         btn_layout = QHBoxLayout()
         btn_layout.addStretch()
         
@@ -600,6 +721,19 @@ class SettingsDialog(QDialog):
         
         layout.addLayout(btn_layout)
     
+    def showEvent(self, event):
+        """Build the theme editor the first time the dialog is shown."""
+        self._ensure_theme_widget()
+        super().showEvent(event)
+    
+    def _ensure_theme_widget(self) -> ThemeManagerWidget:
+        """Create the theme manager widget on first use and return it."""
+        if self._theme_widget is None:
+            self._theme_widget = ThemeManagerWidget(self._theme_manager)
+            self._theme_widget.theme_applied.connect(self._on_theme_applied)
+            self.layout().insertWidget(0, self._theme_widget)
+        return self._theme_widget
+    
     def _on_theme_applied(self, theme_name: str):
         """Handle theme application."""
         self.theme_changed.emit(theme_name)
@@ -613,8 +747,8 @@ class FontManagerDialog(QDialog):
     def __init__(self, theme_manager, parent=None):
         super().__init__(parent)
         self._theme_manager = theme_manager
+        self._font_widget: Optional[FontManagerWidget] = None
         self._setup_ui()
-        self._apply_theme_colors()
     
     def _setup_ui(self):
         self.setWindowTitle("Font Manager")
@@ -623,10 +757,6 @@ class FontManagerDialog(QDialog):
         
         layout = QVBoxLayout(self)
         
-        self._font_widget = FontManagerWidget()
-        self._font_widget.font_apply_requested.connect(self._on_font_apply)
-        layout.addWidget(self._font_widget)
-        
         btn_layout = QHBoxLayout()
         btn_layout.addStretch()
         
@@ -636,6 +766,20 @@ class FontManagerDialog(QDialog):
         
         layout.addLayout(btn_layout)
     
+    def showEvent(self, event):
+        """Build the font widget the first time the dialog is shown."""
+        self._ensure_font_widget()
+        super().showEvent(event)
+    
+    def _ensure_font_widget(self) -> FontManagerWidget:
+        """Create the font manager widget on first use and return it."""
+        if self._font_widget is None:
+            self._font_widget = FontManagerWidget()
+            self._font_widget.font_apply_requested.connect(self._on_font_apply)
+            self.layout().insertWidget(0, self._font_widget)
+            self._apply_theme_colors()
+        return self._font_widget
+    
     def _apply_theme_colors(self):
         """Apply theme colors to the font widget."""
         colors = self._theme_manager.get_theme_colors(
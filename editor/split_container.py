@@ -5,8 +5,12 @@ Manages one or two editor panes in a horizontal split layout.
 Handles drag-to-edge splitting and merging.
 """
 
+from contextlib import contextmanager
+from functools import partial
 from typing import Optional
-from PySide6.QtWidgets import QWidget, QHBoxLayout, QSplitter, QRubberBand, QMessageBox
+from PySide6.QtWidgets import (
+    QWidget, QHBoxLayout, QSplitter, QRubberBand, QMessageBox, QPlainTextEdit
+)
 from PySide6.QtCore import Signal, Qt, QPoint, QRect, QSize
 
 from editor.document import Document
@@ -27,24 +31,35 @@ class SplitContainer(QWidget):
     """
     
     EDGE_THRESHOLD = 0.5  # 50% - left half creates left split, right half creates right split
+    DRAG_INTERVAL = 8  # px the pointer must travel before a drag move is re-evaluated
     
-    active_document_changed = Signal(object)
-    document_modified = Signal(object, bool)
+    active_document_changed = Signal(Document)
+    document_modified = Signal(Document, bool)
     layout_changed = Signal()
     split_swapped = Signal()
     close_app_requested = Signal()
-    save_document_requested = Signal(object, int, object)  # document, tab_index, pane
+    save_document_requested = Signal(Document, int, object)  # document, tab_index, pane
     
     def __init__(self, parent=None):
         super().__init__(parent)
         
         self._panes: list[EditorPane] = []
+        self._doc_to_pane: dict[Document, EditorPane] = {}
         self._active_pane: Optional[EditorPane] = None
         self._dragging_tab_index: int = -1
         self._dragging_source_pane: Optional[EditorPane] = None
         self._file_handler = FileHandler()
         
         self._drop_indicator = QRubberBand(QRubberBand.Shape.Rectangle, self)
+        # Edge the indicator currently covers, None while it is hidden
+        self._indicator_edge: Optional[str] = None
+        self._last_drag_x: int = -9999
+        # Split midpoint and indicator rects per edge, cached for the current drag
+        self._drag_mid: Optional[int] = None
+        self._drag_rects: dict[str, QRect] = {"left": QRect(), "right": QRect()}
+        # Coalesced emissions held while a multi-step pane operation runs
+        self._signal_suspend_depth: int = 0
+        self._pending_signals: dict[str, tuple] = {}
         
         self._setup_ui()
         self._create_initial_pane()
@@ -66,27 +81,40 @@ class SplitContainer(QWidget):
         pane.add_new_document()
         self._active_pane = pane
     
-    def _create_pane(self) -> EditorPane:
-        """Create and configure a new editor pane."""
+    def _create_pane(self, index: int = -1) -> EditorPane:
+        """Create and configure a new editor pane at index, or last if negative."""
         pane = EditorPane(self)
+        self._wire_pane(pane)
         
+        if index < 0:
+            self._panes.append(pane)
+            self._splitter.addWidget(pane)
+        else:
+            self._panes.insert(index, pane)
+            self._splitter.insertWidget(index, pane)
+        
+        return pane
+    
+    def _wire_pane(self, pane: EditorPane):
+        """Connect a new pane's signals to the container."""
         pane.document_changed.connect(self._on_document_changed)
         pane.document_modified.connect(self._on_document_modified)
         pane.pane_empty.connect(self._on_pane_empty)
         pane.tab_drag_started.connect(self._on_tab_drag_started)
         pane.close_tab_requested.connect(self._on_close_tab_requested)
-        
-        pane.tab_bar.dropEvent = lambda e: self._handle_tab_bar_drop(pane, e)
-        
-        self._panes.append(pane)
-        self._splitter.addWidget(pane)
-        
-        return pane
+        pane.document_added.connect(self._on_pane_document_added)
+        pane.document_removed.connect(self._on_pane_document_removed)
+        pane.tab_bar.tab_dropped.connect(
+            partial(self._handle_tab_bar_drop, pane), Qt.ConnectionType.DirectConnection
+        )
     
     def _remove_pane(self, pane: EditorPane):
         """Remove a pane from the container."""
         if pane in self._panes:
             self._panes.remove(pane)
+            self._doc_to_pane = {
+                doc: owner for doc, owner in self._doc_to_pane.items() if owner is not pane
+            }
             pane.setParent(None)
             pane.deleteLater()
             
@@ -94,7 +122,27 @@ class SplitContainer(QWidget):
                 self._active_pane = self._panes[0]
                 self._active_pane.focus_editor()
             
-            self.layout_changed.emit()
+            self._emit("layout_changed")
+    
+    @contextmanager
+    def _suspend_signals(self):
+        """Emit layout and active-document signals once, when the operation ends."""
+        self._signal_suspend_depth += 1
+        try:
+            yield
+        finally:
+            self._signal_suspend_depth -= 1
+            if not self._signal_suspend_depth:
+                pending, self._pending_signals = self._pending_signals, {}
+                for name, args in pending.items():
+                    getattr(self, name).emit(*args)
+    
+    def _emit(self, name: str, *args):
+        """Emit a signal now, or queue its latest arguments while suspended."""
+        if self._signal_suspend_depth:
+            self._pending_signals[name] = args
+        else:
+            getattr(self, name).emit(*args)
     
     @property
     def is_split(self) -> bool:
@@ -113,13 +161,20 @@ class SplitContainer(QWidget):
             return self._active_pane.current_document
         return None
     
+    @property
+    def editors(self) -> list[QPlainTextEdit]:
+        """Get the editor widget of every pane, in pane order."""
+        return [pane.editor for pane in self._panes]
+    
     @property
     def all_documents(self) -> list[Document]:
         """Get all documents from all panes."""
-        docs = []
-        for pane in self._panes:
-            docs.extend(pane.documents)
-        return docs
+        return [doc for pane in self._panes for doc in pane.iter_documents()]
+    
+    @property
+    def modified_documents(self) -> list[Document]:
+        """Get documents with unsaved changes, in pane and tab order."""
+        return [doc for pane in self._panes for doc in pane.iter_documents() if doc.is_modified]
     
     def add_document(self, document: Document):
         """Add a document to the active pane."""
@@ -167,40 +222,27 @@ class SplitContainer(QWidget):
         if source_pane.document_count <= 1:
             return False
         
-        source_pane.sync_from_editor()
-        source_pane.remove_document(document)
-        
-        new_pane = EditorPane(self)
-        new_pane.document_changed.connect(self._on_document_changed)
-        new_pane.document_modified.connect(self._on_document_modified)
-        new_pane.pane_empty.connect(self._on_pane_empty)
-        new_pane.tab_drag_started.connect(self._on_tab_drag_started)
-        new_pane.close_tab_requested.connect(self._on_close_tab_requested)
-        new_pane.tab_bar.dropEvent = lambda e: self._handle_tab_bar_drop(new_pane, e)
-        
-        if edge == "left":
-            self._splitter.insertWidget(0, new_pane)
-            self._panes.insert(0, new_pane)
-        else:
-            self._splitter.addWidget(new_pane)
-            self._panes.append(new_pane)
-        
-        new_pane.add_document(document)
-        self._active_pane = new_pane
-        new_pane.focus_editor()
-        
-        colors = ThemeManager().get_line_number_colors()
-        new_pane.set_line_number_colors(
-            colors["bg"],
-            colors["text"],
-            colors["current_line"],
-            colors["current_line_bg"]
-        )
-        
-        sizes = [self.width() // 2, self.width() // 2]
-        self._splitter.setSizes(sizes)
-        
-        self.layout_changed.emit()
+        with self._suspend_signals():
+            source_pane.sync_from_editor()
+            source_pane.remove_document(document)
+            
+            new_pane = self._create_pane(0 if edge == "left" else -1)
+            new_pane.add_document(document)
+            self._active_pane = new_pane
+            new_pane.focus_editor()
+            
+            colors = ThemeManager().get_line_number_colors()
+            new_pane.set_line_number_colors(
+                colors["bg"],
+                colors["text"],
+                colors["current_line"],
+                colors["current_line_bg"]
+            )
+            
+            sizes = [self.width() // 2, self.width() // 2]
+            self._splitter.setSizes(sizes)
+            
+            self._emit("layout_changed")
         return True
     
     def merge_panes(self):
@@ -213,34 +255,44 @@ class SplitContainer(QWidget):
         
         source_pane.sync_from_editor()
         
-        for doc in source_pane.documents:
-            target_pane.add_document(doc, activate=False)
-        
-        self._remove_pane(source_pane)
-        self._active_pane = target_pane
-        target_pane.focus_editor()
+        with self._suspend_signals():
+            self._splitter.setUpdatesEnabled(False)
+            try:
+                target_pane.add_documents(source_pane.iter_documents())
+                
+                self._remove_pane(source_pane)
+            finally:
+                self._splitter.setUpdatesEnabled(True)
+            self._active_pane = target_pane
+            target_pane.focus_editor()
     
     def swap_panes(self):
         """Swap the left and right panes."""
         if not self.is_split:
             return
         
-        self._panes[0].sync_from_editor()
-        self._panes[1].sync_from_editor()
-        
-        left_pane = self._panes[0]
-        right_pane = self._panes[1]
-        
-        self._splitter.insertWidget(0, right_pane)
-        
-        self._panes = [right_pane, left_pane]
-        
-        sizes = self._splitter.sizes()
-        if len(sizes) == 2:
-            self._splitter.setSizes([sizes[1], sizes[0]])
-        
-        self.split_swapped.emit()
-        self.layout_changed.emit()
+        with self._suspend_signals():
+            self._panes[0].sync_from_editor()
+            self._panes[1].sync_from_editor()
+            
+            left_pane = self._panes[0]
+            right_pane = self._panes[1]
+            
+            # Reorder and resize as one repaint of the splitter and both panes
+            self._splitter.setUpdatesEnabled(False)
+            try:
+                self._splitter.insertWidget(0, right_pane)
+                
+                self._panes = [right_pane, left_pane]
+                
+                sizes = self._splitter.sizes()
+                if len(sizes) == 2:
+                    self._splitter.setSizes([sizes[1], sizes[0]])
+            finally:
+                self._splitter.setUpdatesEnabled(True)
+            
+            self.split_swapped.emit()
+            self._emit("layout_changed")
     
     def transfer_document(self, document: Document, source_pane: EditorPane, 
                           target_pane: EditorPane, insert_index: int = -1):
@@ -250,24 +302,20 @@ class SplitContainer(QWidget):
         
         source_pane.sync_from_editor()
         
-        will_be_empty = source_pane.document_count <= 1
-        
-        source_pane.remove_document(document)
-        
-        if insert_index >= 0:
-            target_pane.insert_document(insert_index, document)
-        else:
-            target_pane.add_document(document)
-        
-        self._active_pane = target_pane
-        target_pane.focus_editor()
+        with self._suspend_signals():
+            source_pane.remove_document(document)
+            
+            if insert_index >= 0:
+                target_pane.insert_document(insert_index, document)
+            else:
+                target_pane.add_document(document)
+            
+            self._active_pane = target_pane
+            target_pane.focus_editor()
     
     def _get_pane_for_document(self, document: Document) -> Optional[EditorPane]:
         """Find which pane contains a document."""
-        for pane in self._panes:
-            if document in pane.documents:
-                return pane
-        return None
+        return self._doc_to_pane.get(document)
     
     def get_pane_for_document(self, document: Document) -> Optional[EditorPane]:
         """Public method to find which pane contains a document."""
@@ -275,11 +323,19 @@ class SplitContainer(QWidget):
     
     def _on_document_changed(self, document: Document):
         """Handle document change in any pane."""
-        for pane in self._panes:
-            if document in pane.documents:
-                self._active_pane = pane
-                break
-        self.active_document_changed.emit(document)
+        pane = self._doc_to_pane.get(document)
+        if pane is not None:
+            self._active_pane = pane
+        self._emit("active_document_changed", document)
+    
+    def _on_pane_document_added(self, document: Document, pane: EditorPane):
+        """Index a document under the pane it was added to."""
+        self._doc_to_pane[document] = pane
+    
+    def _on_pane_document_removed(self, document: Document, pane: EditorPane):
+        """Drop a document from the index when its pane lets go of it."""
+        if self._doc_to_pane.get(document) is pane:
+            del self._doc_to_pane[document]
     
     def _on_document_modified(self, document: Document, modified: bool):
         """Handle document modification state change."""
@@ -328,7 +384,7 @@ class SplitContainer(QWidget):
                     self.save_document_requested.emit(doc, index, pane)
                     return
         
-        pane.remove_document_at(index)
+        pane.close_document(doc)
     
     def _on_tab_drag_started(self, tab_index: int, source_pane: EditorPane):
         """Track the tab being dragged for edge detection."""
@@ -342,21 +398,30 @@ class SplitContainer(QWidget):
             return
         
         source_bar = event.source()
-        if not isinstance(source_bar, EditorTabBar):
-            event.ignore()
-            return
-        
-        source_pane = None
-        for pane in self._panes:
-            if pane.tab_bar is source_bar:
-                source_pane = pane
-                break
+        dragging_pane = self._dragging_source_pane
+        if (dragging_pane is not None and source_bar is dragging_pane.tab_bar
+                and self._dragging_tab_index >= 0):
+            # tab_drag_started already reported the source, so skip the MIME payload
+            source_pane = dragging_pane
+            tab_index = self._dragging_tab_index
+        else:
+            if not isinstance(source_bar, EditorTabBar):
+                event.ignore()
+                return
+            
+            source_pane = None
+            for pane in self._panes:
+                if pane.tab_bar is source_bar:
+                    source_pane = pane
+                    break
+            tab_index = None
         
         if source_pane is None or source_pane is target_pane:
             event.ignore()
             return
         
-        tab_index = int(event.mimeData().data(EditorTabBar.MIME_TYPE).data().decode())
+        if tab_index is None:
+            tab_index = int(event.mimeData().data(EditorTabBar.MIME_TYPE).data().decode())
         document = source_pane.get_document_at(tab_index)
         
         if document is None:
@@ -366,14 +431,34 @@ class SplitContainer(QWidget):
         drop_index = target_pane.tab_bar.get_drop_index(event.position().toPoint())
         self.transfer_document(document, source_pane, target_pane, drop_index)
         event.acceptProposedAction()
+        self._reset_drag_state()
     
     def dragEnterEvent(self, event):
         """Accept tab drags for edge detection."""
         if event.mimeData().hasFormat(EditorTabBar.MIME_TYPE):
             event.acceptProposedAction()
+            self._cache_drag_geometry()
         else:
             event.ignore()
     
+    def resizeEvent(self, event):
+        """Keep the cached drag geometry in step with the container size."""
+        super().resizeEvent(event)
+        if self._drag_mid is not None:
+            self._cache_drag_geometry()
+            self._indicator_edge = None
+    
+    def _cache_drag_geometry(self):
+        """Cache the split midpoint and both drop indicator rects."""
+        width = self.width()
+        height = self.height()
+        half_width = width >> 1
+        # Matches x < width / 2 for integer x
+        self._drag_mid = (width + 1) >> 1
+        # The rects are reused across drags rather than rebuilt
+        self._drag_rects["left"].setRect(0, 0, half_width, height)
+        self._drag_rects["right"].setRect(half_width, 0, half_width, height)
+    
     def dragMoveEvent(self, event):
         """Show drop indicator at edges."""
         if not event.mimeData().hasFormat(EditorTabBar.MIME_TYPE):
@@ -383,27 +468,36 @@ class SplitContainer(QWidget):
         event.acceptProposedAction()
         
         pos = event.position().toPoint()
-        edge = self._get_edge(pos)
+        if abs(pos.x() - self._last_drag_x) < self.DRAG_INTERVAL:
+            return
+        self._last_drag_x = pos.x()
+        if self._drag_mid is None:
+            self._cache_drag_geometry()
+        # Inlined _get_edge against the cached midpoint
+        edge = "left" if pos.x() < self._drag_mid else "right"
         
-        if edge and not self.is_split and self._dragging_source_pane:
+        if not self.is_split and self._dragging_source_pane:
             if self._dragging_source_pane.document_count > 1:
-                half_width = self.width() // 2
-                if edge == "left":
-                    self._drop_indicator.setGeometry(0, 0, half_width, self.height())
-                else:
-                    self._drop_indicator.setGeometry(half_width, 0, half_width, self.height())
-                self._drop_indicator.show()
+                # Moves within the same half leave the indicator untouched
+                if edge != self._indicator_edge:
+                    self._drop_indicator.setGeometry(self._drag_rects[edge])
+                    self._drop_indicator.show()
+                    self._indicator_edge = edge
                 return
         
-        self._drop_indicator.hide()
+        # Nothing to hide unless a move showed the indicator
+        if self._indicator_edge is not None:
+            self._hide_drop_indicator()
     
     def dragLeaveEvent(self, event):
         """Hide drop indicator when drag leaves."""
-        self._drop_indicator.hide()
+        self._hide_drop_indicator()
+        self._last_drag_x = -9999
+        self._drag_mid = None
     
     def dropEvent(self, event):
         """Handle drop for split creation."""
-        self._drop_indicator.hide()
+        self._hide_drop_indicator()
         
         if not event.mimeData().hasFormat(EditorTabBar.MIME_TYPE):
             event.ignore()
@@ -431,14 +525,21 @@ class SplitContainer(QWidget):
         event.ignore()
         self._reset_drag_state()
     
+    def _hide_drop_indicator(self):
+        """Hide the drop indicator and forget the edge it covered."""
+        self._drop_indicator.hide()
+        self._indicator_edge = None
+    
     def _reset_drag_state(self):
         """Reset drag tracking state."""
         self._dragging_tab_index = -1
         self._dragging_source_pane = None
+        self._last_drag_x = -9999
+        self._drag_mid = None
     
     def _get_edge(self, pos: QPoint) -> Optional[str]:
         """Determine if position is in left or right half."""
-        mid = self.width() / 2
+        mid = self._drag_mid if self._drag_mid is not None else self.width() / 2
         if pos.x() < mid:
             return "left"
         else:
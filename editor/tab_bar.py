@@ -4,6 +4,9 @@ Custom Tab Bar with Drag Support
 Handles tab reordering and emits signals for split/merge operations.
 """
 
+from bisect import bisect_right
+from typing import Optional
+
 from PySide6.QtWidgets import QTabBar, QToolButton, QStylePainter, QStyleOptionTab, QStyle, QRubberBand
 from PySide6.QtCore import Signal, Qt, QPoint, QMimeData, QTimer, QSize
 from PySide6.QtGui import QDrag, QMouseEvent, QDragEnterEvent, QDragMoveEvent, QDropEvent, QColor, QPixmap
@@ -17,16 +20,20 @@ class EditorTabBar(QTabBar):
         new_tab_requested: Emitted when the "+" button is clicked
         tab_close_requested: Emitted when a tab close is requested
         external_drag_started: Emitted when tab is dragged outside the tab bar
+        tab_dropped: Emitted with the drop event when a tab from another bar is dropped
     """
     
     new_tab_requested = Signal()
     tab_close_requested = Signal(int)
     external_drag_started = Signal(int, QPoint)
+    tab_dropped = Signal(object)  # QDropEvent
     
     MIME_TYPE = "application/x-textedit-tab"
     
     def __init__(self, parent=None):
         super().__init__(parent)
+        # Set first: the setters below already trigger tabLayoutChange
+        self._pending_reposition = False
         
         self._drag_start_pos: QPoint | None = None
         self._drag_tab_index: int = -1
@@ -39,6 +46,12 @@ class EditorTabBar(QTabBar):
         self.setDocumentMode(True)
         
         self._modified_tabs: set[int] = set()
+        # Horizontal tab centers in tab order, relative to the first tab's left
+        # edge so scrolling the bar does not stale them; rebuilt after the
+        # layout changes
+        self._tab_centers: Optional[list[int]] = None
+        # Right edge of the last tab, rebuilt alongside the centers
+        self._last_tab_right: Optional[int] = None
         
         self._drop_indicator = QRubberBand(QRubberBand.Shape.Line, self)
         self._drop_indicator.setStyleSheet("background-color: #58a6ff;")
@@ -56,7 +69,8 @@ class EditorTabBar(QTabBar):
     def tabInserted(self, index: int):
         """Handle tab insertion - add custom close button."""
         super().tabInserted(index)
-        QTimer.singleShot(0, self._position_new_tab_button)
+        self._invalidate_tab_geometry()
+        self._schedule_reposition()
         self._add_close_button(index)
     
     def _add_close_button(self, index: int):
@@ -120,31 +134,52 @@ class EditorTabBar(QTabBar):
         self._new_tab_button.clicked.connect(self.new_tab_requested.emit)
         self._position_new_tab_button()
     
+    def _invalidate_tab_geometry(self):
+        """Drop cached tab positions after the tab layout changes."""
+        self._tab_centers = None
+        self._last_tab_right = None
+    
     def _position_new_tab_button(self):
         """Position the '+' button after the last tab."""
         if self.count() == 0:
             x = 4
         else:
-            last_tab_rect = self.tabRect(self.count() - 1)
-            x = last_tab_rect.right() + 4
+            if self._last_tab_right is None:
+                self._last_tab_right = self.tabRect(self.count() - 1).right()
+            x = self._last_tab_right + 4
         
         y = (self.height() - self._new_tab_button.height()) // 2
         self._new_tab_button.move(x, max(0, y))
     
+    def _schedule_reposition(self):
+        """Queue one '+' button reposition for however many tab changes follow."""
+        if self._pending_reposition:
+            return
+        self._pending_reposition = True
+        QTimer.singleShot(0, self._flush_reposition)
+    
+    def _flush_reposition(self):
+        """Run the queued '+' button reposition."""
+        self._pending_reposition = False
+        self._position_new_tab_button()
+    
     def resizeEvent(self, event):
         """Handle resize to reposition the '+' button."""
         super().resizeEvent(event)
+        self._invalidate_tab_geometry()
         self._position_new_tab_button()
     
     def tabRemoved(self, index: int):
         """Handle tab removal."""
         super().tabRemoved(index)
-        QTimer.singleShot(0, self._position_new_tab_button)
+        self._invalidate_tab_geometry()
+        self._schedule_reposition()
     
     def tabLayoutChange(self):
         """Handle tab layout changes."""
         super().tabLayoutChange()
-        QTimer.singleShot(0, self._position_new_tab_button)
+        self._invalidate_tab_geometry()
+        self._schedule_reposition()
     
     def mousePressEvent(self, event: QMouseEvent):
         """Track drag start position."""
@@ -244,11 +279,17 @@ class EditorTabBar(QTabBar):
             return
         
         event.acceptProposedAction()
+        # Receivers move the tab, and may still ignore() the event to refuse it
+        self.tab_dropped.emit(event)
     
     def get_drop_index(self, pos: QPoint) -> int:
         """Determine insertion index based on drop position."""
-        for i in range(self.count()):
-            rect = self.tabRect(i)
-            if pos.x() < rect.center().x():
-                return i
-        return self.count()
+        if self.count() == 0:
+            return 0
+        # The scroll buttons shift every tab rect without a layout change
+        origin = self.tabRect(0).left()
+        if self._tab_centers is None:
+            self._tab_centers = [self.tabRect(i).center().x() - origin
+                                 for i in range(self.count())]
+        # Index of the first tab whose center lies right of pos
+        return bisect_right(self._tab_centers, pos.x() - origin)
@@ -6,7 +6,9 @@ Provides dark and light themes for the application with custom theme support.
 
 import json
 import os
+import sys
 from enum import Enum
+from functools import lru_cache
 from typing import Optional
 from PySide6.QtWidgets import QApplication
 from PySide6.QtGui import QPalette, QColor
@@ -1283,17 +1285,74 @@ BUILTIN_THEME_COLORS = {
 }
 
 
+# Built-in theme display names by enum value, and the reverse lookup
+_BUILTIN_THEME_NAMES = {
+    Theme.DARK: "Dark",
+    Theme.LIGHT: "Light",
+    Theme.AQUAMARINE: "Aquamarine",
+    Theme.MIDNIGHT_BLUE: "Midnight Blue",
+}
+_BUILTIN_THEMES_BY_NAME = {name: theme for theme, name in _BUILTIN_THEME_NAMES.items()}
+
+
+def _intern_colors(colors: dict) -> dict:
+    """Return colors with its string values interned, so themes share them."""
+    return {key: sys.intern(value) if isinstance(value, str) else value
+            for key, value in colors.items()}
+
+
+# Fallbacks for any color a palette leaves out
+_DEFAULT_COLORS = {
+    "main_background": "#1e1e1e",
+    "menubar_background": "#2d2d2d",
+    "menubar_text": "#cccccc",
+    "border_color": "#3d3d3d",
+    "menu_hover": "#404040",
+    "menu_background": "#2d2d2d",
+    "menu_text": "#cccccc",
+    "accent_color": "#0078d4",
+    "tab_background": "#2d2d2d",
+    "tab_text": "#969696",
+    "tab_active_background": "#1e1e1e",
+    "tab_active_text": "#ffffff",
+    "editor_background": "#1e1e1e",
+    "editor_text": "#d4d4d4",
+    "selection_background": "#264f78",
+    "selection_text": "#ffffff",
+    "status_bar_background": "#007acc",
+    "status_bar_text": "#ffffff",
+    "scrollbar_background": "#1e1e1e",
+    "scrollbar_handle": "#5a5a5a",
+    "tree_background": "#252526",
+    "tree_text": "#cccccc",
+    "tree_selection": "#094771",
+}
+
+
 def generate_stylesheet_from_colors(colors: dict) -> str:
     """Generate a Qt stylesheet from color dictionary."""
+    color_items = tuple(sorted(colors.items()))
+    try:
+        return _generate_stylesheet(color_items)
+    except TypeError:
+        # Unhashable values (lists or objects in a custom theme's JSON) cannot
+        # key the cache; render them uncached as before
+        return _generate_stylesheet.__wrapped__(color_items)
+
+
+@lru_cache(maxsize=32)
+def _generate_stylesheet(color_items: tuple) -> str:
+    """Build the stylesheet for one palette, keyed by its sorted color items."""
+    colors = _DEFAULT_COLORS | dict(color_items)
     return f"""
 QMainWindow {{
-    background-color: {colors.get('main_background', '#1e1e1e')};
+    background-color: {colors['main_background']};
 }}
 
 QMenuBar {{
-    background-color: {colors.get('menubar_background', '#2d2d2d')};
-    color: {colors.get('menubar_text', '#cccccc')};
-    border-bottom: 1px solid {colors.get('border_color', '#3d3d3d')};
+    background-color: {colors['menubar_background']};
+    color: {colors['menubar_text']};
+    border-bottom: 1px solid {colors['border_color']};
     padding: 4px 0px;
 }}
 
@@ -1305,17 +1364,17 @@ QMenuBar::item {{
 }}
 
 QMenuBar::item:selected {{
-    background-color: {colors.get('menu_hover', '#404040')};
+    background-color: {colors['menu_hover']};
 }}
 
 QMenuBar::item:pressed {{
-    background-color: {colors.get('menu_hover', '#404040')};
+    background-color: {colors['menu_hover']};
 }}
 
 QMenu {{
-    background-color: {colors.get('menu_background', '#2d2d2d')};
-    color: {colors.get('menu_text', '#cccccc')};
-    border: 1px solid {colors.get('border_color', '#3d3d3d')};
+    background-color: {colors['menu_background']};
+    color: {colors['menu_text']};
+    border: 1px solid {colors['border_color']};
     border-radius: 8px;
     padding: 6px;
 }}
@@ -1327,12 +1386,12 @@ QMenu::item {{
 }}
 
 QMenu::item:selected {{
-    background-color: {colors.get('menu_hover', '#404040')};
+    background-color: {colors['menu_hover']};
 }}
 
 QMenu::separator {{
     height: 1px;
-    background-color: {colors.get('border_color', '#3d3d3d')};
+    background-color: {colors['border_color']};
     margin: 6px 8px;
 }}
 
@@ -1343,18 +1402,18 @@ QMenu::indicator {{
 }}
 
 QMenu::indicator:checked {{
-    background-color: {colors.get('accent_color', '#0078d4')};
+    background-color: {colors['accent_color']};
     border-radius: 3px;
 }}
 
 QTabBar {{
-    background-color: {colors.get('main_background', '#1e1e1e')};
+    background-color: {colors['main_background']};
     border: none;
 }}
 
 QTabBar::tab {{
-    background-color: {colors.get('tab_background', '#2d2d2d')};
-    color: {colors.get('tab_text', '#969696')};
+    background-color: {colors['tab_background']};
+    color: {colors['tab_text']};
     padding: 8px 16px 8px 24px;
     margin-right: 1px;
     border: none;
@@ -1363,14 +1422,14 @@ QTabBar::tab {{
 }}
 
 QTabBar::tab:selected {{
-    background-color: {colors.get('tab_active_background', '#1e1e1e')};
-    color: {colors.get('tab_active_text', '#ffffff')};
-    border-top: 2px solid {colors.get('accent_color', '#0078d4')};
+    background-color: {colors['tab_active_background']};
+    color: {colors['tab_active_text']};
+    border-top: 2px solid {colors['accent_color']};
 }}
 
 QTabBar::tab:hover:!selected {{
-    background-color: {colors.get('menu_hover', '#404040')};
-    color: {colors.get('menubar_text', '#cccccc')};
+    background-color: {colors['menu_hover']};
+    color: {colors['menubar_text']};
 }}
 
 QTabBar::close-button {{
@@ -1388,7 +1447,7 @@ QTabBar::close-button:hover {{
 
 QToolButton {{
     background-color: transparent;
-    color: {colors.get('menubar_text', '#cccccc')};
+    color: {colors['menubar_text']};
     border: none;
     border-radius: 4px;
     padding: 4px;
@@ -1397,27 +1456,27 @@ QToolButton {{
 }}
 
 QToolButton:hover {{
-    background-color: {colors.get('menu_hover', '#404040')};
+    background-color: {colors['menu_hover']};
 }}
 
 QToolButton:pressed {{
-    background-color: {colors.get('menu_hover', '#404040')};
+    background-color: {colors['menu_hover']};
 }}
 
 QPlainTextEdit {{
-    background-color: {colors.get('editor_background', '#1e1e1e')};
-    color: {colors.get('editor_text', '#d4d4d4')};
+    background-color: {colors['editor_background']};
+    color: {colors['editor_text']};
     border: none;
-    selection-background-color: {colors.get('selection_background', '#264f78')};
-    selection-color: {colors.get('selection_text', '#ffffff')};
+    selection-background-color: {colors['selection_background']};
+    selection-color: {colors['selection_text']};
     font-family: 'Consolas', 'Monaco', 'Courier New', monospace;
     font-size: 14px;
     padding: 8px;
 }}
 
 QStatusBar {{
-    background-color: {colors.get('status_bar_background', '#007acc')};
-    color: {colors.get('status_bar_text', '#ffffff')};
+    background-color: {colors['status_bar_background']};
+    color: {colors['status_bar_text']};
     border: none;
     padding: 0px;
     min-height: 24px;
@@ -1428,26 +1487,26 @@ QStatusBar::item {{
 }}
 
 QStatusBar QLabel {{
-    color: {colors.get('status_bar_text', '#ffffff')};
+    color: {colors['status_bar_text']};
     padding: 4px 12px;
     font-size: 12px;
 }}
 
 QScrollBar:vertical {{
-    background-color: {colors.get('scrollbar_background', '#1e1e1e')};
+    background-color: {colors['scrollbar_background']};
     width: 14px;
     border: none;
 }}
 
 QScrollBar::handle:vertical {{
-    background-color: {colors.get('scrollbar_handle', '#5a5a5a')};
+    background-color: {colors['scrollbar_handle']};
     min-height: 30px;
     border-radius: 7px;
     margin: 2px;
 }}
 
 QScrollBar::handle:vertical:hover {{
-    background-color: {colors.get('accent_color', '#0078d4')};
+    background-color: {colors['accent_color']};
 }}
 
 QScrollBar::add-line:vertical,
@@ -1461,20 +1520,20 @@ QScrollBar::sub-page:vertical {{
 }}
 
 QScrollBar:horizontal {{
-    background-color: {colors.get('scrollbar_background', '#1e1e1e')};
+    background-color: {colors['scrollbar_background']};
     height: 14px;
     border: none;
 }}
 
 QScrollBar::handle:horizontal {{
-    background-color: {colors.get('scrollbar_handle', '#5a5a5a')};
+    background-color: {colors['scrollbar_handle']};
     min-width: 30px;
     border-radius: 7px;
     margin: 2px;
 }}
 
 QScrollBar::handle:horizontal:hover {{
-    background-color: {colors.get('accent_color', '#0078d4')};
+    background-color: {colors['accent_color']};
 }}
 
 QScrollBar::add-line:horizontal,
@@ -1488,16 +1547,16 @@ QScrollBar::sub-page:horizontal {{
 }}
 
 QMessageBox {{
-    background-color: {colors.get('menu_background', '#2d2d2d')};
+    background-color: {colors['menu_background']};
 }}
 
 QMessageBox QLabel {{
-    color: {colors.get('menu_text', '#cccccc')};
+    color: {colors['menu_text']};
 }}
 
 QMessageBox QPushButton {{
-    background-color: {colors.get('accent_color', '#0078d4')};
-    color: {colors.get('status_bar_text', '#ffffff')};
+    background-color: {colors['accent_color']};
+    color: {colors['status_bar_text']};
     border: none;
     border-radius: 4px;
     padding: 8px 20px;
@@ -1505,20 +1564,20 @@ QMessageBox QPushButton {{
 }}
 
 QMessageBox QPushButton:hover {{
-    background-color: {colors.get('accent_color', '#0078d4')};
+    background-color: {colors['accent_color']};
 }}
 
 QMessageBox QPushButton:pressed {{
-    background-color: {colors.get('accent_color', '#0078d4')};
+    background-color: {colors['accent_color']};
 }}
 
 QFileDialog {{
-    background-color: {colors.get('menu_background', '#2d2d2d')};
-    color: {colors.get('menu_text', '#cccccc')};
+    background-color: {colors['menu_background']};
+    color: {colors['menu_text']};
 }}
 
 QSplitter::handle {{
-    background-color: {colors.get('border_color', '#3d3d3d')};
+    background-color: {colors['border_color']};
 }}
 
 QSplitter::handle:horizontal {{
@@ -1530,12 +1589,12 @@ QSplitter::handle:vertical {{
 }}
 
 QSplitter::handle:hover {{
-    background-color: {colors.get('accent_color', '#0078d4')};
+    background-color: {colors['accent_color']};
 }}
 
 QTreeView {{
-    background-color: {colors.get('tree_background', '#252526')};
-    color: {colors.get('tree_text', '#cccccc')};
+    background-color: {colors['tree_background']};
+    color: {colors['tree_text']};
     border: none;
     outline: none;
 }}
@@ -1546,11 +1605,11 @@ QTreeView::item {{
 }}
 
 QTreeView::item:hover {{
-    background-color: {colors.get('menu_hover', '#404040')};
+    background-color: {colors['menu_hover']};
 }}
 
 QTreeView::item:selected {{
-    background-color: {colors.get('tree_selection', '#094771')};
+    background-color: {colors['tree_selection']};
     color: #ffffff;
 }}
 
@@ -1567,45 +1626,45 @@ QTreeView::branch:open:has-children:has-siblings {{
 }}
 
 QDialog {{
-    background-color: {colors.get('main_background', '#1e1e1e')};
+    background-color: {colors['main_background']};
 }}
 
 QLabel {{
-    color: {colors.get('editor_text', '#d4d4d4')};
+    color: {colors['editor_text']};
 }}
 
 QLineEdit {{
-    background-color: {colors.get('editor_background', '#1e1e1e')};
-    color: {colors.get('editor_text', '#d4d4d4')};
-    border: 1px solid {colors.get('border_color', '#3d3d3d')};
+    background-color: {colors['editor_background']};
+    color: {colors['editor_text']};
+    border: 1px solid {colors['border_color']};
     border-radius: 4px;
     padding: 6px;
 }}
 
 QLineEdit:focus {{
-    border: 1px solid {colors.get('accent_color', '#0078d4')};
+    border: 1px solid {colors['accent_color']};
 }}
 
 QPushButton {{
-    background-color: {colors.get('tab_background', '#2d2d2d')};
-    color: {colors.get('editor_text', '#d4d4d4')};
-    border: 1px solid {colors.get('border_color', '#3d3d3d')};
+    background-color: {colors['tab_background']};
+    color: {colors['editor_text']};
+    border: 1px solid {colors['border_color']};
     border-radius: 4px;
     padding: 8px 16px;
 }}
 
 QPushButton:hover {{
-    background-color: {colors.get('menu_hover', '#404040')};
+    background-color: {colors['menu_hover']};
 }}
 
 QPushButton:pressed {{
-    background-color: {colors.get('accent_color', '#0078d4')};
+    background-color: {colors['accent_color']};
 }}
 
 QListWidget {{
-    background-color: {colors.get('editor_background', '#1e1e1e')};
-    color: {colors.get('editor_text', '#d4d4d4')};
-    border: 1px solid {colors.get('border_color', '#3d3d3d')};
+    background-color: {colors['editor_background']};
+    color: {colors['editor_text']};
+    border: 1px solid {colors['border_color']};
     border-radius: 4px;
 }}
 
@@ -1614,17 +1673,17 @@ QListWidget::item {{
 }}
 
 QListWidget::item:selected {{
-    background-color: {colors.get('tree_selection', '#094771')};
+    background-color: {colors['tree_selection']};
     color: #ffffff;
 }}
 
 QListWidget::item:hover {{
-    background-color: {colors.get('menu_hover', '#404040')};
+    background-color: {colors['menu_hover']};
 }}
 
 QGroupBox {{
-    color: {colors.get('editor_text', '#d4d4d4')};
-    border: 1px solid {colors.get('border_color', '#3d3d3d')};
+    color: {colors['editor_text']};
+    border: 1px solid {colors['border_color']};
     border-radius: 4px;
     margin-top: 12px;
     padding-top: 8px;
@@ -1637,12 +1696,12 @@ QGroupBox::title {{
 }}
 
 QTabWidget::pane {{
-    border: 1px solid {colors.get('border_color', '#3d3d3d')};
-    background-color: {colors.get('main_background', '#1e1e1e')};
+    border: 1px solid {colors['border_color']};
+    background-color: {colors['main_background']};
 }}
 
 QScrollArea {{
-    background-color: {colors.get('main_background', '#1e1e1e')};
+    background-color: {colors['main_background']};
     border: none;
 }}
 """
@@ -1676,7 +1735,7 @@ class ThemeManager:
                         with open(theme_path, "r") as f:
                             theme_data = json.load(f)
                             name = theme_data.get("name", filename[:-5])
-                            self._custom_themes[name] = theme_data.get("colors", {})
+                            self._custom_themes[name] = _intern_colors(theme_data.get("colors", {}))
                     except (json.JSONDecodeError, IOError):
                         pass
     
@@ -1734,7 +1793,7 @@ class ThemeManager:
         try:
             with open(theme_path, "w") as f:
                 json.dump(theme_data, f, indent=2)
-            self._custom_themes[name] = colors
+            self._custom_themes[name] = _intern_colors(colors)
         except IOError:
             pass
     
@@ -1753,26 +1812,14 @@ class ThemeManager:
     
     def apply_theme(self, theme: Theme):
         """Apply a built-in theme to the application (legacy method)."""
-        theme_name_map = {
-            Theme.DARK: "Dark",
-            Theme.LIGHT: "Light",
-            Theme.AQUAMARINE: "Aquamarine",
-            Theme.MIDNIGHT_BLUE: "Midnight Blue",
-        }
-        name = theme_name_map.get(theme, "Dark")
+        name = _BUILTIN_THEME_NAMES.get(theme, "Dark")
         self.apply_theme_by_name(name)
     
     def apply_theme_by_name(self, name: str):
         """Apply a theme by name."""
         self._current_theme_name = name
         
-        name_to_enum = {
-            "Dark": Theme.DARK,
-            "Light": Theme.LIGHT,
-            "Aquamarine": Theme.AQUAMARINE,
-            "Midnight Blue": Theme.MIDNIGHT_BLUE,
-        }
-        self._current_theme = name_to_enum.get(name, Theme.CUSTOM)
+        self._current_theme = _BUILTIN_THEMES_BY_NAME.get(name, Theme.CUSTOM)
         
         colors = self.get_theme_colors(name)
         stylesheet = generate_stylesheet_from_colors(colors)
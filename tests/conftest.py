@@ -12,6 +12,16 @@ project_root = Path(__file__).parent.parent
 sys.path.insert(0, str(project_root))
 
 
+@pytest.fixture(scope="session")
+def qapp():
+    """Create a QApplication instance for the test session."""
+    from PySide6.QtWidgets import QApplication
+    app = QApplication.instance()
+    if app is None:
+        app = QApplication([])
+    yield app
+
+
 @pytest.fixture(autouse=True)
 def mock_drag_exec():
     """Automatically mock QDrag.exec() to prevent blocking during tests."""
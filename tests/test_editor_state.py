@@ -5,6 +5,7 @@ These tests use pytest-qt for Qt widget testing without user interaction.
 """
 
 import pytest
+from unittest.mock import patch
 from PySide6.QtWidgets import QApplication
 
 from editor.editor_widget import EditorWidget
@@ -274,6 +275,31 @@ class TestMemoryOptimization:
         pane._save_current_state()
         assert doc.html_content is not None
     
+    def test_unedited_rich_text_skips_html_regeneration(self, pane):
+        """Syncing an unedited rich document reuses its stored HTML."""
+        doc = Document(content="Hello world")
+        doc.has_rich_formatting = True
+        pane.add_document(doc)
+        pane.sync_from_editor()
+        stored = doc.html_content
+        
+        with patch.object(type(pane.editor.document()), 'toHtml') as mock_html:
+            pane.sync_from_editor()
+        mock_html.assert_not_called()
+        assert doc.html_content is stored
+    
+    def test_edited_rich_text_regenerates_html(self, pane):
+        """Edits since the last sync are captured in the HTML."""
+        doc = Document(content="Hello world")
+        doc.has_rich_formatting = True
+        pane.add_document(doc)
+        pane.sync_from_editor()
+        
+        pane.editor.insertPlainText("edited ")
+        pane.sync_from_editor()
+        
+        assert "edited" in doc.html_content
+    
     def test_has_rich_formatting_default_false(self):
         """New document should have has_rich_formatting=False."""
         doc = Document()
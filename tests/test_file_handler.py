@@ -67,6 +67,30 @@ class TestFileHandlerRead:
         assert result.success is True
         assert result.content == test_content
 
+    
+    def test_read_does_not_stat_first(self, tmp_path, monkeypatch):
+        """Reading goes straight to the file without exists()/stat() probes."""
+        test_file = tmp_path / "direct.txt"
+        test_file.write_text("direct", encoding="utf-8")
+        
+        def fail(*args, **kwargs):
+            raise AssertionError("unexpected probe")
+        
+        monkeypatch.setattr(Path, "exists", fail)
+        monkeypatch.setattr(Path, "stat", fail)
+        
+        result = FileHandler.read_file(str(test_file))
+        
+        assert result.success is True
+        assert result.content == "direct"
+    
+    def test_read_directory_is_read_error(self, tmp_path):
+        """Reading a directory reports READ_ERROR, not NOT_FOUND."""
+        result = FileHandler.read_file(str(tmp_path))
+        
+        assert result.success is False
+        assert result.error in (FileError.READ_ERROR, FileError.PERMISSION_ERROR)
+
 
 class TestFileHandlerWrite:
     """Tests for FileHandler.write_file()"""
@@ -10,7 +10,7 @@ from unittest.mock import patch, MagicMock
 import pytest
 from PySide6.QtCore import Qt, QModelIndex, QPoint
 from PySide6.QtGui import QMouseEvent
-from PySide6.QtWidgets import QApplication
+from PySide6.QtWidgets import QApplication, QFileDialog
 
 from editor.file_tree import FileTree, FileTreeView, CollapsibleSidebar
 
@@ -240,6 +240,17 @@ class TestFileTreeInteractions:
                 assert tree.root_path == str(Path(tmpdir).resolve())
         tree.deleteLater()
     
+    def test_on_open_folder_uses_qt_dialog(self, qapp):
+        """The folder picker is Qt's non-native, directories-only dialog."""
+        tree = FileTree()
+        with patch('editor.file_tree.QFileDialog.getExistingDirectory',
+                   return_value='') as mock_dialog:
+            tree._on_open_folder()
+        options = mock_dialog.call_args.args[3]
+        assert options & QFileDialog.Option.DontUseNativeDialog
+        assert options & QFileDialog.Option.ShowDirsOnly
+        tree.deleteLater()
+    
     def test_on_open_folder_with_no_selection(self, qapp):
         """_on_open_folder with empty dialog result does nothing."""
         tree = FileTree()
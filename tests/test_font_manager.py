@@ -3,10 +3,12 @@ Tests for the FontManagerWidget in settings_dialog.
 """
 
 import pytest
-from PySide6.QtWidgets import QApplication
+from unittest.mock import patch
+from PySide6.QtWidgets import QApplication, QFormLayout
 from PySide6.QtGui import QFont
+from PySide6.QtCore import QThreadPool
 
-from editor.settings_dialog import FontManagerWidget, FontManagerDialog
+from editor.settings_dialog import FontManagerWidget, FontManagerDialog, _font_manager_qss
 from editor.theme_manager import ThemeManager
 
 
@@ -32,7 +34,9 @@ def font_dialog(qapp):
     """Create a fresh FontManagerDialog for each test."""
     theme_manager = ThemeManager()
     dialog = FontManagerDialog(theme_manager)
+    dialog.show()
     yield dialog
+    dialog.hide()
     dialog.deleteLater()
 
 
@@ -44,8 +48,48 @@ class TestFontManagerWidgetCreation:
         assert font_widget is not None
     
     def test_has_font_combo(self, font_widget):
-        """Widget has a font combo box."""
+        """Widget swaps in its font combo box once fonts load after first show."""
+        assert font_widget._font_combo is None
+        placeholder = font_widget._font_placeholder
+        assert not placeholder.isEnabled()
+        assert placeholder.currentText() == "Loading fonts…"
+        with patch('editor.settings_dialog.QThreadPool.globalInstance') as mock_pool:
+            font_widget.show()
+        mock_pool.return_value.start.assert_called_once_with(font_widget._font_worker)
+        font_widget._on_fonts_loaded([])
+        combo = font_widget._font_combo
+        assert combo is not None
+        assert font_widget._font_worker is None
+        assert font_widget._font_layout.itemAt(0, QFormLayout.ItemRole.FieldRole).widget() is combo
+        assert font_widget._font_layout.rowCount() == 2
+        assert font_widget._ensure_font_combo() is combo
+        font_widget.hide()
+
+    def test_fonts_warmed_off_gui_thread(self, font_widget, qapp):
+        """The font database is enumerated on the thread pool, then the combo is built."""
+        font_widget.show()
+        QThreadPool.globalInstance().waitForDone()
+        qapp.processEvents()
         assert font_widget._font_combo is not None
+        assert font_widget._font_placeholder is None
+        font_widget.hide()
+
+    def test_show_starts_one_font_load(self, font_widget):
+        """Re-showing while fonts are loading does not start another worker."""
+        with patch('editor.settings_dialog.QThreadPool.globalInstance') as mock_pool:
+            font_widget.show()
+            font_widget.hide()
+            font_widget.show()
+        mock_pool.return_value.start.assert_called_once()
+        font_widget.hide()
+    
+    def test_current_font_before_combo_built(self, font_widget):
+        """The default family is reported before the combo exists."""
+        font_widget._size_spin.setValue(20)
+        font = font_widget.get_current_font()
+        assert font_widget._font_combo is None
+        assert font.family() == QFont("Monospace").family()
+        assert font.pointSize() == 20
     
     def test_has_size_spinner(self, font_widget):
         """Widget has a size spin box."""
@@ -120,9 +164,38 @@ class TestFontPreview:
         """Preview updates when font changes."""
         original_font = font_widget._preview_text.font()
         font_widget._size_spin.setValue(24)
+        assert font_widget._preview_timer.isActive()
+        font_widget._preview_timer.stop()
+        font_widget._preview_timer.timeout.emit()
         new_font = font_widget._preview_text.font()
         assert new_font.pointSize() == 24
 
+    def test_rapid_size_changes_coalesce_preview(self, font_widget):
+        """Several size changes before the timer fires update the preview once."""
+        with patch.object(font_widget._preview_text, 'setFont') as mock_set:
+            for size in (13, 14, 15, 16):
+                font_widget._size_spin.setValue(size)
+            mock_set.assert_not_called()
+            font_widget._preview_timer.stop()
+            font_widget._preview_timer.timeout.emit()
+        mock_set.assert_called_once()
+        assert mock_set.call_args[0][0].pointSize() == 16
+
+    def test_family_change_rebuilds_current_font(self, font_widget):
+        """Picking a family keeps the spinner's point size."""
+        font_widget._size_spin.setValue(19)
+        combo = font_widget._ensure_font_combo()
+        combo.setCurrentFont(QFont("Serif"))
+        font = font_widget.get_current_font()
+        assert font.family() == combo.currentFont().family()
+        assert font.pointSize() == 19
+
+    def test_current_font_returned_as_copy(self, font_widget):
+        """Callers cannot mutate the widget's font through the returned value."""
+        font = font_widget.get_current_font()
+        font.setPointSize(40)
+        assert font_widget.get_current_font().pointSize() == 12
+
 
 class TestFontSignals:
     """Tests for font apply signal."""
@@ -183,9 +256,28 @@ class TestFontThemeIntegration:
     def test_preview_style_applied(self, font_widget):
         """Preview has stylesheet applied."""
         font_widget.set_theme_colors("#1a2f2f", "#e0f0f0")
-        style = font_widget._preview_text.styleSheet()
+        style = font_widget.styleSheet()
+        assert "QTextEdit#fontPreview" in style
         assert "#1a2f2f" in style
         assert "#e0f0f0" in style
+        assert font_widget._preview_text.objectName() == "fontPreview"
+
+    def test_theme_style_set_once_on_widget(self, font_widget):
+        """A theme change applies a single stylesheet on the widget itself."""
+        with patch.object(font_widget, 'setStyleSheet') as mock_widget, \
+                patch.object(font_widget._preview_text, 'setStyleSheet') as mock_preview:
+            font_widget.set_theme_colors("#202020", "#e0e0e0")
+        mock_widget.assert_called_once_with(_font_manager_qss("#202020", "#e0e0e0"))
+        mock_preview.assert_not_called()
+    
+    def test_theme_round_trip_reuses_stylesheets(self, font_widget):
+        """Switching back to a theme reuses its cached stylesheets."""
+        font_widget.set_theme_colors("#101010", "#f0f0f0")
+        first = font_widget.styleSheet()
+        font_widget.set_theme_colors("#ffffff", "#000000")
+        font_widget.set_theme_colors("#101010", "#f0f0f0")
+        assert font_widget.styleSheet() == first
+        assert _font_manager_qss("#101010", "#f0f0f0") is _font_manager_qss("#101010", "#f0f0f0")
 
 
 class TestFontManagerDialog:
@@ -199,6 +291,19 @@ class TestFontManagerDialog:
         """Dialog has a font widget."""
         assert font_dialog._font_widget is not None
     
+    def test_font_widget_built_on_first_show(self, qapp):
+        """The font widget is only constructed when the dialog is shown."""
+        dialog = FontManagerDialog(ThemeManager())
+        assert dialog._font_widget is None
+        dialog.show()
+        widget = dialog._font_widget
+        assert widget is not None
+        dialog.hide()
+        dialog.show()
+        assert dialog._font_widget is widget
+        dialog.hide()
+        dialog.deleteLater()
+    
     def test_has_theme_manager(self, font_dialog):
         """Dialog has a theme manager."""
         assert font_dialog._theme_manager is not None
@@ -224,5 +329,5 @@ class TestFontManagerDialog:
     
     def test_theme_colors_applied(self, font_dialog):
         """Theme colors are applied to font widget."""
-        style = font_dialog._font_widget._preview_text.styleSheet()
-        assert len(style) > 0
+        style = font_dialog._font_widget.styleSheet()
+        assert "QTextEdit#fontPreview" in style
@@ -44,9 +44,19 @@ class TestFontMiniToolbarCreation:
         """Toolbar can be created."""
         assert toolbar is not None
     
-    def test_has_font_combo(self, toolbar):
-        """Toolbar has a font combo box."""
+    def test_font_combo_deferred_until_needed(self, toolbar):
+        """Font combo box is not built until the toolbar needs it."""
+        assert toolbar._font_combo is None
+        combo = toolbar._ensure_font_combo()
+        assert combo is not None
+        assert toolbar._ensure_font_combo() is combo
+    
+    def test_font_combo_built_on_show(self, toolbar):
+        """Showing the toolbar builds the font combo box first in the layout."""
+        toolbar.show()
         assert toolbar._font_combo is not None
+        assert toolbar.layout().itemAt(0).widget() is toolbar._font_combo
+        toolbar.hide()
     
     def test_has_size_spinner(self, toolbar):
         """Toolbar has a size spin box."""
@@ -95,6 +105,12 @@ class TestFontMiniToolbarAttachment:
         toolbar.attach_to_editor(editor)
         toolbar.attach_to_editor(None)
         assert toolbar._editor is None
+    
+    def test_editor_property_reports_attached_editor(self, toolbar, editor):
+        """The public editor property follows attach_to_editor."""
+        assert toolbar.editor is None
+        toolbar.attach_to_editor(editor)
+        assert toolbar.editor is editor
 
 
 class TestFontMiniToolbarTheme:
@@ -106,6 +122,21 @@ class TestFontMiniToolbarTheme:
         style = toolbar.styleSheet()
         assert "#1e1e1e" in style
         assert "#d4d4d4" in style
+    
+    def test_identical_theme_skips_reapply(self, toolbar):
+        """Re-applying the same colors does not reparse the stylesheet."""
+        toolbar.set_theme_colors("#1e1e1e", "#d4d4d4", "#444444")
+        with patch.object(toolbar, 'setStyleSheet') as mock_set:
+            toolbar.set_theme_colors("#1e1e1e", "#d4d4d4", "#444444")
+            mock_set.assert_not_called()
+    
+    def test_changed_theme_reapplies(self, toolbar):
+        """A different color triple rebuilds the stylesheet."""
+        toolbar.set_theme_colors("#1e1e1e", "#d4d4d4", "#444444")
+        toolbar.set_theme_colors("#ffffff", "#000000", "#cccccc")
+        style = toolbar.styleSheet()
+        assert "#ffffff" in style
+        assert "#1e1e1e" not in style
 
 
 class TestFontMiniToolbarSignals:
@@ -152,7 +183,7 @@ class TestFontMiniToolbarFontChange:
         
         # Change font via combo box
         new_font = QFont("Arial")
-        toolbar._font_combo.setCurrentFont(new_font)
+        toolbar._ensure_font_combo().setCurrentFont(new_font)
         
         # Signal should have been emitted
         assert len(signal_emitted) >= 0
@@ -226,6 +257,29 @@ class TestFontMiniToolbarPositioning:
         
         main_window.deleteLater()
     
+    def test_position_matches_global_mapping(self, toolbar, editor, qapp):
+        """Direct mapTo gives the same spot as the global round-trip."""
+        main_window = QMainWindow()
+        main_window.setCentralWidget(editor)
+        main_window.resize(600, 400)
+        main_window.show()
+        toolbar.set_main_window(main_window)
+        toolbar.attach_to_editor(editor)
+        qapp.processEvents()
+        
+        cursor = editor.textCursor()
+        cursor.select(QTextCursor.SelectionType.WordUnderCursor)
+        toolbar._position_near_selection(cursor)
+        
+        viewport = editor.viewport()
+        expected = main_window.mapFromGlobal(
+            viewport.mapToGlobal(editor.cursorRect(cursor).bottomLeft())
+        )
+        assert toolbar.y() == expected.y() + 5
+        
+        main_window.close()
+        main_window.deleteLater()
+    
     def test_position_without_main_window(self, toolbar, editor):
         """Positioning works even without main window."""
         toolbar.attach_to_editor(editor)
@@ -304,7 +358,7 @@ class TestFontMiniToolbarEventFilters:
             Qt.KeyboardModifier.NoModifier
         )
         
-        result = toolbar.eventFilter(toolbar._font_combo, event)
+        result = toolbar.eventFilter(toolbar._ensure_font_combo(), event)
         
         # Should return False (event not consumed)
         assert result is False
@@ -380,6 +434,71 @@ class TestFontMiniToolbarApplyingState:
         assert toolbar._is_applying is False
 
 
+class TestFontMiniToolbarSignalBlocking:
+    """Tests for suppressing selectionChanged during the toolbar's own edit."""
+    
+    def test_apply_does_not_emit_selection_changed(self, toolbar, editor):
+        """Applying a font does not re-fire the editor's selectionChanged."""
+        toolbar.attach_to_editor(editor)
+        cursor = editor.textCursor()
+        cursor.select(QTextCursor.SelectionType.LineUnderCursor)
+        editor.setTextCursor(cursor)
+        
+        emitted = []
+        editor.selectionChanged.connect(lambda: emitted.append(True))
+        toolbar._size_spin.setValue(20)
+        toolbar._apply_font_to_selection()
+        
+        assert emitted == []
+        assert editor.textCursor().charFormat().font().pointSize() == 20
+    
+    def test_apply_still_emits_text_changed(self, toolbar, editor):
+        """The formatting edit is still visible to textChanged listeners."""
+        toolbar.attach_to_editor(editor)
+        cursor = editor.textCursor()
+        cursor.select(QTextCursor.SelectionType.LineUnderCursor)
+        editor.setTextCursor(cursor)
+        
+        changed = []
+        editor.textChanged.connect(lambda: changed.append(True))
+        toolbar._apply_font_to_selection()
+        
+        assert changed
+        assert not editor.signalsBlocked()
+
+
+class TestFontMiniToolbarApplyCoalescing:
+    """Tests for collapsing family and size edits into one apply."""
+    
+    def test_font_and_size_change_apply_once(self, toolbar, editor, qapp):
+        """A family change followed by a size change merges the format once."""
+        toolbar.attach_to_editor(editor)
+        cursor = editor.textCursor()
+        cursor.select(QTextCursor.SelectionType.LineUnderCursor)
+        editor.setTextCursor(cursor)
+        
+        fonts = []
+        toolbar.font_changed.connect(fonts.append)
+        toolbar._size_spin.setValue(18)
+        toolbar._on_font_changed(QFont("Courier"))
+        toolbar._on_size_changed()
+        
+        assert fonts == []
+        assert toolbar._apply_timer.isActive()
+        
+        qapp.processEvents()
+        
+        assert len(fonts) == 1
+        assert fonts[0].pointSize() == 18
+    
+    def test_is_applying_does_not_schedule(self, toolbar):
+        """Changes made while syncing from the selection are not applied."""
+        toolbar._is_applying = True
+        toolbar._on_size_changed()
+        toolbar._on_font_changed(QFont("Courier"))
+        assert not toolbar._apply_timer.isActive()
+
+
 class TestFontMiniToolbarIntegration:
     """Integration tests for toolbar with editor."""
     
@@ -171,6 +171,21 @@ class TestEventFilter:
         assert frame_timer._idle_timer.isActive()
         dummy.deleteLater()
 
+    def test_input_mask_matches_input_events(self, frame_timer):
+        """The bitmap flags exactly the listed input event types."""
+        flagged = {
+            etype for etype in QEvent.Type
+            if (FrameTimer._INPUT_MASK >> int(etype)) & 1
+        }
+        assert flagged == set(FrameTimer._INPUT_EVENTS)
+
+    def test_user_event_type_not_input(self, frame_timer, qapp):
+        """Event types far above the mask range are treated as non-input."""
+        dummy = QWidget()
+        frame_timer.eventFilter(dummy, QEvent(QEvent.Type.User))
+        assert not frame_timer._has_recent_input
+        dummy.deleteLater()
+
 
 class TestTickMeasurement:
     """Test the 0ms timer tick that measures event-loop stalls."""
@@ -179,7 +194,7 @@ class TestTickMeasurement:
         """A tick after a previous tick with recent input should record."""
         frame_timer.toggle()
         frame_timer._has_recent_input = True
-        frame_timer._last_tick = time.perf_counter() - 0.010  # 10ms ago
+        frame_timer._last_tick_ns = frame_timer._clock.nsecsElapsed() - 10_000_000  # 10ms ago
 
         frame_timer._on_tick()
 
@@ -190,7 +205,7 @@ class TestTickMeasurement:
         """Ticks without recent input should not record frames."""
         frame_timer.toggle()
         frame_timer._has_recent_input = False
-        frame_timer._last_tick = time.perf_counter() - 0.050
+        frame_timer._last_tick_ns = frame_timer._clock.nsecsElapsed() - 50_000_000
 
         frame_timer._on_tick()
 
@@ -200,33 +215,46 @@ class TestTickMeasurement:
         """Sub-1ms ticks are idle event-loop iterations, not frames."""
         frame_timer.toggle()
         frame_timer._has_recent_input = True
-        frame_timer._last_tick = time.perf_counter()  # just now
+        frame_timer._last_tick_ns = frame_timer._clock.nsecsElapsed()  # just now
 
         frame_timer._on_tick()
 
         assert len(frame_timer._frame_times) == 0
 
     def test_tick_updates_last_tick(self, frame_timer, qapp):
-        """Each tick should update _last_tick."""
+        """Each tick should update _last_tick_ns."""
         frame_timer.toggle()
-        old = frame_timer._last_tick
+        old = frame_timer._last_tick_ns
 
         time.sleep(0.002)
         frame_timer._on_tick()
 
-        assert frame_timer._last_tick > old
+        assert frame_timer._last_tick_ns > old
 
     def test_simulated_stall(self, frame_timer, qapp):
         """Simulate a 200ms main-thread stall and verify it's recorded."""
         frame_timer.toggle()
         frame_timer._has_recent_input = True
-        frame_timer._last_tick = time.perf_counter() - 0.200  # 200ms ago
+        frame_timer._last_tick_ns = frame_timer._clock.nsecsElapsed() - 200_000_000  # 200ms ago
 
         frame_timer._on_tick()
 
         assert len(frame_timer._frame_times) == 1
         assert frame_timer._last_frame_ms >= 190.0
 
+    def test_first_tick_after_reset_does_not_record(self, frame_timer, qapp):
+        """With no previous tick stamp there is no interval to record."""
+        frame_timer._clock.start()
+        frame_timer._has_recent_input = True
+        frame_timer._reset()
+        frame_timer._has_recent_input = True
+        assert frame_timer._last_tick_ns is None
+
+        frame_timer._on_tick()
+
+        assert frame_timer._frame_times == []
+        assert isinstance(frame_timer._last_tick_ns, int)
+
 
 class TestTimingControl:
     """Test start/stop timing."""
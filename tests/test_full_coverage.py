@@ -27,7 +27,7 @@ from unittest.mock import patch, MagicMock, PropertyMock
 
 from PySide6.QtWidgets import QApplication, QMessageBox, QFileDialog, QPlainTextEdit
 from PySide6.QtGui import QTextCursor
-from PySide6.QtCore import Qt
+from PySide6.QtCore import Qt, QThreadPool
 
 from editor.document import Document
 from editor.file_tree import CollapsibleSidebar
@@ -183,9 +183,9 @@ class TestGetActiveEditorFocused:
         editor = pane.editor
         assert isinstance(editor, LineNumberedEditor)
 
-        # Mock focusWidget to reliably return the LineNumberedEditor
-        with patch.object(QApplication, "focusWidget", return_value=editor):
-            result = win._get_active_editor()
+        # Report the focus move the way QApplication does
+        QApplication.instance().focusChanged.emit(None, editor)
+        result = win._get_active_editor()
         assert result is editor
 
 
@@ -196,12 +196,13 @@ class TestGetActiveEditorFocused:
 class TestPromptSaveAllCancel:
     """Cover the early-return False in _prompt_save_all."""
 
-    @patch.object(QMessageBox, "warning", return_value=QMessageBox.StandardButton.Cancel)
-    def test_prompt_save_all_returns_false_on_cancel(self, _mock, win):
+    def test_prompt_save_all_returns_false_on_cancel(self, win):
         doc = win._split_container.active_document
         doc._is_modified = True
-        result = win._prompt_save_all()
-        assert result is False
+        results = []
+        win._prompt_save_all(results.append)
+        win._save_prompt.button(QMessageBox.StandardButton.Cancel).click()
+        assert results == [False]
         doc._is_modified = False
 
 
@@ -218,6 +219,8 @@ class TestOnOpenError:
         with patch.object(win._file_handler, "read_file",
                           return_value=FileResult(success=False, error_message="fail")):
             win._on_open()
+        QThreadPool.globalInstance().waitForDone()
+        QApplication.processEvents()
         mock_crit.assert_called_once()
 
 
@@ -337,8 +340,7 @@ class TestCloseTabNoDoc:
 class TestCloseTabModifiedCancel:
     """Cover the path where user cancels saving a modified doc on close-tab."""
 
-    @patch.object(QMessageBox, "warning", return_value=QMessageBox.StandardButton.Cancel)
-    def test_close_tab_cancels_on_modified_doc(self, _mock, win):
+    def test_close_tab_cancels_on_modified_doc(self, win):
         pane = win._split_container.active_pane
         doc2 = Document(content="unsaved work")
         doc2._is_modified = True
@@ -347,6 +349,7 @@ class TestCloseTabModifiedCancel:
 
         count_before = pane.document_count
         win._on_close_tab()
+        win._save_prompt.button(QMessageBox.StandardButton.Cancel).click()
         # Cancelled → doc should NOT have been removed
         assert pane.document_count == count_before
         doc2._is_modified = False
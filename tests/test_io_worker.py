@@ -0,0 +1,66 @@
+"""Tests for the background I/O worker."""
+
+import threading
+from PySide6.QtCore import QThreadPool
+
+from editor.io_worker import IOWorker, prewarm_directory
+
+
+class TestIOWorker:
+    """Test IOWorker result delivery."""
+
+    def test_result_delivered_on_gui_thread(self, qapp):
+        results = []
+        threads = []
+
+        def work(a, b):
+            threads.append(threading.get_ident())
+            return a + b
+
+        worker = IOWorker(work, 2, 3)
+        worker.signals.finished.connect(
+            lambda result: results.append((result, threading.get_ident()))
+        )
+        QThreadPool.globalInstance().start(worker)
+        QThreadPool.globalInstance().waitForDone()
+        qapp.processEvents()
+
+        assert results == [(5, threading.get_ident())]
+        assert threads[0] != threading.get_ident()
+
+    def test_exception_emits_on_error_result(self, qapp):
+        results = []
+
+        def boom():
+            raise ValueError("bad")
+
+        worker = IOWorker(boom, on_error=lambda e: f"failed: {e}")
+        worker.signals.finished.connect(results.append)
+        worker.run()
+        qapp.processEvents()
+
+        assert results == ["failed: bad"]
+
+    def test_exception_without_on_error_emits_none(self, qapp):
+        results = []
+        worker = IOWorker(lambda: 1 / 0)
+        worker.signals.finished.connect(results.append)
+        worker.run()
+        qapp.processEvents()
+
+        assert results == [None]
+
+    def test_not_auto_deleted(self, qapp):
+        assert not IOWorker(lambda: None).autoDelete()
+
+
+class TestPrewarmDirectory:
+    """Test the directory pre-warm helper."""
+
+    def test_counts_entries(self, tmp_path):
+        (tmp_path / "a.txt").write_text("a")
+        (tmp_path / "sub").mkdir()
+        assert prewarm_directory(str(tmp_path)) == 2
+
+    def test_missing_directory_returns_zero(self, tmp_path):
+        assert prewarm_directory(str(tmp_path / "missing")) == 0
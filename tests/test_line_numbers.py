@@ -368,3 +368,116 @@ class TestJumpScrollBar:
         ed.close()
         ed.deleteLater()
         qapp.processEvents()
+
+
+class TestLineNumberPaintPen:
+    """Tests for pen reuse in the gutter paint loop."""
+
+    def test_pen_only_switched_for_current_line(self, editor):
+        """Ordinary lines share one pen; only the current line swaps it."""
+        editor.setPlainText("\n".join(f"Line {i}" for i in range(5)))
+        editor.resize(300, 400)
+
+        event = MagicMock()
+        event.rect.return_value = QRect(0, 0, 50, 400)
+
+        with patch('editor.line_number_editor.QPainter') as mock_painter_cls:
+            painter = mock_painter_cls.return_value
+            editor.line_number_area_paint_event(event)
+
+        pens = [c.args[0] for c in painter.setPen.call_args_list]
+        assert pens == [
+            editor._text_color,
+            editor._current_line_color,
+            editor._text_color,
+        ]
+        assert painter.drawText.call_count == 5
+
+
+class TestCachedFontMetrics:
+    """Tests for the cached QFontMetrics used by the gutter."""
+
+    def test_font_metrics_cached(self, editor):
+        """Repeated lookups reuse the same QFontMetrics object."""
+        assert editor._fm() is editor._fm()
+
+    def test_font_change_invalidates_cache(self, editor):
+        """Changing the font rebuilds metrics and gutter width."""
+        editor.setPlainText("\n".join(f"Line {i}" for i in range(20)))
+        old_fm = editor._fm()
+        old_width = editor.line_number_area_width()
+
+        font = QFont(editor.font())
+        font.setPointSize(font.pointSize() * 3)
+        editor.setFont(font)
+
+        assert editor._fm() is not old_fm
+        assert editor.line_number_area_width() > old_width
+
+
+class TestJumpScrollBarGrooveCache:
+    """Tests for caching the JumpScrollBar groove geometry."""
+
+    def _press(self, sb, y):
+        from PySide6.QtCore import QPointF, QEvent
+        from PySide6.QtGui import QMouseEvent
+        return QMouseEvent(
+            QEvent.Type.MouseButtonPress,
+            QPointF(sb.width() / 2, y),
+            Qt.MouseButton.LeftButton,
+            Qt.MouseButton.LeftButton,
+            Qt.KeyboardModifier.NoModifier,
+        )
+
+    def test_groove_queried_once_across_clicks(self, qapp):
+        """Repeated clicks reuse the cached groove rect."""
+        sb = JumpScrollBar(Qt.Orientation.Vertical)
+        sb.setRange(0, 1000)
+        sb.resize(16, 300)
+
+        with patch.object(sb, 'initStyleOption', wraps=sb.initStyleOption) as spy:
+            sb.mousePressEvent(self._press(sb, 50))
+            sb.mousePressEvent(self._press(sb, 250))
+            assert spy.call_count == 1
+        assert sb.value() > 500
+        sb.deleteLater()
+
+    def test_resize_invalidates_groove(self, qapp):
+        """Resizing drops the cached groove so the next click re-queries."""
+        sb = JumpScrollBar(Qt.Orientation.Vertical)
+        sb.setRange(0, 1000)
+        sb.resize(16, 300)
+        sb.mousePressEvent(self._press(sb, 150))
+        old_total = sb._groove_total
+
+        sb.resize(16, 600)
+        sb.show()
+        qapp.processEvents()
+        assert sb._groove_rect is None
+
+        sb.mousePressEvent(self._press(sb, 150))
+        assert sb._groove_total > old_total
+        sb.hide()
+        sb.deleteLater()
+
+
+class TestPaintGeometryQueries:
+    """Tests for block geometry lookups in the gutter paint loop."""
+
+    def test_one_bounding_rect_per_following_block(self, editor):
+        """Each block after the first is measured exactly once."""
+        editor.setPlainText("\n".join(f"Line {i}" for i in range(4)))
+        editor.resize(300, 400)
+
+        event = MagicMock()
+        event.rect.return_value = QRect(0, 0, 50, 400)
+
+        with patch('editor.line_number_editor.QPainter'), \
+                patch.object(editor, 'blockBoundingRect',
+                             wraps=editor.blockBoundingRect) as rect_spy, \
+                patch.object(editor, 'blockBoundingGeometry',
+                             wraps=editor.blockBoundingGeometry) as geom_spy:
+            editor.line_number_area_paint_event(event)
+
+        assert geom_spy.call_count == 1
+        assert rect_spy.call_count == 3
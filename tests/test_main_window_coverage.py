@@ -3,14 +3,20 @@ Comprehensive tests for main_window.py to push coverage from 58% toward 95%+.
 Covers: edit ops, file ops, find/replace, view toggles, theme/font ops, close events.
 """
 
+import os
+import subprocess
+import sys
+
 import pytest
 from unittest.mock import patch, MagicMock, PropertyMock
-from PySide6.QtWidgets import QApplication, QMessageBox, QFileDialog
-from PySide6.QtGui import QFont, QTextCursor
-from PySide6.QtCore import Qt
+from PySide6.QtWidgets import QApplication, QMessageBox, QFileDialog, QMenu
+from PySide6.QtGui import QAction, QFont, QTextCharFormat, QTextCursor, QKeySequence
+from PySide6.QtCore import Qt, QThreadPool
+from PySide6.QtTest import QTest
 
-from editor.main_window import MainWindow
+from editor.main_window import MainWindow, _looks_like_html, _merge_char_format
 from editor.document import Document
+from editor.file_handler import SaveResult
 
 
 @pytest.fixture(scope="session")
@@ -58,6 +64,55 @@ class TestGetActiveEditor:
         # Could be None if nothing focused
         assert result is None or result is not None
 
+    def test_pane_editor_memoised_per_pane(self, win):
+        from PySide6.QtWidgets import QApplication
+        pane = win._split_container.active_pane
+        with patch.object(QApplication, 'focusWidget', return_value=None):
+            first = win._get_active_editor()
+            assert first is pane.editor
+            with patch.object(type(pane), 'editor', new_callable=PropertyMock) as prop:
+                assert win._get_active_editor() is first
+            prop.assert_not_called()
+
+    def test_pane_change_refreshes_memoised_editor(self, win):
+        from PySide6.QtWidgets import QApplication
+        container = win._split_container
+        doc = container.add_new_document()
+        container.create_split(doc, "right")
+        left, right = container._panes
+        # Focus is on no editor, so the active pane's editor is used
+        QApplication.instance().focusChanged.emit(None, None)
+        container._active_pane = left
+        assert win._get_active_editor() is left.editor
+        container._active_pane = right
+        assert win._get_active_editor() is right.editor
+        container._active_pane = None
+        assert win._get_active_editor() is None
+
+    def test_focus_change_caches_editor(self, win, qapp):
+        from editor.line_number_editor import LineNumberedEditor
+        other = LineNumberedEditor()
+        qapp.focusChanged.emit(None, other)
+        with patch.object(QApplication, 'focusWidget') as mock_focus:
+            assert win._get_active_editor() is other
+        mock_focus.assert_not_called()
+
+    def test_focus_leaving_editor_falls_back_to_pane(self, win, qapp):
+        from PySide6.QtWidgets import QLineEdit
+        pane = win._split_container.active_pane
+        qapp.focusChanged.emit(None, pane.editor)
+        line_edit = QLineEdit()
+        qapp.focusChanged.emit(pane.editor, line_edit)
+        assert win._focused_editor is None
+        assert win._get_active_editor() is pane.editor
+
+    def test_layout_change_resyncs_focus(self, win, qapp):
+        from editor.line_number_editor import LineNumberedEditor
+        qapp.focusChanged.emit(None, LineNumberedEditor())
+        with patch.object(QApplication, 'focusWidget', return_value=None):
+            win._on_layout_changed()
+        assert win._focused_editor is None
+
 
 # ==========================================================================
 # 2. _update_window_title (lines 348-353)
@@ -83,6 +138,42 @@ class TestUpdateWindowTitle:
             assert "*" in win.windowTitle()
             doc._is_modified = False
 
+    def test_unchanged_title_skips_set_window_title(self, win):
+        win._update_window_title()
+        with patch.object(win, 'setWindowTitle') as mock_set:
+            win._update_window_title()
+        mock_set.assert_not_called()
+
+    def test_changed_title_is_set(self, win):
+        doc = win._split_container.active_document
+        win._update_window_title()
+        doc._is_modified = True
+        with patch.object(win, 'setWindowTitle') as mock_set:
+            win._update_window_title()
+        mock_set.assert_called_once_with(f"{doc.file_name}* - TextEdit")
+        doc._is_modified = False
+
+
+class TestLooksLikeHtml:
+    @pytest.mark.parametrize("content", [
+        "<!DOCTYPE html><html></html>",
+        "<!doctype html>",
+        "\n\n   <html><body></body></html>",
+        "<HTML>",
+    ])
+    def test_detects_html(self, content):
+        assert _looks_like_html(content)
+
+    @pytest.mark.parametrize("content", ["", "plain text", "x <html>", "<htm"])
+    def test_rejects_non_html(self, content):
+        assert not _looks_like_html(content)
+
+
+def _drain_io(qapp):
+    """Wait for background reads and deliver their queued results."""
+    QThreadPool.globalInstance().waitForDone()
+    qapp.processEvents()
+
 
 # ==========================================================================
 # 3. _update_status_bar (lines 363-364, 374)
@@ -105,6 +196,40 @@ class TestUpdateStatusBar:
         win._update_status_bar()
         assert win._split_label.text() == ""
 
+    def test_status_bar_updates_batched(self, win):
+        calls = []
+        with patch.object(win._status_bar, 'setUpdatesEnabled',
+                          side_effect=calls.append), \
+             patch.object(win._status_bar, 'update') as mock_update:
+            win._update_status_bar()
+        assert calls == [False, True]
+        mock_update.assert_called_once()
+
+    def test_unchanged_labels_skip_set_text(self, win):
+        win._update_status_bar()
+        with patch.object(win._file_label, 'setText') as file_set, \
+             patch.object(win._modified_label, 'setText') as mod_set, \
+             patch.object(win._split_label, 'setText') as split_set:
+            win._update_status_bar()
+        file_set.assert_not_called()
+        mod_set.assert_not_called()
+        split_set.assert_not_called()
+
+    def test_modified_flag_updates_label(self, win):
+        doc = win._split_container.active_document
+        doc._is_modified = True
+        win._update_status_bar()
+        assert win._modified_label.text() == "Modified"
+        doc._is_modified = False
+        win._update_status_bar()
+        assert win._modified_label.text() == ""
+
+    def test_status_bar_updates_reenabled_on_error(self, win):
+        with patch.object(win, '_get_active_editor', side_effect=RuntimeError):
+            with pytest.raises(RuntimeError):
+                win._update_status_bar()
+        assert win._status_bar.updatesEnabled()
+
 
 # ==========================================================================
 # 4. Signal handlers (lines 380-395)
@@ -124,6 +249,84 @@ class TestSignalHandlers:
         win._on_layout_changed()
         assert isinstance(win._swap_panes_action.isEnabled(), bool)
 
+    def test_document_modified_fetches_active_document_once(self, win):
+        doc = win._split_container.active_document
+        with patch.object(type(win._split_container), 'active_document',
+                          new_callable=PropertyMock, return_value=doc) as prop:
+            win._on_document_modified(doc, True)
+        assert prop.call_count == 1
+        assert win.windowTitle() == f"{doc.file_name} - TextEdit"
+
+    def test_refresh_chrome_fetches_active_document_once(self, win):
+        doc = win._split_container.active_document
+        doc._is_modified = True
+        with patch.object(type(win._split_container), 'active_document',
+                          new_callable=PropertyMock, return_value=doc) as prop:
+            win._refresh_chrome()
+        assert prop.call_count == 1
+        assert win.windowTitle() == f"{doc.file_name}* - TextEdit"
+        assert win._modified_label.text() == "Modified"
+        doc._is_modified = False
+
+    def test_layout_change_refreshes_chrome(self, win):
+        with patch.object(win, '_refresh_chrome') as mock_refresh:
+            win._on_layout_changed()
+        mock_refresh.assert_called_once()
+
+    def test_document_modified_coalesces_status_update(self, win):
+        doc = win._split_container.active_document
+        doc._is_modified = True
+        with patch.object(win, '_update_status_bar_for') as mock_update:
+            win._on_document_modified(doc, True)
+            win._on_document_modified(doc, True)
+            mock_update.assert_not_called()
+        assert win._status_update_timer.isActive()
+        win._status_update_timer.stop()
+        win._status_update_timer.timeout.emit()
+        assert win._modified_label.text() == "Modified"
+
+    def _move_cursor(self, editor):
+        editor.setPlainText("abc\ndef")
+        cursor = editor.textCursor()
+        cursor.setPosition(5)
+        editor.setTextCursor(cursor)
+
+    def test_previous_editor_disconnected_on_switch(self, win):
+        from editor.line_number_editor import LineNumberedEditor
+        first = win._get_active_editor()
+        second = LineNumberedEditor()
+        win._on_document_changed(Document())
+        assert win._connected_editor is first
+        with patch.object(win, '_get_active_editor', return_value=second):
+            win._on_document_changed(Document())
+        assert win._connected_editor is second
+
+        win._pos_update_timer.stop()
+        self._move_cursor(first)
+        assert not win._pos_update_timer.isActive()
+        self._move_cursor(second)
+        assert win._pos_update_timer.isActive()
+        win._pos_update_timer.stop()
+
+    def test_deleted_previous_editor_is_tolerated(self, win):
+        from shiboken6 import Shiboken
+        from editor.line_number_editor import LineNumberedEditor
+        stale = LineNumberedEditor()
+        with patch.object(win, '_get_active_editor', return_value=stale):
+            win._on_document_changed(Document())
+        Shiboken.delete(stale)
+        win._on_document_changed(Document())
+        assert win._connected_editor is win._get_active_editor()
+
+    def test_repeat_switch_keeps_single_connection(self, win):
+        editor = win._get_active_editor()
+        for _ in range(3):
+            win._on_document_changed(Document())
+        with patch.object(win._pos_update_timer, 'start') as mock_start:
+            self._move_cursor(editor)
+        # setPlainText + setTextCursor each move the cursor once
+        assert mock_start.call_count == 2
+
 
 # ==========================================================================
 # 5. _on_cursor_position_changed (lines 399-404)
@@ -134,41 +337,84 @@ class TestCursorPosition:
         text = win._position_label.text()
         assert "Ln" in text and "Col" in text
 
+    def test_position_reflects_cursor_move(self, win):
+        editor = win._get_active_editor()
+        editor.setPlainText("ab\ncd")
+        cursor = editor.textCursor()
+        cursor.setPosition(4)
+        editor.setTextCursor(cursor)
+        win._on_cursor_position_changed()
+        win._flush_position_update()
+        assert win._position_label.text() == "Ln 2, Col 2"
+
+    def test_cursor_changes_coalesce_into_one_update(self, win):
+        with patch.object(win, '_set_position') as mock_set:
+            for _ in range(5):
+                win._on_cursor_position_changed()
+            mock_set.assert_not_called()
+            assert win._pos_update_timer.isActive()
+            win._pos_update_timer.stop()
+            win._pos_update_timer.timeout.emit()
+            mock_set.assert_called_once()
+
+    def test_unchanged_position_skips_set_text(self, win):
+        win._set_position(3, 4)
+        with patch.object(win._position_label, 'setText') as mock_set:
+            win._set_position(3, 4)
+            mock_set.assert_not_called()
+            win._set_position(3, 5)
+            mock_set.assert_called_once_with("Ln 3, Col 5")
+
 
 # ==========================================================================
 # 6. _prompt_save_changes (lines 416-434)
 # ==========================================================================
 class TestPromptSaveChanges:
+    def _prompt(self, win, doc, button):
+        results = []
+        win._prompt_save_changes(doc, results.append)
+        assert results == []
+        win._save_prompt.button(button).click()
+        return results
+
     def test_unmodified_returns_true(self, win):
         doc = Document()
-        assert win._prompt_save_changes(doc) is True
+        results = []
+        win._prompt_save_changes(doc, results.append)
+        assert results == [True]
+        assert win._save_prompt is None
 
-    @patch.object(QMessageBox, 'warning', return_value=QMessageBox.StandardButton.Discard)
-    def test_discard_returns_true(self, mock_warn, win):
+    def test_prompt_is_window_modal_not_blocking(self, win):
         doc = Document(content="text")
         doc._is_modified = True
-        assert win._prompt_save_changes(doc) is True
+        win._prompt_save_changes(doc, lambda proceed: None)
+        box = win._save_prompt
+        assert box.isVisible()
+        assert box.windowModality() == Qt.WindowModality.WindowModal
+        box.button(QMessageBox.StandardButton.Cancel).click()
+        assert win._save_prompt is None
+
+    def test_discard_returns_true(self, win):
+        doc = Document(content="text")
+        doc._is_modified = True
+        assert self._prompt(win, doc, QMessageBox.StandardButton.Discard) == [True]
 
-    @patch.object(QMessageBox, 'warning', return_value=QMessageBox.StandardButton.Cancel)
-    def test_cancel_returns_false(self, mock_warn, win):
+    def test_cancel_returns_false(self, win):
         doc = Document(content="text")
         doc._is_modified = True
-        assert win._prompt_save_changes(doc) is False
+        assert self._prompt(win, doc, QMessageBox.StandardButton.Cancel) == [False]
 
-    @patch.object(QMessageBox, 'warning', return_value=QMessageBox.StandardButton.Save)
-    def test_save_with_path(self, mock_warn, win, tmp_path):
+    def test_save_with_path(self, win, tmp_path):
         doc = Document(content="text", file_path=str(tmp_path / "test.txt"))
         doc._is_modified = True
-        result = win._prompt_save_changes(doc)
-        assert isinstance(result, bool)
+        assert self._prompt(win, doc, QMessageBox.StandardButton.Save) == [True]
+        assert not doc.is_modified
 
-    @patch.object(QMessageBox, 'warning', return_value=QMessageBox.StandardButton.Save)
     @patch.object(QFileDialog, 'getSaveFileName', return_value=("", ""))
-    def test_save_without_path_cancelled(self, mock_fd, mock_warn, win):
+    def test_save_without_path_cancelled(self, mock_fd, win):
         doc = Document(content="text")
         doc._is_modified = True
-        result = win._prompt_save_changes(doc)
-        assert result is False
+        assert self._prompt(win, doc, QMessageBox.StandardButton.Save) == [False]
 
 
 # ==========================================================================
@@ -176,7 +422,124 @@ class TestPromptSaveChanges:
 # ==========================================================================
 class TestPromptSaveAll:
     def test_save_all_unmodified(self, win):
-        assert win._prompt_save_all() is True
+        results = []
+        win._prompt_save_all(results.append)
+        assert results == [True]
+
+    def test_save_all_prompts_each_modified_doc(self, win):
+        first = win._split_container.active_document
+        second = win._split_container.add_new_document()
+        first._is_modified = True
+        second._is_modified = True
+        results = []
+        win._prompt_save_all(results.append)
+        win._save_prompt.button(QMessageBox.StandardButton.Discard).click()
+        assert results == []
+        win._save_prompt.button(QMessageBox.StandardButton.Discard).click()
+        assert results == [True]
+
+    def _two_saved_docs(self, win, tmp_path):
+        first = win._split_container.active_document
+        first.file_path = str(tmp_path / "one.txt")
+        first.content = "one"
+        second = win._split_container.add_new_document()
+        second.file_path = str(tmp_path / "two.txt")
+        second.content = "two"
+        first._is_modified = True
+        second._is_modified = True
+        return first, second
+
+    def test_save_all_writes_after_all_answers(self, win, tmp_path):
+        first, second = self._two_saved_docs(win, tmp_path)
+        results = []
+        win._prompt_save_all(results.append)
+        win._save_prompt.button(QMessageBox.StandardButton.Save).click()
+        # Nothing is written until every prompt is answered
+        assert not (tmp_path / "one.txt").exists()
+        win._save_prompt.button(QMessageBox.StandardButton.Save).click()
+        _drain_io(QApplication.instance())
+        assert results == [True]
+        assert (tmp_path / "one.txt").read_text() == "one"
+        assert (tmp_path / "two.txt").read_text() == "two"
+        assert not first.is_modified and not second.is_modified
+
+    def test_save_all_writes_unsynced_editor_text(self, win, tmp_path):
+        f = tmp_path / "typed.txt"
+        f.write_text("old")
+        win._open_file(str(f))
+        _drain_io(QApplication.instance())
+        document = win._split_container.active_document
+        editor = win._get_active_editor()
+        editor.moveCursor(QTextCursor.MoveOperation.End)
+        editor.insertPlainText(" new")
+        results = []
+        win._prompt_save_all(results.append)
+        win._save_prompt.button(QMessageBox.StandardButton.Save).click()
+        _drain_io(QApplication.instance())
+        assert results == [True]
+        assert f.read_text() == "old new"
+        assert not document.is_modified
+
+    @patch.object(QMessageBox, 'critical')
+    def test_save_all_keeps_edits_made_during_write(self, mock_crit, win, tmp_path):
+        first, second = self._two_saved_docs(win, tmp_path)
+        results = []
+        win._prompt_save_all(results.append)
+        with patch.object(QThreadPool.globalInstance(), 'start') as mock_start:
+            win._save_prompt.button(QMessageBox.StandardButton.Save).click()
+            win._save_prompt.button(QMessageBox.StandardButton.Save).click()
+        # Typed into the open editor while the writes are still pending
+        win._get_active_editor().insertPlainText(", edited")
+        for call in mock_start.call_args_list:
+            call.args[0].run()
+        QApplication.instance().processEvents()
+        assert results == [False]
+        assert (tmp_path / "two.txt").read_text() == "two"
+        assert second.is_modified
+        assert not first.is_modified
+        mock_crit.assert_called_once()
+        assert "two.txt changed while it was being saved" in mock_crit.call_args.args[2]
+        second._is_modified = False
+
+    @patch.object(QMessageBox, 'critical')
+    def test_save_all_reports_write_failure(self, mock_crit, win, tmp_path):
+        first, second = self._two_saved_docs(win, tmp_path)
+        results = []
+        with patch.object(win._file_handler, 'write_file',
+                          return_value=SaveResult(success=False, error_message="x")):
+            win._prompt_save_all(results.append)
+            win._save_prompt.button(QMessageBox.StandardButton.Save).click()
+            win._save_prompt.button(QMessageBox.StandardButton.Discard).click()
+            _drain_io(QApplication.instance())
+        assert results == [False]
+        mock_crit.assert_called_once()
+        assert first.is_modified
+        first._is_modified = False
+        second._is_modified = False
+
+    @patch.object(QMessageBox, 'critical')
+    def test_save_all_reports_write_exception(self, mock_crit, win, tmp_path):
+        first, second = self._two_saved_docs(win, tmp_path)
+        results = []
+        with patch.object(win._file_handler, 'write_file',
+                          side_effect=ValueError("bad content")):
+            win._prompt_save_all(results.append)
+            win._save_prompt.button(QMessageBox.StandardButton.Save).click()
+            win._save_prompt.button(QMessageBox.StandardButton.Discard).click()
+            _drain_io(QApplication.instance())
+        assert results == [False]
+        assert win._io_workers == set()
+        assert "bad content" in mock_crit.call_args.args[2]
+        first._is_modified = False
+        second._is_modified = False
+
+    @patch.object(QFileDialog, 'getSaveFileName', return_value=("", ""))
+    def test_save_all_untitled_path_cancelled(self, mock_fd, win):
+        win._split_container.active_document._is_modified = True
+        results = []
+        win._prompt_save_all(results.append)
+        win._save_prompt.button(QMessageBox.StandardButton.Save).click()
+        assert results == [False]
 
 
 # ==========================================================================
@@ -194,15 +557,47 @@ class TestFileOperations:
         f.write_text("hello world")
         mock_fd.return_value = (str(f), "Text Files (*.txt)")
         win._on_open()
+        _drain_io(QApplication.instance())
         docs = win._split_container.all_documents
         assert any(d.content == "hello world" for d in docs)
 
+    @patch.object(QFileDialog, 'getOpenFileName')
+    def test_on_open_reads_off_gui_thread(self, mock_fd, win, tmp_path):
+        f = tmp_path / "slow.txt"
+        f.write_text("later")
+        mock_fd.return_value = (str(f), "Text Files (*.txt)")
+        win._on_open()
+        # The document only appears once the queued result is delivered
+        assert not any(d.file_path == str(f)
+                       for d in win._split_container.all_documents)
+        assert "slow.txt" in win._status_bar.currentMessage()
+        _drain_io(QApplication.instance())
+        assert any(d.content == "later" for d in win._split_container.all_documents)
+        assert win._io_workers == set()
+        assert win._status_bar.currentMessage() == ""
+
+    @patch.object(QMessageBox, 'critical')
+    @patch.object(QFileDialog, 'getOpenFileName')
+    def test_on_open_read_exception_clears_loading(self, mock_fd, mock_crit,
+                                                   win, tmp_path):
+        f = tmp_path / "broken.txt"
+        f.write_text("x")
+        mock_fd.return_value = (str(f), "Text Files (*.txt)")
+        with patch.object(win._file_handler, 'read_file',
+                          side_effect=ValueError("bad read")):
+            win._on_open()
+            _drain_io(QApplication.instance())
+        assert win._io_workers == set()
+        assert win._status_bar.currentMessage() == ""
+        mock_crit.assert_called_once()
+
     @patch.object(QFileDialog, 'getOpenFileName')
     def test_on_open_html_file(self, mock_fd, win, tmp_path):
         f = tmp_path / "page.html"
         f.write_text("<!DOCTYPE html><html><body>Hi</body></html>")
         mock_fd.return_value = (str(f), "All Files (*)")
         win._on_open()
+        _drain_io(QApplication.instance())
         docs = win._split_container.all_documents
         assert any(d.html_content is not None for d in docs)
 
@@ -236,6 +631,32 @@ class TestFileOperations:
         result = win._on_save_as()
         assert isinstance(result, bool)
 
+    @patch.object(QFileDialog, 'getSaveFileName')
+    def test_save_as_appends_txt_and_passes_filter(self, mock_fd, win, tmp_path):
+        target = tmp_path / "notes"
+        mock_fd.return_value = (str(target), "Text Files (*.txt)")
+        assert win._on_save_as() is True
+        assert mock_fd.call_args[0][3] == "Text Files (*.txt);;All Files (*)"
+        assert (tmp_path / "notes.txt").exists()
+
+    @patch.object(QFileDialog, 'getSaveFileName', return_value=("", ""))
+    def test_save_dialog_default_name_for_untitled(self, mock_fd, win):
+        assert win._ask_save_path(Document(content="x")) is None
+        assert mock_fd.call_args[0][2] == ""
+
+    @patch.object(QFileDialog, 'getSaveFileName', return_value=("", ""))
+    def test_save_dialog_default_name_for_file_named_untitled(self, mock_fd, win, tmp_path):
+        doc = Document(content="x", file_path=str(tmp_path / "Untitled"))
+        win._ask_save_path(doc)
+        assert mock_fd.call_args[0][2] == "Untitled"
+
+    @patch.object(QFileDialog, 'getSaveFileName')
+    def test_save_as_all_files_keeps_name(self, mock_fd, win, tmp_path):
+        target = tmp_path / "notes"
+        mock_fd.return_value = (str(target), "All Files (*)")
+        assert win._on_save_as() is True
+        assert target.exists()
+
     def test_save_document_no_path(self, win):
         doc = Document(content="test")
         result = win._save_document(doc)
@@ -281,37 +702,42 @@ class TestCloseTab:
                           new_callable=PropertyMock, return_value=None):
             win._on_close_tab()  # no crash
 
-    @patch.object(QMessageBox, 'warning', return_value=QMessageBox.StandardButton.Discard)
-    def test_close_tab_modified(self, mock_warn, win):
-        doc = win._split_container.active_document
-        if doc:
-            doc._is_modified = True
-            # Add a second doc so closing doesn't close window
-            win._split_container.add_new_document()
-            win._on_close_tab()
+    def test_close_tab_modified(self, win):
+        pane = win._split_container.active_pane
+        win._split_container.add_new_document()
+        doc = pane.current_document
+        doc._is_modified = True
+        win._on_close_tab()
+        # The tab stays until the prompt is answered
+        assert doc in pane.documents
+        win._save_prompt.button(QMessageBox.StandardButton.Discard).click()
+        assert doc not in pane.documents
 
 
 # ==========================================================================
 # 10. Edit operations (lines 602-634)
 # ==========================================================================
 class TestEditOperations:
-    def test_undo(self, win):
-        win._on_undo()
-
-    def test_redo(self, win):
-        win._on_redo()
-
-    def test_cut(self, win):
-        win._on_cut()
-
-    def test_copy(self, win):
-        win._on_copy()
-
-    def test_paste(self, win):
-        win._on_paste()
-
-    def test_select_all(self, win):
-        win._on_select_all()
+    @pytest.mark.parametrize("op_name", ["undo", "redo", "cut", "copy",
+                                         "paste", "selectAll"])
+    def test_forward_calls_editor_method(self, win, op_name):
+        editor = MagicMock()
+        with patch.object(win, '_get_active_editor', return_value=editor):
+            win._forward(op_name)
+        getattr(editor, op_name).assert_called_once_with()
+
+    def test_forward_without_editor(self, win):
+        with patch.object(win, '_get_active_editor', return_value=None):
+            win._forward("undo")  # no crash
+
+    def test_select_all_action_selects_text(self, win):
+        editor = win._get_active_editor()
+        editor.setPlainText("hello")
+        edit_menu = next(m for m in win.menuBar().findChildren(QMenu)
+                         if m.title() == "&Edit")
+        action = next(a for a in edit_menu.actions() if a.text() == "Select &All")
+        action.trigger()
+        assert editor.textCursor().selectedText() == "hello"
 
 
 # ==========================================================================
@@ -413,6 +839,11 @@ class TestOpenFolder:
     def test_open_folder_cancelled(self, mock_fd, win):
         win._on_open_folder()
 
+    @patch.object(QFileDialog, 'getExistingDirectory', return_value="")
+    def test_open_folder_uses_qt_dialog(self, mock_fd, win):
+        win._on_open_folder()
+        assert mock_fd.call_args.args[3] & QFileDialog.Option.DontUseNativeDialog
+
     @patch.object(QFileDialog, 'getExistingDirectory')
     def test_open_folder_success(self, mock_fd, win, tmp_path):
         folder = tmp_path / "proj"
@@ -427,32 +858,100 @@ class TestOpenFolder:
 # 16. File tree handlers (lines 745, 749, 753-779)
 # ==========================================================================
 class TestFileTreeHandlers:
-    def test_on_file_tree_open(self, win, tmp_path):
+    def test_on_file_tree_open(self, win, qapp, tmp_path):
         f = tmp_path / "ft.txt"
         f.write_text("ft content")
         win._on_file_tree_open(str(f))
+        _drain_io(qapp)
         docs = win._split_container.all_documents
         assert any(d.content == "ft content" for d in docs)
 
-    def test_on_file_tree_open_new_tab(self, win, tmp_path):
+    def test_on_file_tree_open_new_tab(self, win, qapp, tmp_path):
         f = tmp_path / "ft2.txt"
         f.write_text("ft2")
         win._on_file_tree_open_new_tab(str(f))
+        _drain_io(qapp)
 
     @patch.object(QMessageBox, 'critical')
-    def test_open_file_nonexistent(self, mock_crit, win):
+    def test_open_file_nonexistent(self, mock_crit, win, qapp):
         win._open_file("/nonexistent/path/xyz.txt")
-        # Should show error, not crash
+        _drain_io(qapp)
+        mock_crit.assert_called_once()
 
-    def test_open_file_html(self, win, tmp_path):
+    def test_open_file_html(self, win, qapp, tmp_path):
         f = tmp_path / "page.html"
         f.write_text("<html><body>hello</body></html>")
         win._open_file(str(f))
+        _drain_io(qapp)
+        assert any(d.html_content is not None
+                   for d in win._split_container.all_documents)
 
-    def test_open_file_force_new_tab(self, win, tmp_path):
+    def test_open_file_force_new_tab(self, win, qapp, tmp_path):
         f = tmp_path / "new.txt"
         f.write_text("new tab")
         win._open_file(str(f), force_new_tab=True)
+        _drain_io(qapp)
+
+    def test_open_file_reads_off_gui_thread(self, win, qapp, tmp_path):
+        f = tmp_path / "tree.txt"
+        f.write_text("tree content")
+        with patch.object(QThreadPool.globalInstance(), 'start') as mock_start:
+            win._open_file(str(f))
+        mock_start.assert_called_once()
+        assert win._status_bar.currentMessage() == "Loading tree.txt..."
+        assert not any(d.content == "tree content"
+                       for d in win._split_container.all_documents)
+        mock_start.call_args.args[0].run()
+        qapp.processEvents()
+        assert any(d.content == "tree content"
+                   for d in win._split_container.all_documents)
+
+
+class TestReadCache:
+    """Repeat opens of an unchanged file are served from memory."""
+
+    def _open(self, win, qapp, path):
+        win._open_file(str(path), force_new_tab=True)
+        _drain_io(qapp)
+
+    def test_reopen_unchanged_file_skips_read(self, win, qapp, tmp_path):
+        f = tmp_path / "cached.txt"
+        f.write_text("cached")
+        self._open(win, qapp, f)
+        with patch.object(win._file_handler, 'read_file') as mock_read:
+            self._open(win, qapp, f)
+        mock_read.assert_not_called()
+        docs = [d for d in win._split_container.all_documents if d.content == "cached"]
+        assert len(docs) == 2
+
+    def test_changed_file_is_reread(self, win, qapp, tmp_path):
+        f = tmp_path / "changed.txt"
+        f.write_text("old")
+        self._open(win, qapp, f)
+        f.write_text("newer text")
+        self._open(win, qapp, f)
+        assert any(d.content == "newer text" for d in win._split_container.all_documents)
+
+    def test_cache_is_bounded(self, win, qapp, tmp_path):
+        from editor.main_window import _READ_CACHE_SIZE
+        for i in range(_READ_CACHE_SIZE + 2):
+            f = tmp_path / f"f{i}.txt"
+            f.write_text(str(i))
+            self._open(win, qapp, f)
+        assert len(win._read_cache) == _READ_CACHE_SIZE
+        assert str(tmp_path / "f0.txt") not in {k[0] for k in win._read_cache}
+
+    def test_large_file_not_cached(self, win, qapp, tmp_path):
+        f = tmp_path / "big.txt"
+        with patch('editor.main_window._READ_CACHE_MAX_CHARS', 4):
+            f.write_text("too long")
+            self._open(win, qapp, f)
+        assert not win._read_cache
+
+    @patch.object(QMessageBox, 'critical')
+    def test_failed_read_not_cached(self, mock_crit, win, qapp):
+        self._open(win, qapp, "/nonexistent/path/xyz.txt")
+        assert not win._read_cache
 
 
 # ==========================================================================
@@ -478,10 +977,79 @@ class TestThemeOperations:
         win._rebuild_themes_menu()
         assert len(win._theme_actions) > 0
 
+    def test_reapplying_same_theme_is_skipped(self, win):
+        win._on_theme_changed("Dark")
+        with patch.object(win._theme_manager, 'apply_theme_by_name') as mock_apply, \
+                patch.object(win, '_apply_font_toolbar_theme') as mock_toolbar:
+            win._on_settings_theme_changed("Dark")
+        mock_apply.assert_not_called()
+        mock_toolbar.assert_not_called()
+
+    def test_reapplying_edited_theme_still_applies(self, win):
+        win._on_theme_changed("Dark")
+        win._applied_theme_colors = dict(win._applied_theme_colors, editor_text="#010101")
+        with patch.object(win._theme_manager, 'apply_theme_by_name') as mock_apply:
+            win._on_settings_theme_changed("Dark")
+        mock_apply.assert_called_once_with("Dark")
+
+    def test_switching_theme_applies(self, win):
+        win._on_theme_changed("Dark")
+        win._on_settings_theme_changed("Light")
+        assert win._theme_manager.current_theme_name == "Light"
+        assert win._applied_theme_colors == win._theme_manager.get_theme_colors("Light")
+
+    def test_line_number_colors_pushed_only_on_change(self, win):
+        win._on_theme_changed("Dark")
+        with patch.object(win._split_container, 'set_line_number_colors') as mock_set:
+            win._apply_line_number_colors()
+            mock_set.assert_not_called()
+            win._on_theme_changed("Light")
+        mock_set.assert_called_once()
+
 
 # ==========================================================================
 # 18. Font operations (lines 815-842)
 # ==========================================================================
+class TestFontToolbarPanes:
+    """A single font toolbar follows the editor being worked in."""
+
+    def _split(self, win):
+        container = win._split_container
+        doc = container.add_new_document()
+        container.create_split(doc, "right")
+        return container
+
+    def test_split_reuses_single_toolbar(self, win):
+        toolbar = win._font_toolbar
+        container = self._split(win)
+        assert win._font_toolbar is toolbar
+        assert win.findChildren(type(toolbar)) == [toolbar]
+        assert toolbar._editor is container._panes[1].editor
+
+    def test_focus_moves_toolbar_to_editor(self, win, qapp):
+        container = self._split(win)
+        left = container._panes[0].editor
+        qapp.focusChanged.emit(None, left)
+        assert win._font_toolbar.editor is left
+
+    def test_removed_pane_reattaches_to_active_editor(self, win, qapp):
+        container = self._split(win)
+        qapp.focusChanged.emit(None, None)
+        container._remove_pane(container._panes[1])
+        assert win._font_toolbar.editor is container._panes[0].editor
+
+    def test_reattach_to_same_editor_is_noop(self, win):
+        editor = win._font_toolbar.editor
+        with patch.object(win._font_toolbar, 'attach_to_editor') as mock_attach:
+            win._attach_font_toolbar(editor)
+        mock_attach.assert_not_called()
+
+    def test_theme_applied_to_single_toolbar(self, win):
+        with patch.object(win, '_apply_font_toolbar_theme_to') as mock_apply:
+            win._apply_font_toolbar_theme()
+        mock_apply.assert_called_once_with(win._font_toolbar)
+
+
 class TestFontOperations:
     def test_on_font_apply_all(self, win):
         font = QFont("Monospace", 12)
@@ -506,6 +1074,56 @@ class TestFontOperations:
             editor.setTextCursor(cursor)
         win._apply_font_to_selections(font)
 
+    def test_apply_font_to_selections_leaves_cursor_alone(self, win):
+        editor = win._get_active_editor()
+        editor.setPlainText("Hello World")
+        cursor = editor.textCursor()
+        cursor.setPosition(0)
+        cursor.setPosition(5, QTextCursor.MoveMode.KeepAnchor)
+        editor.setTextCursor(cursor)
+        moved = []
+        editor.cursorPositionChanged.connect(lambda: moved.append(True))
+        with patch.object(editor, 'setTextCursor') as mock_set:
+            win._apply_font_to_selections(QFont("Serif", 23))
+        mock_set.assert_not_called()
+        assert moved == []
+        assert editor.textCursor().selectedText() == "Hello"
+        assert editor.currentCharFormat().font().pointSize() == 23
+
+    def test_apply_font_to_selections_skips_panes_without_selection(self, win):
+        editor = win._get_active_editor()
+        editor.setPlainText("Hello")
+        with patch('editor.main_window._merge_char_format') as mock_merge:
+            win._apply_font_to_selections(QFont("Serif", 23))
+        mock_merge.assert_not_called()
+
+    def test_apply_font_to_document_restores_updates(self, win):
+        editor = win._get_active_editor()
+        editor.setPlainText("one\ntwo\nthree")
+        win._apply_font_to_active_document(QFont("Serif", 21))
+        assert editor.updatesEnabled()
+        cursor = QTextCursor(editor.document())
+        cursor.setPosition(len("one\ntw"))
+        assert cursor.charFormat().font().pointSize() == 21
+
+    def test_merge_char_format_holds_updates(self, win):
+        editor = win._get_active_editor()
+        cursor = MagicMock()
+        seen = []
+        cursor.mergeCharFormat.side_effect = lambda fmt: seen.append(editor.updatesEnabled())
+        _merge_char_format(editor, cursor, QTextCharFormat())
+        assert seen == [False]
+        cursor.beginEditBlock.assert_called_once()
+        cursor.endEditBlock.assert_called_once()
+        assert editor.updatesEnabled()
+
+    def test_merge_char_format_keeps_disabled_updates(self, win):
+        editor = win._get_active_editor()
+        editor.setUpdatesEnabled(False)
+        _merge_char_format(editor, MagicMock(), QTextCharFormat())
+        assert not editor.updatesEnabled()
+        editor.setUpdatesEnabled(True)
+
 
 # ==========================================================================
 # 19. Misc (lines 856, 860, 870, 877)
@@ -514,6 +1132,19 @@ class TestMisc:
     def test_swap_panes(self, win):
         win._on_swap_panes()
 
+    def test_swap_panes_emits_swap_and_layout_once(self, win):
+        container = win._split_container
+        doc = container.add_new_document()
+        container.create_split(doc, "right")
+        left, right = container._panes
+        emitted = []
+        container.layout_changed.connect(lambda: emitted.append("layout"))
+        container.split_swapped.connect(lambda: emitted.append("swapped"))
+        win._on_swap_panes()
+        assert emitted == ["swapped", "layout"]
+        assert container._panes == [right, left]
+        assert win._swap_panes_action.isEnabled()
+
     @patch.object(QMessageBox, 'about')
     def test_about(self, mock_about, win):
         win._on_about()
@@ -527,27 +1158,273 @@ class TestMisc:
     def test_close_event_accept(self, win):
         from PySide6.QtGui import QCloseEvent
         event = QCloseEvent()
-        with patch.object(win, '_prompt_save_all', return_value=True):
-            win.closeEvent(event)
-            assert event.isAccepted()
+        win.closeEvent(event)
+        assert event.isAccepted()
 
     def test_close_event_ignore(self, win):
         from PySide6.QtGui import QCloseEvent
+        win._split_container.active_document._is_modified = True
         event = QCloseEvent()
-        with patch.object(win, '_prompt_save_all', return_value=False):
-            win.closeEvent(event)
-            assert not event.isAccepted()
+        win.closeEvent(event)
+        assert not event.isAccepted()
+        win._save_prompt.button(QMessageBox.StandardButton.Cancel).click()
+        assert win.isVisible()
 
-    @patch('editor.main_window.SettingsDialog')
+    def test_close_event_closes_after_discard(self, win):
+        from PySide6.QtGui import QCloseEvent
+        win._split_container.active_document._is_modified = True
+        event = QCloseEvent()
+        win.closeEvent(event)
+        assert not event.isAccepted()
+        win._save_prompt.button(QMessageBox.StandardButton.Discard).click()
+        assert win._close_confirmed
+        assert not win.isVisible()
+
+    @patch('editor.settings_dialog.SettingsDialog')
     def test_on_open_settings(self, mock_dialog_cls, win):
         mock_dialog = MagicMock()
         mock_dialog_cls.return_value = mock_dialog
         win._on_open_settings()
         mock_dialog.exec.assert_called_once()
 
-    @patch('editor.main_window.FontManagerDialog')
+    @patch('editor.settings_dialog.FontManagerDialog')
     def test_on_open_font_manager(self, mock_dialog_cls, win):
         mock_dialog = MagicMock()
         mock_dialog_cls.return_value = mock_dialog
         win._on_open_font_manager()
         mock_dialog.exec.assert_called_once()
+
+
+class TestFileDialogPrewarm:
+    """Directory scans for the file dialogs start with the window."""
+
+    def test_prewarm_workers_finish(self, win):
+        qapp = QApplication.instance()
+        win._prewarm_file_dialogs()
+        assert win._io_workers
+        _drain_io(qapp)
+        assert win._io_workers == set()
+
+
+class TestMenuTables:
+    """Menus built from the action tables keep their labels and shortcuts."""
+
+    def _menu(self, win, title):
+        for menu in win.menuBar().findChildren(QMenu):
+            if menu.title() == title:
+                return menu
+        raise AssertionError(title)
+
+    def test_file_menu_layout(self, win):
+        actions = self._menu(win, "&File").actions()
+        labels = [a.text().split("\t")[0] for a in actions if not a.isSeparator()]
+        assert labels == ["&New", "&Open...", "Open &Folder...", "&Save",
+                          "Save &As...", "&Close Tab", "E&xit"]
+        assert sum(a.isSeparator() for a in actions) == 3
+
+    def test_view_menu_from_table(self, win):
+        actions = self._menu(win, "&View").actions()
+        assert [a.text() for a in actions if not a.isSeparator()] == [
+            "&Sidebar", "&Word Wrap", "&Status Bar", "Swap Split &Panes", "Frame &Timer"]
+        assert sum(a.isSeparator() for a in actions) == 2
+        assert win._sidebar_action.isCheckable() and not win._sidebar_action.isChecked()
+        assert win._word_wrap_action.isChecked() == win._word_wrap_enabled
+        assert win._status_bar_action.isChecked()
+        assert not win._swap_panes_action.isEnabled()
+        assert win._word_wrap_action.shortcut().isEmpty()
+        assert win._frame_timer_action.shortcut() == QKeySequence("Ctrl+P")
+
+    def test_actions_added_in_runs_between_separators(self, win):
+        menu = QMenu(win)
+        rows = (("A", None, "_on_about"), ("B", None, "_on_about"), None,
+                ("C", None, "_on_about"))
+        with patch.object(menu, 'addActions', wraps=menu.addActions) as mock_add, \
+             patch.object(menu, 'addAction') as mock_single:
+            created = win._add_menu_actions(menu, rows)
+        assert [len(call.args[0]) for call in mock_add.call_args_list] == [2, 1]
+        mock_single.assert_not_called()
+        assert [a.text() for a in menu.actions() if not a.isSeparator()] == ["A", "B", "C"]
+        assert created == [a for a in menu.actions() if not a.isSeparator()]
+
+    def test_view_toggle_passes_checked_state(self, win):
+        with patch.object(win._status_bar, 'setVisible') as mock_visible:
+            win._status_bar_action.trigger()
+        mock_visible.assert_called_once_with(False)
+
+    def test_edit_menu_shortcuts(self, win):
+        actions = {a.text(): a for a in self._menu(win, "&Edit").actions()}
+        assert actions["&Find..."].shortcut() == QKeySequence("Ctrl+F")
+        assert actions["&Undo"].shortcut() == QKeySequence(QKeySequence.StandardKey.Undo)
+
+    def test_table_action_triggers_slot(self, win):
+        actions = {a.text(): a for a in self._menu(win, "&Settings").actions()}
+        menu = QMenu(win)
+        with patch.object(win, '_on_open_font_manager') as mock_slot:
+            win._add_menu_actions(menu, (("X", "Ctrl+Alt+X", "_on_open_font_manager"),))
+            menu.actions()[0].trigger()
+            mock_slot.assert_called_once()
+        assert actions["&Theme Manager..."].shortcut() == QKeySequence("Ctrl+,")
+
+    def test_menus_hide_tooltips(self, win):
+        menus = win.menuBar().findChildren(QMenu)
+        titles = {menu.title() for menu in menus}
+        assert {"&File", "&Edit", "&View", "&Settings", "&Quick Themes", "&Help"} <= titles
+        for menu in menus:
+            assert not menu.toolTipsVisible()
+            assert all(not a.statusTip() for a in menu.actions())
+
+
+class TestLazyHelpMenu:
+    """The Help menu is populated on first show only."""
+
+    def test_help_menu_empty_until_shown(self, win):
+        assert win._help_menu.actions() == []
+
+    def test_help_menu_built_once(self, win):
+        win._help_menu.aboutToShow.emit()
+        win._help_menu.aboutToShow.emit()
+        assert [a.text() for a in win._help_menu.actions()] == ["&About"]
+
+    @patch.object(QMessageBox, 'about')
+    def test_about_action_triggers(self, mock_about, win):
+        win._help_menu.aboutToShow.emit()
+        win._help_menu.actions()[0].trigger()
+        mock_about.assert_called_once()
+
+
+class TestLazyThemesMenu:
+    """Quick Themes actions are built when the submenu opens and the list is stale."""
+
+    def test_themes_menu_empty_until_shown(self, win):
+        assert win._themes_menu.actions() == []
+        assert win._themes_dirty
+
+    def test_rebuild_skipped_when_clean(self, win):
+        win._themes_menu.aboutToShow.emit()
+        actions = win._themes_menu.actions()
+        assert actions and not win._themes_dirty
+        win._themes_menu.aboutToShow.emit()
+        assert win._themes_menu.actions() == actions
+
+    def test_settings_close_keeps_menu_when_names_unchanged(self, win):
+        win._themes_menu.aboutToShow.emit()
+        with patch('editor.settings_dialog.SettingsDialog'):
+            win._on_open_settings()
+        assert not win._themes_dirty
+
+    def test_settings_close_marks_dirty_when_names_change(self, win):
+        win._themes_menu.aboutToShow.emit()
+        names = win._theme_menu_names + ("Brand New Theme",)
+        with patch('editor.settings_dialog.SettingsDialog'), \
+                patch.object(win, '_theme_names', return_value=names):
+            win._on_open_settings()
+        assert win._themes_dirty
+
+    def test_settings_theme_change_moves_checkmark(self, win):
+        win._on_theme_changed("Light")
+        win._themes_menu.aboutToShow.emit()
+        actions = win._themes_menu.actions()
+        win._on_settings_theme_changed("Dark")
+        assert not win._themes_dirty
+        assert win._themes_menu.actions() == actions
+        assert win._theme_actions["Dark"].isChecked()
+        assert not win._theme_actions["Light"].isChecked()
+
+    def test_rebuild_parents_actions_to_menu(self, win):
+        win._rebuild_themes_menu()
+        count = len(win.findChildren(QAction))
+        win._rebuild_themes_menu()
+        assert all(a.parent() is win._themes_menu for a in win._themes_menu.actions())
+        assert len(win.findChildren(QAction)) == count
+
+    def test_rebuild_deletes_old_actions(self, win):
+        from shiboken6 import Shiboken
+        win._rebuild_themes_menu()
+        old = list(win._theme_actions.values())
+        win._rebuild_themes_menu()
+        assert old and not any(Shiboken.isValid(a) for a in old)
+        assert all(Shiboken.isValid(a) for a in win._theme_actions.values())
+
+    def test_triggering_theme_action_applies_theme(self, win):
+        win._on_theme_changed("Light")
+        win._rebuild_themes_menu()
+        win._theme_actions["Dark"].trigger()
+        assert win._theme_manager.current_theme_name == "Dark"
+        assert win._theme_actions["Dark"].isChecked()
+
+
+class TestDeferredDialogImports:
+    """Dialog modules are imported by their handlers, not by main_window."""
+
+    def test_import_does_not_load_dialog_modules(self):
+        code = (
+            "import sys, editor.main_window; "
+            "print(sorted(m for m in ('editor.find_replace', 'editor.settings_dialog') "
+            "if m in sys.modules))"
+        )
+        root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+        out = subprocess.run([sys.executable, "-c", code], capture_output=True,
+                             text=True, check=True, cwd=root).stdout
+        assert out.strip() == "[]"
+
+    def test_find_dialog_created_on_first_use(self, win):
+        assert win._find_replace_dialog is None
+        win._on_find()
+        assert win._find_replace_dialog is not None
+
+
+class TestSlotDecorators:
+    """Signal handlers are registered on the window's QMetaObject."""
+
+    @pytest.mark.parametrize("signature", [
+        "_on_new()",
+        "_on_save()",
+        "_on_toggle_sidebar(bool)",
+        "_on_document_changed(PyObject)",
+        "_on_save_and_close_tab(PyObject,int,PyObject)",
+        "_on_file_tree_open(QString)",
+        "_on_font_apply(QFont,bool)",
+    ])
+    def test_slot_registered(self, win, signature):
+        assert win.metaObject().indexOfSlot(signature) != -1
+
+    def test_decorated_slot_keeps_return_value(self, win, tmp_path):
+        win._split_container.active_document.file_path = str(tmp_path / "a.txt")
+        with patch.object(win, '_save_document', return_value=True):
+            assert win._on_save() is True
+
+
+class TestKeyDispatch:
+    """Save and Open are dispatched from keyPressEvent, not QAction shortcuts."""
+
+    def _file_action(self, win, prefix):
+        file_menu = next(m for m in win.menuBar().findChildren(QMenu)
+                         if m.title() == "&File")
+        return next(a for a in file_menu.actions() if a.text().startswith(prefix))
+
+    def test_save_action_has_hint_but_no_shortcut(self, win):
+        action = self._file_action(win, "&Save\t")
+        assert action.shortcut().isEmpty()
+        hint = QKeySequence(QKeySequence.StandardKey.Save).toString(
+            QKeySequence.SequenceFormat.NativeText)
+        assert action.text() == f"&Save\t{hint}"
+
+    def test_other_actions_keep_shortcuts(self, win):
+        assert self._file_action(win, "&New").shortcut() == \
+            QKeySequence(QKeySequence.StandardKey.New)
+
+    def test_ctrl_s_from_editor_saves(self, win):
+        editor = win._get_active_editor()
+        with patch.object(win, '_on_save') as mock_save:
+            QTest.keyClick(editor, Qt.Key.Key_S, Qt.KeyboardModifier.ControlModifier)
+        mock_save.assert_called_once_with()
+
+    def test_ctrl_o_dispatches_open(self, win):
+        with patch.object(win, '_on_open') as mock_open:
+            QTest.keyClick(win, Qt.Key.Key_O, Qt.KeyboardModifier.ControlModifier)
+        mock_open.assert_called_once_with()
+
+    def test_unmapped_key_falls_through(self, win):
+        with patch.object(win, '_on_save') as mock_save:
+            QTest.keyClick(win, Qt.Key.Key_J, Qt.KeyboardModifier.ControlModifier)
+        mock_save.assert_not_called()
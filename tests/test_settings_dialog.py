@@ -7,7 +7,7 @@ import json
 import tempfile
 import pytest
 from unittest.mock import patch, MagicMock
-from PySide6.QtWidgets import QApplication
+from PySide6.QtWidgets import QApplication, QMessageBox
 from PySide6.QtCore import Qt
 
 from editor.settings_dialog import (
@@ -55,6 +55,42 @@ class TestColorButton:
         btn = ColorButton()
         assert hasattr(btn, 'color_changed')
         btn.deleteLater()
+    
+    def test_swatch_painted_in_color(self, qapp):
+        """The button paints its own swatch in the current color."""
+        btn = ColorButton("#123456")
+        image = btn.grab().toImage()
+        center = image.pixelColor(image.width() // 2, image.height() // 2)
+        assert center.name() == "#123456"
+        assert btn.styleSheet() == ""
+        btn.color = "#654321"
+        image = btn.grab().toImage()
+        assert image.pixelColor(image.width() // 2, image.height() // 2).name() == "#654321"
+        btn.deleteLater()
+    
+    def test_hover_switches_border(self, qapp):
+        """Entering and leaving the swatch toggles the highlighted border."""
+        from PySide6.QtCore import QEvent, QPointF
+        from PySide6.QtGui import QEnterEvent
+        btn = ColorButton("#123456")
+        btn.enterEvent(QEnterEvent(QPointF(5, 5), QPointF(5, 5), QPointF(5, 5)))
+        assert btn._hovered
+        image = btn.grab().toImage()
+        assert image.pixelColor(image.width() // 2, 1).name() == "#888888"
+        btn.leaveEvent(QEvent(QEvent.Type.Leave))
+        assert not btn._hovered
+        image = btn.grab().toImage()
+        assert image.pixelColor(image.width() // 2, 1).name() == "#555555"
+        btn.deleteLater()
+    
+    def test_set_colors_does_not_touch_stylesheets(self, qapp):
+        """Switching theme colors repaints swatches without any stylesheet call."""
+        editor = ThemeEditorWidget()
+        colors = {field_id: "#0a0b0c" for field_id, _ in ThemeEditorWidget.COLOR_FIELDS}
+        with patch.object(ColorButton, 'setStyleSheet') as mock_qss:
+            editor.set_colors(colors)
+        mock_qss.assert_not_called()
+        editor.deleteLater()
 
 
 class TestThemeEditorWidget:
@@ -93,12 +129,63 @@ class TestThemeEditorWidget:
         editor = ThemeEditorWidget()
         editor.deleteLater()
     
+    def test_groups_built_from_color_groups(self, qapp):
+        """Test each group box holds exactly its fields, in declared order."""
+        from PySide6.QtWidgets import QGroupBox, QFormLayout
+        editor = ThemeEditorWidget()
+        boxes = editor.findChildren(QGroupBox)
+        assert [box.title() for box in boxes] == list(ThemeEditorWidget.COLOR_GROUPS)
+        for box in boxes:
+            form = box.layout()
+            buttons = [form.itemAt(row, QFormLayout.ItemRole.FieldRole).widget()
+                       for row in range(form.rowCount())]
+            expected = [editor._color_buttons[field_id]
+                        for field_id, _ in ThemeEditorWidget.COLOR_GROUPS[box.title()]]
+            assert buttons == expected
+        assert len(editor._color_buttons) == len(ThemeEditorWidget.COLOR_FIELDS) == 27
+        editor.deleteLater()
+    
     def test_theme_modified_signal_exists(self, qapp):
         """Test theme_modified signal exists."""
         editor = ThemeEditorWidget()
         assert hasattr(editor, 'theme_modified')
         editor.deleteLater()
 
+    def test_set_colors_skips_unchanged_buttons(self, qapp):
+        """Test set_colors only restyles buttons whose color differs."""
+        editor = ThemeEditorWidget()
+        editor.set_colors({"editor_background": "#123456", "editor_text": "#abcdef"})
+        with patch.object(ColorButton, 'update') as mock_style:
+            editor.set_colors({"editor_background": "#123456", "editor_text": "#000001"})
+        mock_style.assert_called_once()
+        assert editor.get_colors()["editor_text"] == "#000001"
+        editor.deleteLater()
+
+    def test_color_changes_coalesce_into_one_theme_modified(self, qapp):
+        """Test a burst of color changes emits theme_modified once, deferred."""
+        editor = ThemeEditorWidget()
+        received = []
+        editor.theme_modified.connect(lambda: received.append(True))
+        for btn in editor._color_buttons.values():
+            btn.color_changed.emit("#010203")
+        assert received == []
+        assert editor._modified_timer.isActive()
+        editor._modified_timer.stop()
+        editor._modified_timer.timeout.emit()
+        assert received == [True]
+        editor.deleteLater()
+
+    def test_theme_modified_delivered_on_next_loop_pass(self, qapp):
+        """Test the queued theme_modified arrives once events are processed."""
+        editor = ThemeEditorWidget()
+        received = []
+        editor.theme_modified.connect(lambda: received.append(True))
+        editor._color_buttons["editor_text"].color_changed.emit("#010203")
+        editor._color_buttons["editor_background"].color_changed.emit("#040506")
+        qapp.processEvents()
+        assert received == [True]
+        editor.deleteLater()
+
 
 class TestThemeManagerEnhancements:
     """Tests for ThemeManager custom theme support."""
@@ -210,6 +297,27 @@ class TestGenerateStylesheet:
         """Test stylesheet uses defaults for missing colors."""
         stylesheet = generate_stylesheet_from_colors({})
         assert "#1e1e1e" in stylesheet
+    
+    def test_same_palette_reuses_stylesheet(self):
+        """Equal palettes, in any key order, return the cached stylesheet."""
+        first = {"editor_background": "#010203", "editor_text": "#040506"}
+        second = {"editor_text": "#040506", "editor_background": "#010203"}
+        assert generate_stylesheet_from_colors(first) is generate_stylesheet_from_colors(second)
+    
+    def test_unhashable_value_renders_uncached(self):
+        """A non-string value from a custom theme's JSON still renders."""
+        stylesheet = generate_stylesheet_from_colors(
+            {"editor_background": "#010203", "extra": ["not", "a", "color"]})
+        assert "#010203" in stylesheet
+    
+    def test_changed_palette_regenerates_stylesheet(self):
+        """A changed color produces a fresh stylesheet."""
+        colors = {"editor_background": "#010203"}
+        before = generate_stylesheet_from_colors(colors)
+        colors["editor_background"] = "#0a0b0c"
+        after = generate_stylesheet_from_colors(colors)
+        assert "#0a0b0c" in after
+        assert "#0a0b0c" not in before
 
 
 class TestBuiltinThemeColors:
@@ -272,6 +380,31 @@ class TestSettingsDialog:
         dialog = SettingsDialog(manager)
         assert hasattr(dialog, 'theme_changed')
         dialog.deleteLater()
+    
+    def test_theme_widget_built_on_first_show(self, qapp):
+        """Test the theme editor is only constructed when the dialog is shown."""
+        manager = ThemeManager()
+        dialog = SettingsDialog(manager)
+        assert dialog._theme_widget is None
+        dialog.show()
+        widget = dialog._theme_widget
+        assert isinstance(widget, ThemeManagerWidget)
+        assert dialog.layout().itemAt(0).widget() is widget
+        dialog.hide()
+        dialog.show()
+        assert dialog._theme_widget is widget
+        dialog.hide()
+        dialog.deleteLater()
+    
+    def test_theme_widget_forwards_applied_theme(self, qapp):
+        """Test applying a theme in the lazily built widget reaches the dialog."""
+        manager = ThemeManager()
+        dialog = SettingsDialog(manager)
+        received = []
+        dialog.theme_changed.connect(received.append)
+        dialog._ensure_theme_widget().theme_applied.emit("Dark")
+        assert received == ["Dark"]
+        dialog.deleteLater()
 
 
 class TestThemeManagerWidget:
@@ -340,6 +473,44 @@ class TestColorButtonColorPicking:
         assert btn.color == "#ff0000"
         btn.deleteLater()
 
+    def test_picking_same_color_is_a_no_op(self, qapp):
+        """Test re-picking the current color neither restyles nor signals."""
+        from PySide6.QtGui import QColor
+
+        btn = ColorButton("#FF0000")
+        signal_emitted = []
+        btn.color_changed.connect(lambda color: signal_emitted.append(color))
+
+        with patch('PySide6.QtWidgets.QColorDialog.getColor',
+                   return_value=QColor("#ff0000")), \
+                patch.object(btn, 'update') as mock_style:
+            btn._pick_color()
+
+        assert signal_emitted == []
+        mock_style.assert_not_called()
+        assert btn.color == "#FF0000"
+        btn.deleteLater()
+
+    def test_setting_same_color_skips_restyle(self, qapp):
+        """Test assigning the current color does not reapply the stylesheet."""
+        btn = ColorButton("#123456")
+        with patch.object(btn, 'update') as mock_style:
+            btn.color = "#123456"
+            mock_style.assert_not_called()
+            btn.color = "#654321"
+            mock_style.assert_called_once()
+        btn.deleteLater()
+
+    def test_buttons_share_interned_color(self, qapp):
+        """Test buttons holding the same color share one string object."""
+        first = ColorButton()
+        first.color = "".join(["#12", "3456"])
+        second = ColorButton()
+        second.color = "".join(["#1234", "56"])
+        assert first.color is second.color
+        first.deleteLater()
+        second.deleteLater()
+
 
 class TestThemeManagerWidget:
     """Tests for ThemeManagerWidget."""
@@ -395,7 +566,172 @@ class TestThemeManagerWidget:
             
             # Should have one more theme
             assert widget._theme_list.count() > initial_count
-            
+
+            widget.close()
+            widget.deleteLater()
+
+    def test_theme_colors_fetched_once_per_theme(self, qapp):
+        """Test reselecting a theme reuses its cached colors."""
+        manager = ThemeManager()
+        widget = ThemeManagerWidget(manager)
+        first = widget._theme_list.item(0)
+        second = widget._theme_list.item(1)
+        with patch.object(manager, 'get_theme_colors',
+                          wraps=manager.get_theme_colors) as mock_get:
+            widget._theme_list.setCurrentItem(first)
+            widget._theme_list.setCurrentItem(second)
+            widget._theme_list.setCurrentItem(first)
+            widget._theme_list.setCurrentItem(second)
+        assert mock_get.call_count <= 2
+        widget.close()
+        widget.deleteLater()
+
+    def test_save_invalidates_cached_colors(self, qapp, tmp_path):
+        """Test saving a theme drops its cached colors."""
+        themes_dir = tmp_path / "themes"
+        themes_dir.mkdir()
+
+        with patch('editor.theme_manager.get_themes_dir', return_value=str(themes_dir)):
+            manager = ThemeManager()
+            manager._custom_themes = {}
+            widget = ThemeManagerWidget(manager)
+            widget._on_new_theme()
+            assert "Custom Theme" in widget._color_cache
+
+            widget._theme_editor.set_colors({"editor_background": "#010101"})
+            widget._on_save_theme()
+
+            assert widget._theme_colors("Custom Theme")["editor_background"] == "#010101"
+
+            widget.close()
+            widget.deleteLater()
+
+    def test_new_and_duplicate_skip_taken_names(self, qapp, tmp_path):
+        """Test generated names step past every taken theme name."""
+        themes_dir = tmp_path / "themes"
+        themes_dir.mkdir()
+
+        with patch('editor.theme_manager.get_themes_dir', return_value=str(themes_dir)):
+            manager = ThemeManager()
+            manager._custom_themes = {}
+            colors = manager.get_theme_colors("Dark")
+            for name in ("Custom Theme", "Custom Theme 2", "Dark Copy"):
+                manager.save_custom_theme(name, colors)
+            widget = ThemeManagerWidget(manager)
+
+            widget._on_new_theme()
+            assert widget._current_theme_name == "Custom Theme 3"
+
+            widget._select_item(widget._name_to_item["Dark"])
+            widget._on_duplicate_theme()
+            assert widget._current_theme_name == "Dark Copy 2"
+
+            widget.close()
+            widget.deleteLater()
+
+    def test_save_and_duplicate_keep_editor_colors(self, qapp, tmp_path):
+        """Test save and duplicate select their entry without reloading colors."""
+        themes_dir = tmp_path / "themes"
+        themes_dir.mkdir()
+
+        with patch('editor.theme_manager.get_themes_dir', return_value=str(themes_dir)):
+            manager = ThemeManager()
+            manager._custom_themes = {}
+            widget = ThemeManagerWidget(manager)
+            with patch.object(widget._theme_editor, 'set_colors') as mock_set:
+                widget._on_new_theme()
+                assert mock_set.call_count == 1
+                widget._on_save_theme()
+                widget._on_duplicate_theme()
+            assert mock_set.call_count == 1
+
+            copy = widget._name_to_item["Custom Theme Copy"]
+            assert widget._theme_list.currentItem() is copy
+            assert widget._current_theme_name == "Custom Theme Copy"
+            assert widget._name_edit.text() == "Custom Theme Copy"
+            assert not widget._name_edit.isReadOnly()
+            assert widget._delete_btn.isEnabled()
+            assert not widget._is_modified
+
+            widget.close()
+            widget.deleteLater()
+
+    def test_new_theme_appends_without_reload(self, qapp, tmp_path):
+        """Test a new theme is appended and selected without rebuilding the list."""
+        themes_dir = tmp_path / "themes"
+        themes_dir.mkdir()
+
+        with patch('editor.theme_manager.get_themes_dir', return_value=str(themes_dir)):
+            manager = ThemeManager()
+            manager._custom_themes = {}
+            widget = ThemeManagerWidget(manager)
+            initial_count = widget._theme_list.count()
+            first = widget._theme_list.item(0)
+
+            with patch.object(widget, '_load_themes') as mock_load:
+                widget._on_new_theme()
+                widget._on_duplicate_theme()
+            mock_load.assert_not_called()
+
+            assert widget._theme_list.count() == initial_count + 2
+            assert widget._theme_list.item(0) is first
+            copy = widget._name_to_item["Custom Theme Copy"]
+            assert widget._theme_list.currentItem() is copy
+            assert widget._theme_list.row(copy) == initial_count + 1
+            assert widget._name_edit.text() == "Custom Theme Copy"
+            assert not widget._is_modified
+
+            widget.close()
+            widget.deleteLater()
+
+    def test_save_rename_relabels_item_in_place(self, qapp, tmp_path):
+        """Test renaming a custom theme updates its entry and the name index."""
+        themes_dir = tmp_path / "themes"
+        themes_dir.mkdir()
+
+        with patch('editor.theme_manager.get_themes_dir', return_value=str(themes_dir)):
+            manager = ThemeManager()
+            manager._custom_themes = {}
+            widget = ThemeManagerWidget(manager)
+            widget._on_new_theme()
+            item = widget._theme_list.currentItem()
+            count = widget._theme_list.count()
+
+            widget._name_edit.setText("Renamed")
+            widget._on_save_theme()
+
+            assert widget._theme_list.count() == count
+            assert widget._theme_list.currentItem() is item
+            assert item.data(Qt.ItemDataRole.UserRole) == ("custom", "Renamed")
+            assert "Renamed" in item.text()
+            assert widget._name_to_item["Renamed"] is item
+            assert "Custom Theme" not in widget._name_to_item
+
+            widget.close()
+            widget.deleteLater()
+
+    def test_delete_takes_item_and_drops_index(self, qapp, tmp_path):
+        """Test deleting a custom theme removes only its entry."""
+        themes_dir = tmp_path / "themes"
+        themes_dir.mkdir()
+
+        with patch('editor.theme_manager.get_themes_dir', return_value=str(themes_dir)):
+            manager = ThemeManager()
+            manager._custom_themes = {}
+            widget = ThemeManagerWidget(manager)
+            widget._on_new_theme()
+            count = widget._theme_list.count()
+
+            with patch.object(QMessageBox, 'question',
+                              return_value=QMessageBox.StandardButton.Yes):
+                widget._on_delete_theme()
+
+            assert widget._theme_list.count() == count - 1
+            assert "Custom Theme" not in widget._name_to_item
+            current = widget._theme_list.currentItem()
+            assert current is not None
+            assert widget._name_edit.text() == current.data(Qt.ItemDataRole.UserRole)[1]
+
             widget.close()
             widget.deleteLater()
 
@@ -9,7 +9,7 @@ Comprehensive tests for SplitContainer coverage including:
 import pytest
 from unittest.mock import MagicMock, patch, Mock
 from PySide6.QtWidgets import QApplication, QMessageBox
-from PySide6.QtCore import Qt, QPoint, QMimeData
+from PySide6.QtCore import Qt, QPoint, QRect, QMimeData
 from PySide6.QtGui import QDrag, QMouseEvent
 from PySide6.QtCore import QByteArray
 
@@ -462,6 +462,50 @@ class TestSplitContainerDragDrop:
         
         event.acceptProposedAction.assert_called_once()
     
+    def test_tab_bar_drop_routes_to_its_pane(self, container):
+        """A drop on a pane's tab bar transfers the tab into that pane."""
+        doc1 = container.add_new_document()
+        doc2 = container.add_new_document()
+        container.create_split(doc2, "right")
+        left_pane, right_pane = container._panes
+        
+        event = Mock()
+        event.mimeData.return_value = Mock()
+        event.mimeData.return_value.hasFormat.return_value = True
+        event.mimeData.return_value.data.return_value = QByteArray(b"0")
+        event.source.return_value = left_pane.tab_bar
+        event.position.return_value = Mock()
+        event.position.return_value.toPoint.return_value = QPoint(0, 0)
+        moved = left_pane.get_document_at(0)
+        
+        right_pane.tab_bar.dropEvent(event)
+        
+        assert moved in right_pane.documents
+        assert container.get_pane_for_document(moved) is right_pane
+    
+    def test_tab_bar_drop_uses_tracked_drag(self, container):
+        """A drop from the tracked drag source skips decoding the MIME payload."""
+        container.add_new_document()
+        doc2 = container.add_new_document()
+        container.create_split(doc2, "right")
+        left_pane, right_pane = container._panes
+        left_pane.add_new_document()
+        moved = left_pane.get_document_at(1)
+        container._on_tab_drag_started(1, left_pane)
+        
+        event = Mock()
+        event.mimeData.return_value = Mock()
+        event.mimeData.return_value.hasFormat.return_value = True
+        event.source.return_value = left_pane.tab_bar
+        event.position.return_value = Mock()
+        event.position.return_value.toPoint.return_value = QPoint(0, 0)
+        
+        container._handle_tab_bar_drop(right_pane, event)
+        
+        event.mimeData.return_value.data.assert_not_called()
+        assert moved in right_pane.documents
+        assert container._dragging_source_pane is None
+    
     def test_handle_tab_bar_drop_ignores_wrong_mime(self, container):
         """_handle_tab_bar_drop ignores wrong MIME type."""
         pane = container.active_pane
@@ -549,6 +593,141 @@ class TestSplitContainerIndicatorGeometry:
         assert geom.width() == 100
         assert geom.height() == 100
 
+    def _move_event(self, x):
+        event = Mock()
+        event.mimeData.return_value = Mock()
+        event.mimeData.return_value.hasFormat.return_value = True
+        event.position.return_value = Mock()
+        event.position.return_value.toPoint.return_value = QPoint(x, 50)
+        return event
+
+    def test_moves_within_same_half_keep_indicator(self, container):
+        """Indicator geometry is only set when the drag crosses halves."""
+        container.resize(200, 100)
+        container.add_new_document()
+        container._dragging_source_pane = container.active_pane
+        container._dragging_tab_index = 1
+
+        with patch.object(container._drop_indicator, 'setGeometry') as mock_geom:
+            container.dragMoveEvent(self._move_event(20))
+            container.dragMoveEvent(self._move_event(60))
+            assert mock_geom.call_count == 1
+            container.dragMoveEvent(self._move_event(150))
+            assert mock_geom.call_count == 2
+
+    def test_leave_forgets_indicator_edge(self, container):
+        """After the drag leaves, re-entering the same half repositions the indicator."""
+        container.resize(200, 100)
+        container.add_new_document()
+        container._dragging_source_pane = container.active_pane
+        container._dragging_tab_index = 1
+
+        container.dragMoveEvent(self._move_event(20))
+        container.dragLeaveEvent(Mock())
+        assert container._indicator_edge is None
+        with patch.object(container._drop_indicator, 'setGeometry') as mock_geom:
+            container.dragMoveEvent(self._move_event(20))
+        mock_geom.assert_called_once()
+
+    def test_small_moves_are_not_reevaluated(self, container):
+        """Moves shorter than DRAG_INTERVAL are accepted without re-checking the edge."""
+        container.resize(200, 100)
+        container.add_new_document()
+        container._dragging_source_pane = container.active_pane
+        container._dragging_tab_index = 1
+
+        container.dragMoveEvent(self._move_event(96))
+        event = self._move_event(96 + container.DRAG_INTERVAL - 1)
+        with patch.object(container, '_get_edge') as mock_edge:
+            container.dragMoveEvent(event)
+        mock_edge.assert_not_called()
+        event.acceptProposedAction.assert_called_once()
+        assert container._indicator_edge == "left"
+
+        container.dragMoveEvent(self._move_event(96 + container.DRAG_INTERVAL))
+        assert container._indicator_edge == "right"
+
+    def test_drag_geometry_cached_per_drag(self, container):
+        """The container size is read once per drag, not per move."""
+        container.resize(200, 100)
+        container.add_new_document()
+        container._dragging_source_pane = container.active_pane
+        container._dragging_tab_index = 1
+        container.dragEnterEvent(self._move_event(20))
+        assert container._drag_mid == 100
+
+        with patch.object(container, 'width') as mock_width:
+            container.dragMoveEvent(self._move_event(20))
+            container.dragMoveEvent(self._move_event(150))
+        mock_width.assert_not_called()
+        assert container._drop_indicator.geometry().x() == 100
+
+    def test_odd_width_midpoint_matches_get_edge(self, container):
+        """The cached midpoint splits odd widths like width / 2 does."""
+        container.resize(201, 100)
+        assert container._get_edge(QPoint(100, 50)) == "left"
+        container.dragEnterEvent(self._move_event(0))
+        assert container._get_edge(QPoint(100, 50)) == "left"
+        assert container._get_edge(QPoint(101, 50)) == "right"
+
+    def test_leave_clears_drag_geometry(self, container):
+        """Leaving the container drops the cached geometry."""
+        container.dragEnterEvent(self._move_event(0))
+        container.dragLeaveEvent(Mock())
+        assert container._drag_mid is None
+
+    def test_moves_without_indicator_do_not_hide(self, container):
+        """Moves that cannot split skip hide() while nothing is shown."""
+        container.resize(200, 100)
+        with patch.object(container._drop_indicator, 'hide') as mock_hide:
+            container.dragMoveEvent(self._move_event(20))
+            container.dragMoveEvent(self._move_event(150))
+        mock_hide.assert_not_called()
+
+    def test_indicator_hidden_when_split_no_longer_possible(self, container):
+        """A shown indicator is hidden once the drag can no longer split."""
+        container.resize(200, 100)
+        container.add_new_document()
+        container._dragging_source_pane = container.active_pane
+        container._dragging_tab_index = 1
+        container.dragMoveEvent(self._move_event(20))
+        assert container._indicator_edge == "left"
+
+        container._dragging_source_pane = None
+        container.dragMoveEvent(self._move_event(60))
+        assert container._indicator_edge is None
+        assert not container._drop_indicator.isVisible()
+
+    def test_drag_move_does_not_call_get_edge(self, container):
+        """dragMoveEvent compares against the cached midpoint itself."""
+        container.resize(200, 100)
+        container.add_new_document()
+        container._dragging_source_pane = container.active_pane
+        container._dragging_tab_index = 1
+        with patch.object(container, '_get_edge') as mock_edge:
+            container.dragMoveEvent(self._move_event(99))
+            container.dragMoveEvent(self._move_event(150))
+        mock_edge.assert_not_called()
+        assert container._indicator_edge == "right"
+
+    def test_drag_rects_reused_across_drags(self, container):
+        """Each drag updates the same indicator rects in place."""
+        rects = dict(container._drag_rects)
+        container.resize(200, 100)
+        container.dragEnterEvent(self._move_event(0))
+        container.dragLeaveEvent(Mock())
+        container.resize(300, 80)
+        container.dragEnterEvent(self._move_event(0))
+
+        assert all(container._drag_rects[edge] is rects[edge] for edge in rects)
+        assert container._drag_rects["right"] == QRect(150, 0, 150, 80)
+
+    def test_reset_drag_state_clears_last_drag_x(self, container):
+        """A new drag re-evaluates its first move even at the old position."""
+        container._last_drag_x = 50
+        container._reset_drag_state()
+        assert container._last_drag_x == -9999
+
 
 class TestSplitContainerRemovePane:
     """Tests for pane removal logic."""
@@ -574,3 +753,193 @@ class TestSplitContainerRemovePane:
         container._remove_pane(fake_pane)
         
         assert len(container._panes) == initial_count
+
+
+class TestSplitContainerSignalSignatures:
+    """Document signals are declared with the Document type."""
+    
+    @pytest.mark.parametrize("signature", [
+        "active_document_changed(PyObject)",
+        "document_modified(PyObject,bool)",
+        "save_document_requested(PyObject,int,PyObject)",
+    ])
+    def test_signal_signature(self, container, signature):
+        """Each document signal resolves to its normalized signature."""
+        assert container.metaObject().indexOfSignal(signature) != -1
+    
+    def test_active_document_changed_delivers_document(self, container):
+        """A typed signal still carries the Document instance through."""
+        received = []
+        container.active_document_changed.connect(received.append)
+        doc = Document()
+        container.active_document_changed.emit(doc)
+        container.active_document_changed.emit(None)
+        
+        assert received == [doc, None]
+
+
+class TestSplitContainerPaneCreation:
+    """Split panes are created and wired like the initial pane."""
+    
+    def test_split_pane_is_wired_like_initial_pane(self, container):
+        """A split pane is placed first and indexes its documents."""
+        doc = container.add_new_document()
+        container.add_new_document()
+        
+        container.create_split(doc, "left")
+        
+        new_pane = container._panes[0]
+        assert container._splitter.widget(0) is new_pane
+        assert container.get_pane_for_document(doc) is new_pane
+
+
+class TestSplitContainerSignalCoalescing:
+    """Multi-step pane operations emit layout and active-document signals once."""
+    
+    def _record(self, container):
+        emitted = []
+        container.layout_changed.connect(lambda: emitted.append("layout"))
+        container.active_document_changed.connect(lambda doc: emitted.append(doc))
+        return emitted
+    
+    def test_create_split_emits_each_signal_once(self, container):
+        """A split reports the moved document and one layout change."""
+        container.add_new_document()
+        doc = container.add_new_document()
+        emitted = self._record(container)
+        
+        container.create_split(doc, "right")
+        
+        assert emitted == [doc, "layout"]
+    
+    def test_transfer_emptying_pane_emits_one_layout_change(self, container):
+        """Emptying the source pane reports one layout change and no stale doc."""
+        container.add_new_document()
+        doc = container.add_new_document()
+        container.create_split(doc, "right")
+        left, right = container._panes
+        emitted = self._record(container)
+        
+        container.transfer_document(doc, right, left)
+        
+        assert emitted == ["layout"]
+    
+    def test_swap_emits_layout_after_swapped(self, container):
+        """A swap reports split_swapped, then one layout change once it is done."""
+        container.add_new_document()
+        doc = container.add_new_document()
+        container.create_split(doc, "right")
+        emitted = self._record(container)
+        container.split_swapped.connect(
+            lambda: emitted.append(("swapped", container._signal_suspend_depth)))
+        
+        container.swap_panes()
+        
+        assert emitted == [("swapped", 1), "layout"]
+    
+    def test_nested_suspension_waits_for_outermost(self, container):
+        """Queued signals are only emitted when the outer block exits."""
+        emitted = self._record(container)
+        
+        with container._suspend_signals():
+            with container._suspend_signals():
+                container._emit("layout_changed")
+            assert emitted == []
+            container._emit("layout_changed")
+        
+        assert emitted == ["layout"]
+    
+    def test_emit_outside_suspension_is_immediate(self, container):
+        """Without a suspension, _emit forwards straight to the signal."""
+        emitted = self._record(container)
+        
+        container._emit("layout_changed")
+        
+        assert emitted == ["layout"]
+
+
+class TestSplitContainerModifiedDocuments:
+    """modified_documents lists only documents with unsaved changes."""
+    
+    def test_only_modified_documents_returned(self, container):
+        """Unmodified documents are filtered out, order is kept."""
+        first = container.add_new_document()
+        clean = container.add_new_document()
+        last = container.add_new_document()
+        first.is_modified = True
+        last.is_modified = True
+        
+        assert container.modified_documents == [first, last]
+        assert clean not in container.modified_documents
+    
+    def test_spans_split_panes(self, container):
+        """Documents from both panes of a split are included."""
+        doc = container.add_new_document()
+        container.add_new_document()
+        container.create_split(doc, "right")
+        doc.is_modified = True
+        
+        assert container.modified_documents == [doc]
+
+
+class TestSplitContainerEditors:
+    """editors exposes each pane's editor without reaching into _panes."""
+    
+    def test_single_pane(self, container):
+        """An unsplit container has one editor."""
+        assert container.editors == [container._panes[0].editor]
+    
+    def test_split_panes_in_order(self, container):
+        """A split lists both editors in pane order."""
+        doc = container.add_new_document()
+        container.add_new_document()
+        container.create_split(doc, "right")
+        
+        assert container.editors == [pane.editor for pane in container._panes]
+        assert len(container.editors) == 2
+
+
+class TestSplitContainerDocumentIndex:
+    """The document-to-pane index follows documents as they move between panes."""
+    
+    def test_new_documents_are_indexed(self, container):
+        """Documents added through the container or a tab bar are found."""
+        pane = container.active_pane
+        doc = container.add_new_document()
+        pane.tab_bar.new_tab_requested.emit()
+        
+        assert container.get_pane_for_document(doc) is pane
+        assert container.get_pane_for_document(pane.documents[-1]) is pane
+    
+    def test_split_and_transfer_update_index(self, container):
+        """Splitting and transferring re-point the moved document."""
+        doc = container.add_new_document()
+        other = container.add_new_document()
+        container.create_split(doc, "right")
+        left, right = container._panes
+        assert container.get_pane_for_document(doc) is right
+        
+        container.transfer_document(other, left, right)
+        assert container.get_pane_for_document(other) is right
+    
+    def test_merge_keeps_documents_indexed(self, container):
+        """After a merge every document maps to the remaining pane."""
+        doc = container.add_new_document()
+        container.add_new_document()
+        container.create_split(doc, "right")
+        
+        container.merge_panes()
+        
+        target = container._panes[0]
+        assert all(container.get_pane_for_document(d) is target
+                   for d in container.all_documents)
+        assert set(container._doc_to_pane.values()) == {target}
+    
+    def test_closed_document_is_dropped(self, container):
+        """A closed document is no longer found in any pane."""
+        pane = container.active_pane
+        doc = container.add_new_document()
+        
+        pane.close_document(doc)
+        
+        assert container.get_pane_for_document(doc) is None
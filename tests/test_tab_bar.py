@@ -270,6 +270,41 @@ class TestTabBarNewTabButton:
         
         # Button should be positioned
         assert tab_bar._new_tab_button.geometry().x() >= 0
+    
+    def test_bulk_tab_changes_reposition_once(self, tab_bar, qapp):
+        """Several tab changes queue a single '+' button reposition."""
+        from unittest.mock import patch
+        qapp.processEvents()
+        with patch.object(tab_bar, '_position_new_tab_button') as mock_position:
+            for i in range(5):
+                tab_bar.addTab(f"Tab {i}")
+            tab_bar.removeTab(0)
+            qapp.processEvents()
+        mock_position.assert_called_once()
+        assert not tab_bar._pending_reposition
+    
+    def test_reposition_reuses_last_tab_edge(self, tab_bar):
+        """Repeated repositions measure the last tab only once."""
+        from unittest.mock import patch
+        tab_bar.addTab("Tab 1")
+        tab_bar.addTab("Tab 2")
+        tab_bar._position_new_tab_button()
+        expected_x = tab_bar.tabRect(1).right() + 4
+        
+        with patch.object(tab_bar, 'tabRect', side_effect=AssertionError):
+            tab_bar._position_new_tab_button()
+        
+        assert tab_bar._new_tab_button.x() == expected_x
+    
+    def test_tab_changes_invalidate_last_tab_edge(self, tab_bar):
+        """Adding a tab moves the '+' button past the new last tab."""
+        tab_bar.addTab("Tab 1")
+        tab_bar._position_new_tab_button()
+        
+        tab_bar.addTab("A much longer second tab")
+        tab_bar._position_new_tab_button()
+        
+        assert tab_bar._new_tab_button.x() == tab_bar.tabRect(1).right() + 4
 
 
 class TestTabBarPaintEvent:
@@ -254,6 +254,50 @@ class TestTabBarDropIndicator:
         index = tab_bar.get_drop_index(QPoint(290, 15))
         
         assert index == tab_bar.count()
+    
+    def test_get_drop_index_matches_tab_centers(self, tab_bar):
+        """get_drop_index picks the first tab whose center is right of the point."""
+        tab_bar.resize(300, 30)
+        centers = [tab_bar.tabRect(i).center().x() for i in range(tab_bar.count())]
+        
+        for x in range(0, 300, 7):
+            expected = next((i for i, c in enumerate(centers) if x < c), len(centers))
+            assert tab_bar.get_drop_index(QPoint(x, 15)) == expected
+    
+    def test_get_drop_index_reuses_centers(self, tab_bar):
+        """Only the first tab's rect is re-read until the layout changes."""
+        tab_bar.get_drop_index(QPoint(10, 15))
+        with patch.object(tab_bar, 'tabRect', wraps=tab_bar.tabRect) as mock_rect:
+            tab_bar.get_drop_index(QPoint(50, 15))
+            tab_bar.get_drop_index(QPoint(90, 15))
+        assert [c.args for c in mock_rect.call_args_list] == [(0,), (0,)]
+    
+    def test_get_drop_index_follows_scrolling(self, tab_bar):
+        """Scrolling with the arrow buttons does not stale the cached centers."""
+        from PySide6.QtWidgets import QToolButton
+        for i in range(37):
+            tab_bar.addTab(f"Scrolled tab {i}")
+        tab_bar.resize(300, 30)
+        tab_bar.show()
+        QApplication.processEvents()
+        tab_bar.get_drop_index(QPoint(150, 15))
+        
+        right = tab_bar.findChild(QToolButton, "ScrollRightButton")
+        for _ in range(5):
+            right.click()
+        QApplication.processEvents()
+        
+        centers = [tab_bar.tabRect(i).center().x() for i in range(tab_bar.count())]
+        expected = next((i for i, c in enumerate(centers) if 150 < c), len(centers))
+        assert expected > 2
+        assert tab_bar.get_drop_index(QPoint(150, 15)) == expected
+    
+    def test_get_drop_index_sees_new_tabs(self, tab_bar):
+        """Inserting a tab drops the cached centers."""
+        tab_bar.get_drop_index(QPoint(10, 15))
+        tab_bar.addTab("Tab 4")
+        
+        assert tab_bar.get_drop_index(QPoint(10000, 15)) == 4
 
 
 class TestTabBarDragEvents:
@@ -326,6 +370,34 @@ class TestTabBarDragEvents:
         event.acceptProposedAction.assert_called_once()
         other_bar.deleteLater()
     
+    def test_drop_event_emits_tab_dropped(self, tab_bar):
+        """dropEvent hands accepted drops to tab_dropped receivers."""
+        event = Mock()
+        event.mimeData.return_value = Mock()
+        event.mimeData.return_value.hasFormat.return_value = True
+        other_bar = EditorTabBar()
+        event.source.return_value = other_bar
+        received = []
+        tab_bar.tab_dropped.connect(received.append)
+        
+        tab_bar.dropEvent(event)
+        
+        assert received == [event]
+        other_bar.deleteLater()
+    
+    def test_rejected_drop_does_not_emit(self, tab_bar):
+        """Drops from this bar never reach tab_dropped receivers."""
+        event = Mock()
+        event.mimeData.return_value = Mock()
+        event.mimeData.return_value.hasFormat.return_value = True
+        event.source.return_value = tab_bar
+        received = []
+        tab_bar.tab_dropped.connect(received.append)
+        
+        tab_bar.dropEvent(event)
+        
+        assert received == []
+    
     def test_drop_event_ignores_from_self(self, tab_bar):
         """dropEvent ignores drops from self."""
         event = Mock()
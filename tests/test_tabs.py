@@ -3,7 +3,7 @@ Tests for tab and pane management.
 """
 
 import pytest
-from unittest.mock import MagicMock, patch
+from unittest.mock import MagicMock, PropertyMock, patch
 from PySide6.QtWidgets import QApplication
 from PySide6.QtCore import Qt
 from PySide6.QtGui import QTextCursor
@@ -642,6 +642,69 @@ class TestEditorPaneInsertDocument:
         assert pane.current_document == doc1
 
 
+class TestEditorPaneIterDocuments:
+    """Tests for iterating a pane's documents without a copy."""
+    
+    def test_iter_documents_in_tab_order(self, pane):
+        """iter_documents yields documents in tab order."""
+        docs = [pane.add_new_document() for _ in range(3)]
+        pane.insert_document(0, Document())
+        
+        assert list(pane.iter_documents()) == pane.documents
+        assert list(pane.iter_documents())[1:] == docs
+    
+    def test_container_lists_skip_pane_copies(self, container):
+        """all_documents and modified_documents do not copy each pane's list."""
+        doc = container.add_new_document()
+        doc.is_modified = True
+        with patch.object(EditorPane, 'documents', new_callable=PropertyMock) as mock_docs:
+            all_docs = container.all_documents
+            modified = container.modified_documents
+        mock_docs.assert_not_called()
+        assert doc in all_docs
+        assert modified == [doc]
+
+
+class TestEditorPaneAddDocuments:
+    """Tests for appending documents in one batch."""
+    
+    def test_add_documents_appends_background_tabs(self, pane):
+        """Batched documents are appended without switching tabs."""
+        doc1 = pane.add_new_document()
+        batch = [Document(), Document()]
+        changed = []
+        pane.document_changed.connect(changed.append)
+        
+        pane.add_documents(batch)
+        
+        assert pane.documents == [doc1] + batch
+        assert pane.tab_bar.count() == 3
+        assert pane.current_document == doc1
+        assert changed == []
+    
+    def test_add_documents_saves_state_once(self, pane):
+        """The current document's state is saved once for the whole batch."""
+        pane.add_new_document()
+        with patch.object(pane, '_save_current_state') as mock_save:
+            pane.add_documents([Document(), Document(), Document()])
+        mock_save.assert_called_once()
+    
+    def test_add_documents_to_empty_pane_activates_first(self, pane):
+        """An empty pane shows the first batched document."""
+        batch = [Document(), Document()]
+        
+        pane.add_documents(batch)
+        
+        assert pane.current_document == batch[0]
+    
+    def test_add_documents_empty_is_noop(self, pane):
+        """Adding no documents leaves the pane untouched."""
+        with patch.object(pane, '_save_current_state') as mock_save:
+            pane.add_documents([])
+        mock_save.assert_not_called()
+        assert pane.document_count == 0
+
+
 class TestEditorPaneRemoveAt:
     """Tests for removing documents by index."""
     
@@ -673,6 +736,49 @@ class TestEditorPaneRemoveAt:
         assert len(signal_emitted) == 1
 
 
+class TestEditorPaneCloseDocument:
+    """Tests for closing documents and releasing their cached QTextDocument."""
+    
+    def test_close_releases_cached_document(self, pane):
+        """A closed background tab drops and disconnects its QTextDocument."""
+        doc1 = pane.add_new_document()
+        doc2 = pane.add_new_document()  # switching away caches doc1's document
+        cached = doc1.qt_document
+        assert cached is not None
+        
+        with patch.object(cached, 'deleteLater') as mock_delete:
+            assert pane.close_document(doc1) is True
+            mock_delete.assert_called_once()
+        assert doc1.qt_document is None
+        assert doc1 not in pane.documents
+        # The released document no longer reaches the pane's slot
+        with patch.object(pane, 'document_modified') as mock_signal:
+            cached.setModified(True)
+            mock_signal.emit.assert_not_called()
+    
+    def test_close_keeps_live_editor_document(self, pane):
+        """The editor's own document is never deleted out from under it."""
+        doc = pane.add_new_document()
+        doc.qt_document = pane.editor.document()
+        pane._release_qt_document(doc)
+        assert doc.qt_document is None
+        assert pane.editor.document() is not None
+        pane.editor.setPlainText("still usable")
+    
+    def test_close_unknown_document(self, pane):
+        """Closing a document not in the pane returns False."""
+        pane.add_new_document()
+        assert pane.close_document(Document()) is False
+    
+    def test_remove_document_keeps_cache_for_transfer(self, pane):
+        """remove_document (used for tab moves) keeps the cache."""
+        doc1 = pane.add_new_document()
+        pane.add_new_document()
+        cached = doc1.qt_document
+        pane.remove_document(doc1)
+        assert doc1.qt_document is cached
+
+
 class TestEditorPaneTextChanges:
     """Tests for text change handling."""
     
@@ -1015,3 +1121,27 @@ class TestSplitContainerMergeSwap:
         
         assert pane1_before != pane1_after
         assert pane2_before != pane2_after
+    
+    def test_swap_panes_restores_updates(self, container):
+        """swap_panes reorders the splitter and re-enables its repaints."""
+        container.add_new_document()
+        doc2 = container.add_new_document()
+        container.create_split(doc2, "right")
+        left, right = container._panes
+        
+        container.swap_panes()
+        
+        assert container._splitter.widget(0) is right
+        assert container._splitter.widget(1) is left
+        assert container._splitter.updatesEnabled()
+    
+    def test_merge_panes_restores_updates(self, container):
+        """merge_panes re-enables splitter repaints once merged."""
+        container.add_new_document()
+        doc2 = container.add_new_document()
+        container.create_split(doc2, "right")
+        
+        container.merge_panes()
+        
+        assert container.is_split is False
+        assert container._splitter.updatesEnabled()
@@ -91,6 +91,20 @@ class TestThemeManager:
         """Can apply midnight blue theme."""
         theme_manager.apply_theme(Theme.MIDNIGHT_BLUE)
         assert theme_manager.current_theme == Theme.MIDNIGHT_BLUE
+    
+    def test_builtin_stylesheet_generated_once(self, theme_manager, qapp):
+        """Re-applying a built-in theme reuses its generated stylesheet."""
+        import editor.theme_manager as tm
+        tm._generate_stylesheet.cache_clear()
+        
+        theme_manager.apply_theme(Theme.LIGHT)
+        theme_manager.apply_theme(Theme.DARK)
+        theme_manager.apply_theme(Theme.LIGHT)
+        
+        info = tm._generate_stylesheet.cache_info()
+        assert (info.misses, info.hits) == (2, 1)
+        assert qapp.styleSheet() == tm.generate_stylesheet_from_colors(
+            tm.BUILTIN_THEME_COLORS["Light"])
 
 
 class TestStylesheets:
@@ -316,6 +330,22 @@ class TestLoadSettingsErrorHandling:
         # Valid theme should load, invalid should be skipped
         assert "Valid" in custom_names
     
+    def test_load_custom_themes_interns_color_strings(self, tmp_path, monkeypatch):
+        """Colors shared between custom themes load as one string object."""
+        monkeypatch.setenv("HOME", str(tmp_path))
+        themes_dir = tmp_path / ".textedit" / "themes"
+        themes_dir.mkdir(parents=True, exist_ok=True)
+        for name in ("One", "Two"):
+            theme = {"name": name, "colors": {"bg": "#1e1e1e", "size": 3}}
+            (themes_dir / f"{name}.json").write_text(json.dumps(theme))
+        
+        ThemeManager._instance = None
+        manager = ThemeManager()
+        one = manager._custom_themes["One"]
+        two = manager._custom_themes["Two"]
+        assert one["bg"] is two["bg"]
+        assert one["size"] == 3
+    
     def test_save_settings_io_error_handling(self, theme_manager, monkeypatch):
         """_save_settings handles IOError gracefully."""
         def failing_open(*args, **kwargs):